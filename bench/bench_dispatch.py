@@ -0,0 +1,72 @@
+"""
+Dispatch benchmark: synthetic commands pushed through
+Receiver.receive into synchronous Scheduler with no-op
+handler, and Selector.select alone, cached vs resolved
+on each call.
+
+    python bench/bench_dispatch.py [commands]
+"""
+import os
+import sys
+import time
+import dataclasses
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core import channels  # noqa: E402
+from core import exchange  # noqa: E402
+from core import messages  # noqa: E402
+
+
+@dataclasses.dataclass
+class Ping(messages.Command):
+    name: str
+
+
+class NoopHandler:
+
+    def handle(self, cmd: Ping) -> None:
+        pass
+
+    def fetch_events(self) -> list:
+        return []
+
+
+class UncachedSelector(exchange.Selector):
+    """Selector, that resolves message class on each call."""
+
+    def select(self, event: object) -> tuple:
+        return self._resolve(type(event))
+
+
+def make_receiver(selector: exchange.Selector) -> exchange.Receiver:
+    selector.set_channels({messages.Command: channels.Channel()})
+    selector.set_handlers({'Ping': [NoopHandler()]})
+    exch = exchange.Exchange()
+    return exchange.Receiver(exchange.Scheduler(selector, exch), exch)
+
+
+def timed(label: str, func: callable, count: int) -> None:
+    start = time.perf_counter()
+    func()
+    spent = time.perf_counter() - start
+    print(f'{label:<16} {spent:.3f}s {spent / count * 1e9:>7.0f} ns/cmd')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    cmd = Ping('ping')
+    for label, selector in (
+            ('cached', exchange.Selector()),
+            ('uncached', UncachedSelector()),
+            ):
+        receive = make_receiver(selector).receive
+        select = selector.select
+        timed(f'select {label}', lambda: [select(cmd) for _ in range(count)],
+              count)
+        timed(f'receive {label}', lambda: [receive(cmd) for _ in range(count)],
+              count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+ExcelFileReader streaming benchmark: rows/s and peak RSS
+of full book, read only and values only reading.
+Every variant is run in own process to measure peak RSS.
+
+    python bench/bench_excel_stream.py [rows] [path.xlsx]
+"""
+import os
+import sys
+import time
+import resource
+import tempfile
+import subprocess
+
+import openpyxl
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services import services  # noqa: E402
+from template.io_presets import ReadSettings  # noqa: E402
+
+
+HEADERS = ('POL', 'POD', 'RATE', 'CARRIER', 'DTHC', 'NOTE')
+ROW = ('Shanghai', 'Vladivostok', 2600, 'HEUNG-A', 450, 'valid Dec')
+VARIANTS = {
+        'full book': (False, False),
+        'read only': (True, False),
+        'values only': (True, True),
+        }
+
+
+def make_workbook(path: str, rows: int) -> None:
+    book = openpyxl.Workbook(write_only=True)
+    sheet = book.create_sheet('rates')
+    sheet.append(HEADERS)
+    for _ in range(rows):
+        sheet.append(ROW)
+    book.save(path)
+
+
+def run_variant(name: str, path: str) -> None:
+    read_only, values_only = VARIANTS[name]
+    reader = services.ExcelFileReader(values_only=values_only)
+    read_set = ReadSettings('rates', path, read_only, '--m', '.xlsx')
+    start = time.perf_counter()
+    rows = sum(1 for _ in reader.read(read_set))
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f'{name:<12} {elapsed:7.2f}s {rows / elapsed:>10,.0f} rows/s '
+          f'peak RSS: {peak:,.0f} MB')
+
+
+def main() -> None:
+    if sys.argv[1:2] == ['--variant']:
+        return run_variant(sys.argv[2], sys.argv[3])
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = sys.argv[2] if len(sys.argv) > 2 else None
+        if path is None:
+            path = os.path.join(directory, 'rates.xlsx')
+            make_workbook(path, rows)
+        size = os.path.getsize(path) / 2 ** 20
+        print(f'rows: {rows}, file: {size:.1f} MB')
+        for name in VARIANTS:
+            subprocess.run(
+                    [sys.executable, __file__, '--variant', name, path],
+                    check=True
+                    )
+
+
+if __name__ == '__main__':
+    main()
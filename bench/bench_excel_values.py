@@ -0,0 +1,82 @@
+"""
+ExcelFileReader benchmark: rows of cells vs values_only rows.
+
+    python bench/bench_excel_values.py [rows]
+"""
+import os
+import sys
+import time
+import logging
+import tempfile
+
+import openpyxl
+
+from bench_load_many import FLAG, make_adapter
+from services import drivers
+from services import services
+from core import terminal_commands as tc
+from template.io_presets import ReadSettings
+
+
+HEADERS = ('POL', 'POD', 'RATE', 'CARRIER', 'DTHC', 'NOTE')
+ROW = ('Shanghai', 'Vladivostok', 2600, 'HEUNG-A', 450, 'valid Dec')
+
+
+def make_workbook(directory: str, rows: int) -> str:
+    path = os.path.join(directory, 'rates.xlsx')
+    # not write_only: sheet has dimension like in supplier files.
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = 'rates'
+    sheet.append(HEADERS)
+    for _ in range(rows):
+        sheet.append(ROW)
+    book.save(path)
+    return path
+
+
+def register_readers() -> None:
+    logger = logging.getLogger('bench')
+    logger.disabled = True
+    readers = tc.get_readers_repo()
+    readers.add('.xlsx', (
+        drivers.ExcelDriver(logger, drivers.ExcelCompiler()),
+        services.ExcelFileReader()
+        ))
+    readers.add('.xlsx', (
+        drivers.ExcelDriver(logger, drivers.ExcelValuesCompiler()),
+        services.ExcelFileReader(values_only=True)
+        ), mode=tc.LoadMode.VALUES)
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    adapter = make_adapter()
+    register_readers()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = make_workbook(directory, rows)
+        print(f'rows: {rows}')
+        base = None
+        for label, read_only, mode in (
+                ('cells, full book', False, tc.LoadMode.DEFAULT),
+                ('cells, read only', True, tc.LoadMode.DEFAULT),
+                ('values only', False, tc.LoadMode.VALUES)
+                ):
+            read_set = ReadSettings(
+                    name='rates',
+                    path=path,
+                    mode=read_only,
+                    flag=FLAG,
+                    suffix='.xlsx',
+                    load_mode=mode
+                    )
+            start = time.perf_counter()
+            model = adapter.load(read_set)
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            print(f'{label:<18} {elapsed:.3f}s, '
+                  f'rows: {model.rows_count} (x{base / elapsed:.2f})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+ExcelFileWriter benchmark: new sheet is saved into existing
+book with several sheets. Full book reload (as writer did
+before) vs write-only sheet, added on zip level.
+
+    python bench/bench_excel_writer.py [rows] [sheets]
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+import openpyxl
+
+from bench_excel_values import HEADERS, ROW
+from services import services
+from template.io_presets import WriteSettings
+
+
+def make_book(directory: str, rows: int, sheets: int) -> str:
+    path = os.path.join(directory, 'rates.xlsx')
+    book = openpyxl.Workbook(write_only=True)
+    for idx in range(sheets):
+        sheet = book.create_sheet(f'rates_{idx}')
+        sheet.append(HEADERS)
+        for _ in range(rows):
+            sheet.append(ROW)
+    book.save(path)
+    return path
+
+
+def save_by_reload(settings: WriteSettings, rows: int) -> None:
+    book = openpyxl.load_workbook(filename=settings.path)
+    sheet = book.create_sheet(settings.name)
+    sheet.append(list(HEADERS))
+    for _ in range(rows):
+        sheet.append(list(ROW))
+    book.save(settings.path)
+
+
+def save_by_writer(settings: WriteSettings, rows: int) -> None:
+    writer = services.ExcelFileWriter()
+    dest = writer.write(settings)
+    dest.send(list(HEADERS))
+    for _ in range(rows):
+        dest.send(list(ROW))
+    dest.throw(StopIteration)
+    dest.close()
+    writer.close()
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    sheets = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = make_book(directory, rows, sheets)
+        print(f'rows: {rows}, existing sheets: {sheets}')
+        base = None
+        for label, save in (
+                ('full book reload', save_by_reload),
+                ('write only + zip', save_by_writer),
+                ):
+            path = os.path.join(directory, 'dest.xlsx')
+            shutil.copy(source, path)
+            settings = WriteSettings(
+                    name='new', path=path, mode=False, suffix='.xlsx'
+                    )
+            start = time.perf_counter()
+            save(settings, rows)
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            book = openpyxl.load_workbook(path, read_only=True)
+            assert book.sheetnames[-1] == 'new', 'sheet was not added'
+            book.close()
+            print(f'{label:<18} {elapsed:.3f}s (x{base / elapsed:.2f})')
+
+
+if __name__ == '__main__':
+    main()
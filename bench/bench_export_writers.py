@@ -0,0 +1,52 @@
+"""
+Export writers benchmark: one model saved to .xlsx, .csv and .rtc.
+
+    python bench/bench_export_writers.py [rows]
+"""
+import os
+import sys
+import time
+import logging
+import tempfile
+
+from bench_load_many import FLAG, make_adapter, make_files
+from core import terminal_commands as tc
+from services import columnar
+from services import drivers
+from services import services
+from template.io_presets import ReadSettings, WriteSettings
+
+
+def register_writers() -> None:
+    logger = logging.getLogger('bench')
+    logger.disabled = True
+    driver = drivers.ExcelSaveDriver(logger)
+    writers = tc.get_writers_repo()
+    writers.add('.xlsx', (driver, services.ExcelFileWriter()))
+    writers.add('.csv', (driver, services.CsvFileWriter()))
+    writers.add('.rtc', (driver, columnar.RtcFileWriter()))
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    adapter = make_adapter()
+    register_writers()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path, = make_files(directory, 1, lines)
+        model = adapter.load(ReadSettings('rates', path, False, FLAG, '.txt'))
+        print(f'rows: {model.rows_count}')
+        base = None
+        for suffix in ('.xlsx', '.csv', '.rtc'):
+            dest = os.path.join(directory, f'rates{suffix}')
+            start = time.perf_counter()
+            adapter.save(model, WriteSettings('rates', dest, False, suffix))
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            size = os.path.getsize(dest) / 2 ** 20
+            print(f'{suffix:<6} {elapsed:.3f}s, {size:.1f} MB '
+                  f'(x{base / elapsed:.2f})')
+
+
+if __name__ == '__main__':
+    main()
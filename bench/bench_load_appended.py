@@ -0,0 +1,39 @@
+"""
+Appended lines benchmark: full reload of grown .txt file
+vs parsing of appended tail into loaded model.
+
+    python bench/bench_load_appended.py [rows] [appended]
+"""
+import sys
+import time
+import tempfile
+
+from bench_load_many import FLAG, LINES, make_adapter, make_files
+from template.io_presets import ReadSettings
+
+
+def timed(label: str, func: callable, *args) -> object:
+    start = time.perf_counter()
+    result = func(*args)
+    print(f'{label:<14} {time.perf_counter() - start:.3f}s')
+    return result
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    appended = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    adapter = make_adapter()
+    with tempfile.TemporaryDirectory() as directory:
+        path, = make_files(directory, 1, lines)
+        read_set = ReadSettings('rates', path, False, FLAG, '.txt')
+        model = timed('first load', adapter.load, read_set)
+        with open(path, 'a') as file:
+            file.writelines(LINES[i % len(LINES)] for i in range(appended))
+        reloaded = timed('full reload', adapter.load, read_set)
+        timed('tail parse', adapter.load_appended, read_set, model)
+        assert list(model.rows) == list(reloaded.rows), 'models differ'
+        print(f'rows: {model.rows_count}')
+
+
+if __name__ == '__main__':
+    main()
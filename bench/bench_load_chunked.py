@@ -0,0 +1,56 @@
+"""
+BaseFileIOAdapter.load_chunked benchmark:
+one big .txt file, serial load vs chunked parallel load.
+
+    python bench/bench_load_chunked.py [lines] [chunk_mb]
+"""
+import os
+import sys
+import time
+import tempfile
+
+from bench_load_many import FLAG, make_adapter, make_files
+from template.io_presets import ReadSettings
+
+
+def run(load, read_set, **kwargs) -> tuple:
+    start = time.perf_counter()
+    model = load(read_set, **kwargs)
+    return time.perf_counter() - start, model.rows_count
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    chunk_mb = float(sys.argv[2]) if len(sys.argv) > 2 else 8
+    chunk_size = int(chunk_mb * 2 ** 20)
+    adapter = make_adapter()
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path, = make_files(directory, 1, lines)
+        read_set = ReadSettings(
+                name='big',
+                path=path,
+                mode=False,
+                flag=FLAG,
+                suffix='.txt'
+                )
+        size = os.path.getsize(path) / 2 ** 20
+        print(f'lines: {lines}, file: {size:.1f} MB, '
+              f'chunk: {chunk_mb} MB, cores: {cores}')
+        base, rows = run(adapter.load, read_set)
+        print(f'load:              {base:.3f}s, rows: {rows}')
+        for workers in counts:
+            elapsed, rows = run(
+                    adapter.load_chunked,
+                    read_set,
+                    workers=workers,
+                    chunk_size=chunk_size
+                    )
+            print(f'chunked {workers:>2} workers: {elapsed:.3f}s, '
+                  f'rows: {rows} (x{base / elapsed:.2f})')
+
+
+if __name__ == '__main__':
+    main()
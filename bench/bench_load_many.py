@@ -0,0 +1,111 @@
+"""
+BaseFileIOAdapter.load_many benchmark:
+loading of many .txt files with different workers count.
+
+    python bench/bench_load_many.py [files] [lines]
+"""
+import os
+import sys
+import time
+import logging
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services import drivers  # noqa: E402
+from services import services  # noqa: E402
+from core import terminal_commands as tc  # noqa: E402
+from core.settings import settings  # noqa: E402
+from template import tmp_models  # noqa: E402
+from template.io_presets import ReadSettings  # noqa: E402
+
+
+FLAG = '--b'
+HEADERS_KEY = 'BENCH_HEADERS'
+CONFIG = {
+        HEADERS_KEY: 'POL, POD, RATE, CARRIER, DTHC',
+        'RE_POL': r'^(?P<pol>[A-Za-z ]+)-.+$',
+        'RE_POD': r'^[A-Za-z ]+-(?P<pod>[A-Za-z ]+)\s.+$',
+        'RE_RATE': r'^.+\$(?P<rate>[\d]+)\s.+$',
+        'RE_CARRIER': r'^.+by\s(?P<carrier>[\w-]+)\s.+$',
+        'RE_DTHC': r'^.+DTHC\s?\$(?P<dthc>[\d]+).*$',
+        }
+HEADER = 'POL-POD $RATE by CARRIER DTHC $DTHC\n'
+LINES = (
+        'Shanghai-Vladivostok $2600 by HEUNG-A Excl DTHC $450\n',
+        'Tianjin-Vladivostok $3100 by huaxin Excluded DTHC$250\n',
+        )
+
+
+def make_adapter(**kwargs) -> services.BaseFileIOAdapter:
+    headers = settings._fetch_env_value(HEADERS_KEY, CONFIG)
+    keys = [k for k in CONFIG if k.startswith('RE')]
+    builder = settings.pattern()
+    builder.build_from(HEADERS_KEY, keys, headers, CONFIG)
+
+    logger = logging.getLogger('bench')
+    logger.disabled = True
+    readers = tc.get_readers_repo()
+    readers.add('.txt', (
+        drivers.TxtDriver(logger, drivers.TxtCompiler()),
+        services.TxtFileReader()
+        ))
+    flags = tc.flags()
+    flags.add(FLAG, builder.get(HEADERS_KEY))
+    return services.BaseFileIOAdapter(
+            drivers.LoadConfigurator(readers, flags),
+            drivers.DumpConfigurator(tc.get_writers_repo()),
+            tmp_models.SheetTemplate(),
+            **kwargs
+            )
+
+
+def make_files(directory: str, files: int, lines: int) -> list:
+    body = ''.join(LINES[i % len(LINES)] for i in range(lines))
+    paths = []
+    for idx in range(files):
+        path = os.path.join(directory, f'supplier_{idx}.txt')
+        with open(path, 'w') as file:
+            file.write(HEADER)
+            file.write(body)
+        paths.append(path)
+    return paths
+
+
+def run(adapter, read_sets, workers: int) -> float:
+    start = time.perf_counter()
+    results = list(adapter.load_many(read_sets, workers=workers))
+    elapsed = time.perf_counter() - start
+    assert all(r.model is not None for r in results), 'loading failed'
+    return elapsed
+
+
+def main() -> None:
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    adapter = make_adapter()
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        read_sets = [
+                ReadSettings(
+                    name=os.path.basename(path),
+                    path=path,
+                    mode=False,
+                    flag=FLAG,
+                    suffix='.txt'
+                    )
+                for path in make_files(directory, files, lines)
+                ]
+        print(f'files: {files}, lines per file: {lines}, cores: {cores}')
+        base = None
+        for workers in counts:
+            elapsed = run(adapter, read_sets, workers)
+            base = base or elapsed
+            print(f'workers {workers:>2}: {elapsed:.3f}s '
+                  f'(x{base / elapsed:.2f})')
+
+
+if __name__ == '__main__':
+    main()
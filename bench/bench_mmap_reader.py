@@ -0,0 +1,80 @@
+"""
+MmapTxtFileReader benchmark: text mode reader vs mmap
+reader with prefilter on file with blank and comment lines.
+
+    python bench/bench_mmap_reader.py [lines] [noise_per_line]
+"""
+import os
+import sys
+import time
+import tempfile
+
+from bench_load_many import FLAG, HEADER, LINES, make_adapter
+from services import services
+from core import terminal_commands as tc
+from template.io_presets import ReadSettings
+
+
+NOISE = ('\n', '# updated by sales team\n', '----------------\n')
+
+
+def make_file(directory: str, lines: int, noise: int) -> str:
+    path = os.path.join(directory, 'dump.txt')
+    with open(path, 'w') as file:
+        file.write(HEADER)
+        for idx in range(lines):
+            file.write(LINES[idx % len(LINES)])
+            for jdx in range(noise):
+                file.write(NOISE[jdx % len(NOISE)])
+    return path
+
+
+def run(func, *args, **kwargs) -> tuple:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    noise = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    adapter = make_adapter()
+    txt_driver, _ = tc.get_readers_repo().get_pattern('.txt')
+    tc.get_readers_repo().add(
+            '.txt',
+            (txt_driver, services.MmapTxtFileReader()),
+            mode=tc.LoadMode.MMAP
+            )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = make_file(directory, lines, noise)
+        size = os.path.getsize(path) / 2 ** 20
+        print(f'rate lines: {lines}, noise lines per rate: {noise}, '
+              f'file: {size:.1f} MB')
+        for name, reader in (
+                ('text reader', services.TxtFileReader()),
+                ('mmap reader', services.MmapTxtFileReader())
+                ):
+            elapsed, count = run(
+                    lambda: sum(1 for _ in reader.read(ReadSettings(
+                        name='dump', path=path, mode=False,
+                        flag=FLAG, suffix='.txt'
+                        )))
+                    )
+            print(f'{name}: {elapsed:.3f}s, lines: {count}')
+        for mode in (tc.LoadMode.DEFAULT, tc.LoadMode.MMAP):
+            read_set = ReadSettings(
+                    name='dump',
+                    path=path,
+                    mode=False,
+                    flag=FLAG,
+                    suffix='.txt',
+                    load_mode=mode
+                    )
+            elapsed, model = run(adapter.load, read_set)
+            print(f'load [{mode.value or "default"}]: {elapsed:.3f}s, '
+                  f'rows: {model.rows_count}')
+
+
+if __name__ == '__main__':
+    main()
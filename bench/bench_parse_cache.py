@@ -0,0 +1,44 @@
+"""
+Parse cache benchmark: first load of .txt file (parsing and
+snapshot writing) vs next loads of unchanged file.
+
+    python bench/bench_parse_cache.py [rows]
+"""
+import os
+import sys
+import time
+import tempfile
+
+from bench_load_many import FLAG, make_adapter, make_files
+from services import parse_cache as pc
+from template.io_presets import ReadSettings
+
+
+def timed(label: str, func: callable, *args) -> object:
+    start = time.perf_counter()
+    result = func(*args)
+    print(f'{label:<22} {time.perf_counter() - start:.3f}s')
+    return result
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path, = make_files(directory, 1, lines)
+        read_set = ReadSettings('rates', path, False, FLAG, '.txt')
+        for by_content in (False, True):
+            cache = pc.ParseCache(
+                    os.path.join(directory, f'cache_{by_content:d}'),
+                    by_content=by_content
+                    )
+            adapter = make_adapter(parse_cache=cache)
+            key = 'content' if by_content else 'mtime'
+            model = timed(f'parse ({key})', adapter.load, read_set)
+            cached = timed(f'cached ({key})', adapter.load, read_set)
+            assert cache.hits == 1, 'snapshot wasn`t used'
+            assert list(cached.rows) == list(model.rows), 'models differ'
+        print(f'rows: {model.rows_count}')
+
+
+if __name__ == '__main__':
+    main()
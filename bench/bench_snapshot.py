@@ -0,0 +1,65 @@
+"""
+Model snapshot benchmark: .txt parsing vs .rtc snapshot
+loading (and pickle, used by cache spill, for comparison).
+
+    python bench/bench_snapshot.py [rows]
+"""
+import os
+import sys
+import time
+import pickle
+import tempfile
+
+from bench_export_writers import register_writers
+from bench_load_many import FLAG, make_adapter, make_files
+from core import terminal_commands as tc
+from services import columnar
+from services import drivers
+from template.io_presets import ReadSettings, WriteSettings
+
+
+def timed(label: str, func: callable, *args) -> object:
+    start = time.perf_counter()
+    result = func(*args)
+    print(f'{label:<18} {time.perf_counter() - start:.3f}s')
+    return result
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    adapter = make_adapter()
+    register_writers()
+    tc.get_readers_repo().add('.rtc', (
+        drivers.SnapshotDriver(None),
+        columnar.RtcFileReader()
+        ))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path, = make_files(directory, 1, lines)
+        snapshot = os.path.join(directory, 'rates.rtc')
+        model = timed(
+                'parse .txt',
+                adapter.load,
+                ReadSettings('rates', path, False, FLAG, '.txt')
+                )
+        print(f'rows: {model.rows_count}')
+        timed(
+                'save .rtc',
+                adapter.save,
+                model,
+                WriteSettings('rates', snapshot, False, '.rtc')
+                )
+        data = timed('pickle.dumps', pickle.dumps, model, -1)
+        loaded = timed(
+                'load .rtc',
+                adapter.load,
+                ReadSettings('rates', snapshot, False, FLAG, '.rtc')
+                )
+        timed('pickle.loads', pickle.loads, data)
+        assert list(loaded.rows) == list(model.rows), 'models differ'
+        print(f'.rtc: {os.path.getsize(snapshot) / 2 ** 20:.1f} MB, '
+              f'pickle: {len(data) / 2 ** 20:.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
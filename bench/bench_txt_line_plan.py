@@ -0,0 +1,69 @@
+"""
+TxtDriver.fetch_values benchmark:
+single pass line plan vs per header loop.
+
+    python bench/bench_txt_line_plan.py [lines]
+"""
+import os
+import sys
+import time
+import logging
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from services import drivers  # noqa: E402
+from core.settings import settings  # noqa: E402
+
+
+HEADERS_KEY = 'BENCH_HEADERS'
+CONFIG = {
+        HEADERS_KEY: 'POL, POD, RATE, CARRIER, DTHC',
+        'RE_POL': r'^(?P<pol>[A-Za-z ]+)-.+$',
+        'RE_POD': r'^[A-Za-z ]+-(?P<pod>[A-Za-z ]+)\s.+$',
+        'RE_RATE': r'^.+\$(?P<rate>[\d/]+)\s.+$',
+        'RE_CARRIER': r'^.+by\s(?P<carrier>[\w-]+)\s.+$',
+        'RE_CARRIER_ALT': r'^.+via\s(?P<carrier>\w+)$',
+        'RE_DTHC': r'^.+DTHC\s?\$(?P<dthc>[\d/]+).*$',
+        }
+LINES = (
+        'Shanghai-Vladivostok $2600/4800/4800 by HEUNG-A Excl DTHC $450/550',
+        'Tianjin-Vladivostok $3100/5200/5200 by huaxin Excluded DTHC$250/300',
+        'Xiamen-Moscow $9500 via rail',
+        )
+
+
+def make_preset() -> dict:
+    headers = settings._fetch_env_value(HEADERS_KEY, CONFIG)
+    keys = [k for k in CONFIG if k.startswith('RE')]
+    builder = settings.pattern()
+    builder.build_from(HEADERS_KEY, keys, headers, CONFIG)
+    return builder.get(HEADERS_KEY)
+
+
+def run(fetch, lines) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        fetch(line)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lines = [LINES[i % len(LINES)] for i in range(count)]
+    logger = logging.getLogger('bench')
+    logger.disabled = True
+    driver = drivers.TxtDriver(logger, drivers.TxtCompiler())
+    driver.headers_preset = make_preset()
+
+    per_header = run(driver._fetch_values_by_headers, lines)
+    line_plan = run(driver.fetch_values, lines)
+    print(f'lines: {count}')
+    print(f'per header loop: {per_header:.3f}s '
+          f'({count / per_header:,.0f} lines/s)')
+    print(f'line plan:       {line_plan:.3f}s '
+          f'({count / line_plan:,.0f} lines/s)')
+    print(f'speedup:         x{per_header / line_plan:.2f}')
+
+
+if __name__ == '__main__':
+    main()
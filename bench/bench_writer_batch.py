@@ -0,0 +1,106 @@
+"""
+Writer protocol benchmark: rows sent one by one to write()
+generator vs all rows given by one write_rows() call.
+Counting writer shows protocol overhead only.
+
+    python bench/bench_writer_batch.py [rows]
+"""
+import os
+import sys
+import time
+import logging
+import tempfile
+
+from bench_load_many import FLAG, make_adapter, make_files
+from core.io_adapters import FileWriterInterface
+from services import drivers
+from services import services
+from template.io_presets import ReadSettings, WriteSettings
+
+
+class CountingWriter(FileWriterInterface):
+    """Writer, that only counts rows."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    @services._starter
+    def write(self, settings) -> None:
+        while True:
+            try:
+                line = yield
+                if isinstance(line, list):
+                    self.count += 1
+            except StopIteration:
+                pass
+
+    def write_rows(self, settings, rows) -> int:
+        for self.count, _ in enumerate(rows, 1):
+            pass
+        return self.count
+
+
+def save_by_line(model, settings, writer) -> None:
+    """BaseFileIOAdapter.save before write_rows()."""
+    dumper = drivers.DumpConfigurator(_Writers(writer))
+    dumper.setup(settings)
+    driver, dest = dumper.get_dump_sources()
+    for line in model.rows:
+        try:
+            dest.send(driver.read(line))
+        except drivers.DriverError:
+            pass
+    dest.throw(StopIteration)
+    dest.close()
+
+
+def save_by_rows(model, settings, writer) -> None:
+    adapter = services.BaseFileIOAdapter(
+            None, drivers.DumpConfigurator(_Writers(writer)), None
+            )
+    adapter.save(model, settings)
+
+
+class _Writers:
+
+    def __init__(self, writer) -> None:
+        logger = logging.getLogger('bench')
+        logger.disabled = True
+        self._pattern = (drivers.ExcelSaveDriver(logger), writer)
+
+    def get_pattern(self, suffix: str) -> tuple:
+        return self._pattern
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path, = make_files(directory, 1, lines)
+        model = make_adapter().load(
+                ReadSettings('rates', path, False, FLAG, '.txt')
+                )
+        dest = os.path.join(directory, 'rates.xlsx')
+        settings = WriteSettings('rates', dest, False, '.xlsx')
+        print(f'rows: {model.rows_count}')
+        for label, make_writer in (
+                ('counting writer', CountingWriter),
+                ('excel writer', services.ExcelFileWriter),
+                ):
+            base = None
+            for way, save in (
+                    ('send() per row', save_by_line),
+                    ('write_rows()', save_by_rows),
+                    ):
+                if os.path.exists(dest):
+                    os.remove(dest)
+                start = time.perf_counter()
+                save(model, settings, make_writer())
+                elapsed = time.perf_counter() - start
+                base = base or elapsed
+                print(f'{label:<16} {way:<15} {elapsed:.3f}s '
+                      f'(x{base / elapsed:.2f})')
+
+
+if __name__ == '__main__':
+    main()
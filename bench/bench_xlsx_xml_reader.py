@@ -0,0 +1,113 @@
+"""
+XlsxXmlReader benchmark: openpyxl readers vs direct xml
+streaming of sheet from zip. Strings are inline in workbook
+saved by openpyxl and shared in workbook written as xml
+(like in files exported from Excel).
+
+    python bench/bench_xlsx_xml_reader.py [rows]
+"""
+import os
+import sys
+import time
+import zipfile
+import tempfile
+
+from bench_excel_values import HEADERS, ROW, make_workbook
+from services import services
+from services import xlsx_reader
+from template.io_presets import ReadSettings
+
+
+READERS = (
+        ('openpyxl cells, read only', services.ExcelFileReader()),
+        ('openpyxl values only', services.ExcelFileReader(values_only=True)),
+        ('xml values', xlsx_reader.XlsxXmlReader()),
+        ('xml cells with comments',
+         xlsx_reader.XlsxXmlReader(need_comments=True)),
+        )
+_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_RELS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_DOC = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_TYPES = 'application/vnd.openxmlformats-officedocument.spreadsheetml'
+SHARED_PARTS = {
+        '[Content_Types].xml': (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'content-types"><Default Extension="rels" ContentType="'
+            'application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{_TYPES}'
+            '.sheet.main+xml"/><Override PartName="/xl/worksheets/sheet1.xml"'
+            f' ContentType="{_TYPES}.worksheet+xml"/><Override PartName="'
+            f'/xl/sharedStrings.xml" ContentType="{_TYPES}.sharedStrings+xml"'
+            '/></Types>'
+            ),
+        '_rels/.rels': (
+            f'<Relationships xmlns="{_RELS}"><Relationship Id="rId1" '
+            f'Type="{_DOC}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+            ),
+        'xl/workbook.xml': (
+            f'<workbook xmlns="{_MAIN}" xmlns:r="{_DOC}"><sheets><sheet '
+            'name="rates" sheetId="1" r:id="rId1"/></sheets></workbook>'
+            ),
+        'xl/_rels/workbook.xml.rels': (
+            f'<Relationships xmlns="{_RELS}"><Relationship Id="rId1" '
+            f'Type="{_DOC}/worksheet" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Type="{_DOC}/sharedStrings" '
+            'Target="sharedStrings.xml"/></Relationships>'
+            ),
+        }
+
+
+def make_shared_strings_workbook(directory: str, rows: int) -> str:
+    path = os.path.join(directory, 'shared.xlsx')
+    strings = {}
+
+    def cell(col: int, row: int, value) -> str:
+        ref = f'{chr(ord("A") + col)}{row}'
+        if isinstance(value, str):
+            idx = strings.setdefault(value, len(strings))
+            return f'<c r="{ref}" t="s"><v>{idx}</v></c>'
+        return f'<c r="{ref}"><v>{value}</v></c>'
+
+    lines = []
+    for idx, values in enumerate([HEADERS] + [ROW] * rows, 1):
+        cells = ''.join(cell(col, idx, v) for col, v in enumerate(values))
+        lines.append(f'<row r="{idx}">{cells}</row>')
+    sheet = f'<worksheet xmlns="{_MAIN}"><sheetData>' \
+            + ''.join(lines) + '</sheetData></worksheet>'
+    shared = ''.join(f'<si><t>{s}</t></si>' for s in strings)
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, data in SHARED_PARTS.items():
+            archive.writestr(name, data)
+        archive.writestr('xl/worksheets/sheet1.xml', sheet)
+        archive.writestr(
+                'xl/sharedStrings.xml',
+                f'<sst xmlns="{_MAIN}">{shared}</sst>'
+                )
+    return path
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as directory:
+        for label, path in (
+                ('inline strings', make_workbook(directory, rows)),
+                ('shared strings',
+                 make_shared_strings_workbook(directory, rows)),
+                ):
+            size = os.path.getsize(path) / 2 ** 20
+            print(f'rows: {rows}, {label}, file: {size:.1f} MB')
+            base = None
+            for name, reader in READERS:
+                read_set = ReadSettings('rates', path, True, '--m', '.xlsx')
+                start = time.perf_counter()
+                count = sum(1 for _ in reader.read(read_set))
+                elapsed = time.perf_counter() - start
+                base = base or elapsed
+                print(f'  {name:<26} {elapsed:6.2f}s {count / elapsed:>10,.0f}'
+                      f' rows/s (x{base / elapsed:.2f})')
+
+
+if __name__ == '__main__':
+    main()
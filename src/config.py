@@ -1,5 +1,7 @@
 import typing
 import types
+import logging
+import concurrent.futures as futures
 
 from core import core_utils as cu
 from core import command_filters as cmd_filters
@@ -7,16 +9,27 @@ from core import registrator
 from core import api_router
 from core import channels
 from core import Cache
+from core import exch
+from core import scheduler
+from core import async_scheduler
+from core import exchange
+from core import cache
+from core import timings
+from core import script_runner
 from core import messages as cm
 from core import terminal_commands as tc
 from core.settings import settings as cs
 from template import handlers as th
 from template import messages as tm
 from template import tmp_models
+from template import watcher as tw
 from view import handlers as vh
 from view import messages as vm
 import services.services as srv
 import services.drivers as drv
+import services.columnar as col
+import services.parse_cache as pc
+import services.xlsx_reader as xlr
 
 
 _LOG_FMT: str = '%(name)s %(asctime)s %(funcName)s %(lineno)s %(message)s'
@@ -38,6 +51,8 @@ log_settings = LogSettings()
 logger = cu.BaseLogger(log_settings)
 system_logger = logger.get_logger
 api_router.set_logger(system_logger)
+# event loop of async scheduler logs its setup in debug level.
+logging.getLogger('asyncio').setLevel(logging.WARNING)
 
 FILTERS: types.MappingProxyType = types.MappingProxyType(
         {
@@ -67,23 +82,75 @@ txt_driver = drv.TxtDriver(
         system_logger,
         txt_compiler
         )
+# values only excel reading: rows of values, not cells.
+xl_values_driver = drv.ExcelDriver(
+        system_logger,
+        drv.ExcelValuesCompiler()
+        )
+# xlsx xml reading: rows of values or light cells with comments.
+xl_xml_driver = drv.ExcelDriver(
+        system_logger,
+        drv.ExcelCompiler() if drv.NEED_COMMENTS else drv.ExcelValuesCompiler()
+        )
 xl_save_drv = drv.ExcelSaveDriver(system_logger)
+snapshot_driver = drv.SnapshotDriver(system_logger)
 
 
 # data parsing patterns configuration
 # load_config == OrderdDict
 
 load_config = cs.make_config(path=cs._make_dotenv_path())
+
+# cache limits and eviction policy (optional in .env)
+# evicted models are spilled to disk and restored on demand.
+cache_max_mb = cs.fetch_int_value(cs.CACHE_MAX_MB_KEY, load_config)
+spill_max_mb = cs.fetch_int_value(cs.CACHE_SPILL_MB_KEY, load_config)
+# models are spilled as .rtc bytes, spill files are never unpickled.
+spill_codec = col.RtcModelCodec(tmp_models.SheetTemplate)
+spill_store = cache.SpillStore(
+        directory=load_config.get(cs.CACHE_SPILL_DIR_KEY) or None,
+        max_bytes=spill_max_mb * 2 ** 20 if spill_max_mb else None,
+        dumps=spill_codec.dumps,
+        loads=spill_codec.loads
+        )
+Cache.configure(
+        max_size=cs.fetch_int_value(cs.CACHE_SIZE_KEY, load_config),
+        policy=load_config.get(cs.CACHE_POLICY_KEY),
+        max_bytes=cache_max_mb * 2 ** 20 if cache_max_mb else None,
+        spill=spill_store,
+        )
+
+
 readers = tc.get_readers_repo()
 writers = tc.get_writers_repo()
 flags = tc.flags()
 
 # readers subscribing
 readers.add('.xlsx', (basedriver, srv.ExcelFileReader()))
+readers.add(
+        '.xlsx',
+        (xl_values_driver, srv.ExcelFileReader(values_only=True)),
+        mode=tc.LoadMode.VALUES
+        )
+readers.add(
+        '.xlsx',
+        (xl_xml_driver, xlr.XlsxXmlReader(need_comments=drv.NEED_COMMENTS)),
+        mode=tc.LoadMode.XML
+        )
+# .rtc columns are decoded from tagged values only (no pickle),
+# broken or foreign files raise RtcFormatError.
+readers.add('.rtc', (snapshot_driver, col.RtcFileReader()))
 readers.add('.txt', (txt_driver, srv.TxtFileReader()))
+readers.add(
+        '.txt',
+        (txt_driver, srv.MmapTxtFileReader()),
+        mode=tc.LoadMode.MMAP
+        )
 
 # writers subscribing
 writers.add(".xlsx", (xl_save_drv, srv.ExcelFileWriter()))
+writers.add(".csv", (xl_save_drv, srv.CsvFileWriter()))
+writers.add(".rtc", (xl_save_drv, col.RtcFileWriter()))
 
 
 flags.add(
@@ -100,11 +167,36 @@ flags.add(
             load_config
             )
         )
+
+# parse results cache (optional in .env): parsed models are kept
+# as .rtc snapshots, keyed by file state and flag patterns.
+# PARSE_CACHE_HASH=1 - key by file content instead of mtime.
+parse_cache = None
+parse_cache_dir = load_config.get(cs.PARSE_CACHE_DIR_KEY)
+if parse_cache_dir:
+    parse_cache_mb = cs.fetch_int_value(cs.PARSE_CACHE_MB_KEY, load_config)
+    parse_cache = pc.ParseCache(
+            parse_cache_dir,
+            max_bytes=parse_cache_mb * 2 ** 20 if parse_cache_mb else None,
+            by_content=bool(
+                cs.fetch_int_value(cs.PARSE_CACHE_HASH_KEY, load_config)
+                ),
+            )
+    # snapshots of changed patterns will never be loaded again.
+    parse_cache.prune(
+            filter(None, map(flags.get_pattern, tc.CommandFlag))
+            )
+
 baseloader = drv.LoadConfigurator(readers, flags)
 basedumper = drv.DumpConfigurator(writers)
 # dummy - dumper
 sheet_model = tmp_models.SheetTemplate()
-repository = srv.BaseFileIOAdapter(baseloader, basedumper, sheet_model)
+repository = srv.BaseFileIOAdapter(
+        baseloader,
+        basedumper,
+        sheet_model,
+        parse_cache=parse_cache
+        )
 uow = srv.FileOperator(repository, system_logger)
 
 
@@ -112,11 +204,67 @@ uow = srv.FileOperator(repository, system_logger)
 registrator.register_channel(cm.Command, channels.Channel())
 
 
+# commands are handled in background event loop (CORE_ASYNC=0
+# in .env - terminal waits for each command).
+core_async = cs.fetch_int_value(cs.CORE_ASYNC_KEY, load_config) != 0
+# threads for handlers (python default by default), commands
+# of one model are run in order. Loads of other models overlap
+# (each thread sets up own drivers), saves run one by one. With
+# CORE_ASYNC=0 handlers are run in threads only if CORE_WORKERS
+# is set.
+core_workers = cs.fetch_int_value(cs.CORE_WORKERS_KEY, load_config)
+core_backend = exchange.OrderedExecutor(
+        futures.ThreadPoolExecutor(
+            max_workers=core_workers or None,
+            thread_name_prefix='job'
+            )
+        )
+async_scheduler.set_backend(core_backend)
+if core_workers and not core_async:
+    scheduler.set_backend(core_backend)
+# requests queue limits (unbounded by default): from HIGH depth
+# commands wait until queue is drained to LOW, up to TIMEOUT
+# seconds (forever by default, terminal thread is blocked).
+queue_limits = dict(
+        max_size=cs.fetch_int_value(cs.CORE_QUEUE_SIZE_KEY, load_config),
+        high_watermark=cs.fetch_int_value(cs.CORE_QUEUE_HIGH_KEY, load_config),
+        low_watermark=cs.fetch_int_value(cs.CORE_QUEUE_LOW_KEY, load_config),
+        )
+async_scheduler.set_limits(
+        **queue_limits,
+        put_timeout=cs.fetch_int_value(cs.CORE_QUEUE_TIMEOUT_KEY, load_config)
+        )
+# synchronous exchange is drained by the same thread, never waits.
+exch.set_limits(**queue_limits)
+
+
 # cmd hadlers setup
-load_excel_hnd = th.LoadExcelFileCmdHandler(uow, Cache)
+# processes count for loadmany and loadfile -p (cpu count by default)
+load_workers = cs.fetch_int_value(cs.LOAD_WORKERS_KEY, load_config)
+load_excel_hnd = th.LoadExcelFileCmdHandler(uow, Cache, workers=load_workers)
 show_model_prev_hnd = vh.ShowPreviewCmdHandler(uow, Cache)
-load_txt_hnd = th.LoadTxtFileCmdHandler(uow, Cache)
+load_txt_hnd = th.LoadTxtFileCmdHandler(uow, Cache, workers=load_workers)
 save_xl_file = th.SaveExcelFileCmdHandler(uow, Cache)
+show_cached_hnd = vh.ShowCachedCmdHandler(uow, Cache)
+convert_hnd = th.ConvertFileCmdHandler(uow, Cache)
+show_file_prev_hnd = vh.ShowFilePreviewCmdHandler(uow, Cache)
+load_many_hnd = th.LoadManyFilesCmdHandler(uow, Cache, workers=load_workers)
+# seconds between scans of watched files (2 by default)
+watchers = tw.Watchers()
+watch_hnd = th.WatchFilesCmdHandler(
+        uow,
+        Cache,
+        watchers,
+        interval=cs.fetch_int_value(cs.WATCH_INTERVAL_KEY, load_config),
+        backend=core_backend
+        )
+unwatch_hnd = th.UnwatchFilesCmdHandler(uow, watchers)
+set_timings_hnd = vh.SetTimingsCmdHandler(uow)
+show_jobs_hnd = vh.ShowJobsCmdHandler(
+        uow,
+        async_scheduler,
+        queues=(async_scheduler, exch)
+        )
 
 
 # cmd handlers subscribe on channels
@@ -124,6 +272,14 @@ registrator.register_handler(tm.LoadExcelFile, [load_excel_hnd, ])
 registrator.register_handler(vm.ShowModelPreview, [show_model_prev_hnd, ])
 registrator.register_handler(tm.LoadTxtFile, [load_txt_hnd, ])
 registrator.register_handler(tm.SaveExcelFile, [save_xl_file, ])
+registrator.register_handler(vm.ShowCachedModels, [show_cached_hnd, ])
+registrator.register_handler(tm.ConvertFile, [convert_hnd, ])
+registrator.register_handler(vm.ShowFilePreview, [show_file_prev_hnd, ])
+registrator.register_handler(tm.LoadManyFiles, [load_many_hnd, ])
+registrator.register_handler(tm.WatchFiles, [watch_hnd, ])
+registrator.register_handler(tm.UnwatchFiles, [unwatch_hnd, ])
+registrator.register_handler(vm.ShowJobs, [show_jobs_hnd, ])
+registrator.register_handler(vm.SetTimings, [set_timings_hnd, ])
 
 
 def on_startup() -> None:
@@ -138,10 +294,15 @@ def on_startup() -> None:
         except Exception as e:
             msg = f'Application bootstrap failed with err: {e}.'
             raise SystemConfigurationError(msg)
+    if core_async:
+        async_scheduler.start()
 
 
 def on_shutdown() -> None:
-    ...
+    watchers.stop()
+    async_scheduler.stop()
+    scheduler.join()
+    core_backend.shutdown()
 
 
 ValidationError = tc.ValidationError
@@ -156,5 +317,8 @@ __all__ = [
         'on_shutdown',
         'api_router',
         'registrator',
+        'async_scheduler',
+        'timings',
+        'script_runner',
         'ValidationError'
         ]
@@ -4,6 +4,7 @@ import types
 from . import domain_models
 from . import messages
 from . import exchange
+from . import async_exchange
 from . import cache
 from . import channels
 from . import handlers
@@ -16,6 +17,8 @@ from . import terminal_commands
 from . import io_adapters
 from . import sys_exceptions
 from . import sys_constants
+from . import timings
+from . import script_runner
 
 
 class BrokenCore(BaseException):
@@ -32,9 +35,15 @@ scheduler = exchange.Scheduler(
         selector,
         exch
         )
-receiver = exchange.Receiver(
-        scheduler,
-        exch
+# messages are handled by async_scheduler, when it`s started,
+# and synchronously otherwise.
+async_scheduler = async_exchange.AsyncScheduler(selector)
+receiver = async_exchange.AsyncReceiver(
+        async_scheduler,
+        exchange.Receiver(
+            scheduler,
+            exch
+            )
         )
 
 
@@ -130,6 +139,9 @@ __all__ = [
         'domain_models',
         'messages',
         'receiver',
+        'exch',
+        'scheduler',
+        'async_scheduler',
         'Cache',
         'setup_exchange',
         'handlers',
@@ -144,4 +156,6 @@ __all__ = [
         'io_adapters',
         'sys_exceptions',
         'sys_constants',
+        'timings',
+        'script_runner',
         ]
@@ -0,0 +1,380 @@
+"""
+Asyncio variant of Exchange and Scheduler. Event loop runs in
+background thread, each message is handled as task: blocking
+handlers are run in executor, so terminal keeps accepting
+commands while files are parsed. Jobs of messages are kept
+for status command.
+"""
+import sys
+import time
+import enum
+import typing
+import asyncio
+import threading
+import collections
+import dataclasses
+import concurrent.futures as futures
+
+from .exchange import Selector
+from .exchange import SelectorError
+from .exchange import ExchangeError
+from .exchange import SchedulerError
+from .exchange import OrderedExecutor
+from .exchange import Backpressure
+from .exchange import QueueMetrics
+from .exchange import QueueStats
+from .exchange import message_key
+from .exchange import run_handlers
+
+
+# finished jobs kept for status command.
+JOBS_HISTORY: int = 32
+# seconds to wait for loop thread start.
+LOOP_START_TIMEOUT: float = 5.0
+
+
+class JobState(str, enum.Enum):
+    QUEUED: str = 'queued'
+    RUNNING: str = 'running'
+    DONE: str = 'done'
+    FAILED: str = 'failed'
+
+
+@dataclasses.dataclass
+class Job:
+    id: int
+    name: str
+    command: str
+    state: JobState = JobState.QUEUED
+    created: float = dataclasses.field(default_factory=time.monotonic)
+    started: typing.Optional[float] = None
+    finished: typing.Optional[float] = None
+    error: str = ''
+
+    @property
+    def in_flight(self) -> bool:
+        return self.state in (JobState.QUEUED, JobState.RUNNING)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds of running (of waiting, if job is queued)."""
+        start = self.started or self.created
+        return (self.finished or time.monotonic()) - start
+
+
+def describe(msg: typing.Any) -> str:
+    """Short text of command: name, path and model name."""
+    parts = (getattr(msg, key, '') for key in ('name', 'path', 'fname'))
+    return ' '.join(str(part) for part in parts if part)
+
+
+class AsyncExchange:
+    """
+    Messages queue with watermarks, used from loop thread
+    only. Fetched message takes place in queue until done()
+    is called, so limits bound messages in flight: loop
+    fetches at once. put() waits for place up to timeout.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_size: typing.Optional[int] = None,
+            high_watermark: typing.Optional[int] = None,
+            low_watermark: typing.Optional[int] = None,
+            metrics: typing.Optional[QueueMetrics] = None
+            ) -> None:
+        if max_size is not None:
+            high_watermark = min(high_watermark or max_size, max_size)
+        self._queue = collections.deque()
+        self._active = 0
+        self._changed = asyncio.Condition()
+        self._pressure = Backpressure(high_watermark, low_watermark)
+        self.metrics = metrics or QueueMetrics()
+
+    def __len__(self) -> int:
+        return len(self._queue) + self._active
+
+    def stats(self, name: str) -> QueueStats:
+        return QueueStats(
+                name,
+                len(self),
+                self._pressure.high,
+                self._pressure.low,
+                self._pressure.throttled,
+                dataclasses.replace(self.metrics)
+                )
+
+    def _can_put(self) -> bool:
+        return self._pressure.can_put(len(self))
+
+    async def put(
+            self,
+            item: typing.Any,
+            timeout: typing.Optional[float] = 0.0
+            ) -> None:
+        """Put item, timeout 0 - don`t wait, None - wait forever."""
+        started = time.monotonic()
+        async with self._changed:
+            waited = None
+            if not self._can_put():
+                try:
+                    if timeout == 0:
+                        raise asyncio.TimeoutError
+                    await asyncio.wait_for(
+                            self._changed.wait_for(self._can_put),
+                            timeout
+                            )
+                except asyncio.TimeoutError:
+                    self.metrics.rejected += 1
+                    raise ExchangeError('Requests queue overflow.')
+                waited = time.monotonic() - started
+            self._queue.append(item)
+            self._pressure.update(len(self))
+            self.metrics.add_put(len(self), waited)
+            self._changed.notify_all()
+
+    async def fetch(self) -> typing.Any:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._queue)
+            self._active += 1
+            return self._queue.popleft()
+
+    async def done(self) -> None:
+        """Fetched message is handled, its place is free."""
+        async with self._changed:
+            self._active -= 1
+            self._pressure.update(len(self))
+            self._changed.notify_all()
+
+
+class AsyncScheduler:
+    """
+    Run handlers of messages as tasks of event loop in
+    background thread. Handlers with blocking = False are
+    called in loop, other handlers are run in backend:
+    commands of one model are run in order.
+    """
+
+    def __init__(
+            self,
+            selector: Selector,
+            *,
+            max_size: typing.Optional[int] = None,
+            backend: typing.Optional[OrderedExecutor] = None,
+            history: int = JOBS_HISTORY
+            ) -> None:
+        self._selector = selector
+        self._backend = backend
+        self._metrics = QueueMetrics()
+        self.set_limits(max_size=max_size)
+        self._last_id = 0
+        self._lock = threading.Lock()
+        self._jobs: typing.Dict[int, Job] = {}
+        self._finished = collections.deque(maxlen=history)
+        self._idle = threading.Condition(self._lock)
+        self._loop = None
+        self._thread = None
+        self._tasks = set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def last_id(self) -> int:
+        """Id of last created job, 0 if there are no jobs."""
+        with self._lock:
+            return self._last_id
+
+    def set_backend(self, backend: OrderedExecutor) -> None:
+        self._backend = backend
+
+    def set_history(self, history: typing.Optional[int]) -> None:
+        """Count of kept finished jobs, None - keep all."""
+        with self._lock:
+            self._finished = collections.deque(self._finished, history)
+
+    def set_limits(
+            self,
+            *,
+            max_size: typing.Optional[int] = None,
+            high_watermark: typing.Optional[int] = None,
+            low_watermark: typing.Optional[int] = None,
+            put_timeout: typing.Optional[float] = None
+            ) -> None:
+        """
+        Queue limits, applied on start. submit() waits for
+        free space up to put_timeout seconds (forever - None).
+        """
+        self._limits = dict(
+                max_size=max_size,
+                high_watermark=high_watermark,
+                low_watermark=low_watermark
+                )
+        self._put_timeout = put_timeout
+        self._exchange = AsyncExchange(**self._limits, metrics=self._metrics)
+
+    def stats(self, name: str = 'async') -> QueueStats:
+        return self._exchange.stats(name)
+
+    def start(self) -> None:
+        if self.running:
+            return None
+        if self._backend is None:
+            self._backend = OrderedExecutor(
+                    futures.ThreadPoolExecutor(thread_name_prefix='job')
+                    )
+        # conditions of exchange are bound to loop.
+        self._exchange = AsyncExchange(**self._limits, metrics=self._metrics)
+        ready = threading.Event()
+        self._thread = threading.Thread(
+                target=self._run_loop,
+                args=(ready,),
+                name='scheduler',
+                daemon=True
+                )
+        self._thread.start()
+        if not ready.wait(LOOP_START_TIMEOUT):
+            raise SchedulerError('Event loop wasn`t started.')
+
+    def stop(self, timeout: typing.Optional[float] = None) -> bool:
+        """Wait for jobs in flight and stop loop."""
+        if not self.running:
+            return True
+        finished = self.join(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        return finished
+
+    def join(self, timeout: typing.Optional[float] = None) -> bool:
+        """Wait until no jobs in flight, False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._jobs, timeout)
+
+    def jobs(self) -> typing.List[Job]:
+        """Copies of finished (last ones) and in flight jobs."""
+        with self._lock:
+            jobs = [*self._finished, *self._jobs.values()]
+            jobs.sort(key=lambda job: job.id)
+            return [dataclasses.replace(job) for job in jobs]
+
+    def submit(self, msg: typing.Any) -> Job:
+        """Queue message from any thread, return its job."""
+        if not self.running:
+            raise SchedulerError('Scheduler isn`t started.')
+        job = self._new_job(msg)
+        put = asyncio.run_coroutine_threadsafe(self._put(job, msg), self._loop)
+        try:
+            put.result()
+        except ExchangeError:
+            self._finish(job, JobState.FAILED, 'Requests queue overflow.')
+            raise
+        return job
+
+    def _new_job(self, msg: typing.Any) -> Job:
+        with self._lock:
+            self._last_id += 1
+            job = Job(self._last_id, type(msg).__name__, describe(msg))
+            self._jobs[job.id] = job
+            return job
+
+    def _finish(self, job: Job, state: JobState, error: str = '') -> None:
+        with self._idle:
+            job.state = state
+            job.error = error
+            job.finished = time.monotonic()
+            self._finished.append(self._jobs.pop(job.id))
+            self._idle.notify_all()
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        consumer = self._loop.create_task(self._consume())
+        self._loop.call_soon(ready.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            consumer.cancel()
+            pending = [consumer, *self._tasks]
+            self._loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                    )
+            self._loop.close()
+
+    async def _put(self, job: Job, msg: typing.Any) -> None:
+        await self._exchange.put((job, msg), self._put_timeout)
+
+    async def _consume(self) -> None:
+        while True:
+            job, msg = await self._exchange.fetch()
+            task = asyncio.create_task(self._handle(job, msg))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _handle(self, job: Job, msg: typing.Any) -> None:
+        with self._lock:
+            job.state = JobState.RUNNING
+            job.started = time.monotonic()
+        error = ''
+        try:
+            _, handlers = self._selector.select(msg)
+            events = await self._call(handlers, msg)
+        except SelectorError as e:
+            error = f'{e.__class__.__name__} {e}'
+        except Exception as e:
+            error = f'{e}'
+        finally:
+            await self._exchange.done()
+        if error:
+            self._fail(job, error)
+            return None
+        # results of handlers are handled like new messages.
+        for event in events:
+            await self._enqueue(event)
+        self._finish(job, JobState.DONE)
+
+    async def _enqueue(self, msg: typing.Any) -> None:
+        """Queue event of handler, loop never waits for space."""
+        job = self._new_job(msg)
+        try:
+            await self._exchange.put((job, msg))
+        except ExchangeError as e:
+            self._metrics.dropped += 1
+            self._finish(job, JobState.FAILED, f'{e}')
+
+    def _fail(self, job: Job, error: str) -> None:
+        print(f'[{job.id}] {job.command} failed: {error}', file=sys.stderr)
+        self._finish(job, JobState.FAILED, error)
+
+    async def _call(self, handlers: list, msg: typing.Any) -> list:
+        if not any(getattr(h, 'blocking', True) for h in handlers):
+            return run_handlers(handlers, msg)
+        task = self._backend.submit(
+                message_key(msg),
+                run_handlers,
+                handlers,
+                msg
+                )
+        return await asyncio.wrap_future(task)
+
+
+class AsyncReceiver:
+    """
+    Send messages to started AsyncScheduler, or to
+    synchronous receiver, if scheduler isn`t started.
+    """
+
+    def __init__(
+            self,
+            scheduler: AsyncScheduler,
+            fallback: typing.Any
+            ) -> None:
+        self._scheduler = scheduler
+        self._fallback = fallback
+
+    def receive(self, msg: typing.Any) -> None:
+        if self._scheduler.running:
+            self._scheduler.submit(msg)
+        else:
+            self._fallback.receive(msg)
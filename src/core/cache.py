@@ -1,156 +1,738 @@
 import typing
 import threading
+import collections
+import itertools
+import enum
+import abc
+import sys
+import os
+import stat
+import pickle
+import hashlib
+import tempfile
+import shutil
+import atexit
 
+from . import timings
 
-MAX_CACHE_SIZE: typing.Final[int] = 64
+
+DEFAULT_CACHE_SIZE: typing.Final[int] = 64
+MAX_CACHE_SIZE: typing.Final[int] = 2 ** 16
+# how many eviction reasons are stored for missed keys.
+EVICTED_HISTORY_SIZE: typing.Final[int] = 256
 
 
 class CacheError(Exception):
     pass
 
 
-class _CachedItem:
+class CachePolicy(str, enum.Enum):
+    LFU: str = 'lfu'
+    LRU: str = 'lru'
+    SIZE: str = 'size'
 
-    __slots__ = ['_key', '_hash', '_appeals']
 
-    def __init__(self, key: str) -> None:
-        self._key = key
-        self._appeals = 1
-        self._hash = hash(key)
+class SpillError(CacheError):
+    pass
 
-    def __repr__(self) -> str:
-        name = f'{self.__class__.__name__}'
-        appeals = f'{self._appeals}'
-        key = f'{self._key}'
-        return f'{name}(appeals={appeals}, key={key})'
 
-    @property
-    def key(self) -> str:
-        return self._key
+class EvictionReason(str, enum.Enum):
+    ENTRIES: str = 'entries limit reached'
+    MEMORY: str = 'memory budget exceeded'
+    SPILL: str = 'disk spill limit exceeded'
+
+
+class CacheStats(typing.NamedTuple):
+    policy: str
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    used_bytes: int = 0
+    max_bytes: typing.Optional[int] = None
+    spilled: int = 0
+    spilled_bytes: int = 0
+    restores: int = 0
 
-    @property
-    def appeals(self) -> int:
-        return self._appeals
 
-    def increase(self) -> None:
-        self._appeals += 1
+def estimate_size(item: typing.Any) -> int:
+    """Use item footprint estimation if it have one."""
+    footprint = getattr(item, 'memory_footprint', None)
+    if isinstance(footprint, int):
+        return footprint
+    return sys.getsizeof(item)
+
+
+def format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024 or unit == 'GB':
+            break
+        value /= 1024
+    return f'{value:.1f} {unit}'
 
-    def __hash__(self) -> int:
-        return self._hash
 
-    def __eq__(self, other: str) -> bool:
-        if isinstance(other, str):
-            return self._key == other
+def _first(
+        keys: typing.Iterable[str],
+        skip: typing.Optional[str]
+        ) -> typing.Optional[str]:
+    """First key, that isn`t skip (skip is met once at most)."""
+    for key in itertools.islice(keys, 2):
+        if key != skip:
+            return key
+    return None
+
+
+class _EvictionPolicy(abc.ABC):
+    """
+    Keys order for eviction.
+    All operations are O(1), victim with skip of the only
+    key of coldest group looks through groups.
+    """
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def __contains__(self, key: str) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def insert(self, key: str, size: int) -> None:
+        pass
+
+    @abc.abstractmethod
+    def touch(self, key: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def remove(self, key: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def victim(
+            self,
+            skip: typing.Optional[str] = None
+            ) -> typing.Optional[str]:
+        """
+        Return key, that will be evicted next, except skip.
+        None if there are no other keys.
+        """
+        pass
+
+    def resize(self, key: str, size: int) -> None:
+        pass
+
+
+class _LRUPolicy(_EvictionPolicy):
+    """Least recently used - first."""
+
+    def __init__(self) -> None:
+        self._order = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._order
+
+    def insert(self, key: str, size: int) -> None:
+        self._order[key] = None
+
+    def touch(self, key: str) -> None:
+        self._order.move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        del self._order[key]
+
+    def victim(
+            self,
+            skip: typing.Optional[str] = None
+            ) -> typing.Optional[str]:
+        return _first(self._order, skip)
+
+
+class _LFUPolicy(_EvictionPolicy):
+    """
+    Least frequently used - first.
+    Keys with equal appeals are evicted in LRU order.
+    """
+
+    def __init__(self) -> None:
+        self._appeals = {}
+        self._buckets = collections.defaultdict(collections.OrderedDict)
+        self._min_appeals = 0
+
+    def __len__(self) -> int:
+        return len(self._appeals)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._appeals
+
+    def insert(self, key: str, size: int) -> None:
+        self._appeals[key] = 1
+        self._buckets[1][key] = None
+        self._min_appeals = 1
+
+    def touch(self, key: str) -> None:
+        appeals = self._appeals[key]
+        bucket = self._buckets[appeals]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[appeals]
+            if self._min_appeals == appeals:
+                self._min_appeals = appeals + 1
+        self._appeals[key] = appeals + 1
+        self._buckets[appeals + 1][key] = None
+
+    def remove(self, key: str) -> None:
+        appeals = self._appeals.pop(key)
+        bucket = self._buckets[appeals]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[appeals]
+            if self._min_appeals == appeals:
+                # resolved lazy, insert() after eviction resets it.
+                self._min_appeals = None
+
+    def victim(
+            self,
+            skip: typing.Optional[str] = None
+            ) -> typing.Optional[str]:
+        if not self._buckets:
+            return None
+        if self._min_appeals is None:
+            self._min_appeals = min(self._buckets)
+        key = _first(self._buckets[self._min_appeals], skip)
+        if key is None:
+            # skip is alone in the coldest bucket.
+            appeals = min(
+                    (a for a in self._buckets if a != self._min_appeals),
+                    default=None
+                    )
+            if appeals is not None:
+                key = _first(self._buckets[appeals], skip)
+        return key
+
+
+class _SizeAwarePolicy(_EvictionPolicy):
+    """
+    Biggest items - first.
+    Items are grouped in classes by size power of two,
+    in each class keys are evicted in LRU order.
+    Count of classes is limited by size bit length.
+    """
+
+    def __init__(self) -> None:
+        self._sizes = {}
+        self._classes = collections.defaultdict(collections.OrderedDict)
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sizes
+
+    @staticmethod
+    def _size_class(size: int) -> int:
+        return max(int(size), 0).bit_length()
+
+    def insert(self, key: str, size: int) -> None:
+        size_class = self._size_class(size)
+        self._sizes[key] = size_class
+        self._classes[size_class][key] = None
+
+    def touch(self, key: str) -> None:
+        self._classes[self._sizes[key]].move_to_end(key)
+
+    def remove(self, key: str) -> None:
+        size_class = self._sizes.pop(key)
+        keys = self._classes[size_class]
+        del keys[key]
+        if not keys:
+            del self._classes[size_class]
+
+    def resize(self, key: str, size: int) -> None:
+        self.remove(key)
+        self.insert(key, size)
+
+    def victim(
+            self,
+            skip: typing.Optional[str] = None
+            ) -> typing.Optional[str]:
+        if not self._classes:
+            return None
+        key = _first(self._classes[max(self._classes)], skip)
+        if key is None:
+            # skip is alone in the biggest class.
+            biggest = max(self._classes)
+            size_class = max(
+                    (c for c in self._classes if c != biggest),
+                    default=None
+                    )
+            if size_class is not None:
+                key = _first(self._classes[size_class], skip)
+        return key
+
+
+def is_private_dir(path: str) -> bool:
+    """Directory is owned by user and isn`t writable by others."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    getuid = getattr(os, 'getuid', None)
+    if getuid is not None and info.st_uid != getuid():
         return False
+    return stat.S_ISDIR(info.st_mode) and \
+        not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _pickle_dumps(item: typing.Any) -> bytes:
+    return pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class SpillStore:
+    """
+    Second cache tier: evicted items serialized
+    to files in local directory.
+    If directory isn`t set, temporary one is created
+    and removed on interpreter exit. Directory is created
+    private (0o700); directory of other user or writable by
+    others isn`t used, so nobody can swap spilled files.
+    """
+
+    _suffix: typing.Final[str] = '.spill'
+
+    def __init__(
+            self,
+            *,
+            directory: typing.Optional[str] = None,
+            max_bytes: typing.Optional[int] = None,
+            dumps: typing.Callable[[typing.Any], bytes] = _pickle_dumps,
+            loads: typing.Callable[[bytes], typing.Any] = pickle.loads
+            ) -> None:
+        if directory is not None:
+            directory = os.path.expanduser(directory)
+        self._directory = directory
+        self._temporary = directory is None
+        self._max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        self._dumps = dumps
+        self._loads = loads
+        self._files = collections.OrderedDict()
+        self._used_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._files
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    def entries(self) -> typing.List[typing.Tuple[str, int]]:
+        return [(key, size) for key, (_, size) in self._files.items()]
+
+    def set_codec(
+            self,
+            dumps: typing.Callable[[typing.Any], bytes],
+            loads: typing.Callable[[bytes], typing.Any]
+            ) -> None:
+        self._dumps = dumps
+        self._loads = loads
+
+    def _get_directory(self) -> str:
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix='rates_cache_')
+            atexit.register(self.close)
+        elif not os.path.isdir(self._directory):
+            os.makedirs(self._directory, mode=0o700, exist_ok=True)
+        if not is_private_dir(self._directory):
+            raise SpillError(
+                    f'Spill directory {self._directory} isn`t private.'
+                    )
+        return self._directory
+
+    def _make_path(self, key: str) -> str:
+        name = hashlib.sha1(key.encode()).hexdigest() + self._suffix
+        return os.path.join(self._get_directory(), name)
+
+    def put(self, key: str, item: typing.Any) -> typing.List[str]:
+        """Write item to disk, return keys dropped by disk limit."""
+        try:
+            data = self._dumps(item)
+        except Exception as e:
+            raise SpillError(f'Item <{key}> serialization failed: {e}.')
+        self.discard(key)
+        path = self._make_path(key)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            raise SpillError(f'Item <{key}> spill failed: {e}.')
+        self._files[key] = (path, len(data))
+        self._used_bytes += len(data)
+
+        dropped = []
+        while self._max_bytes is not None and \
+                self._used_bytes > self._max_bytes and len(self._files) > 1:
+            oldest = next(iter(self._files))
+            self.discard(oldest)
+            dropped.append(oldest)
+        return dropped
+
+    def pop(self, key: str) -> typing.Any:
+        """Read item from disk and remove its file."""
+        path, _ = self._files[key]
+        try:
+            self._get_directory()
+            with open(path, 'rb') as file:
+                item = self._loads(file.read())
+        except Exception as e:
+            raise SpillError(f'Item <{key}> restore failed: {e}.')
+        finally:
+            self.discard(key)
+        return item
+
+    def discard(self, key: str) -> None:
+        if key not in self._files:
+            return None
+        path, size = self._files.pop(key)
+        self._used_bytes -= size
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        for key in list(self._files):
+            self.discard(key)
+
+    def close(self) -> None:
+        self.clear()
+        if self._temporary and self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+
+_POLICIES: typing.Dict[str, typing.Type[_EvictionPolicy]] = {
+        CachePolicy.LFU: _LFUPolicy,
+        CachePolicy.LRU: _LRUPolicy,
+        CachePolicy.SIZE: _SizeAwarePolicy,
+        }
 
 
 class SystemCache:
 
     _limit: [int] = MAX_CACHE_SIZE
 
-    def __init__(self, *, max_size: typing.Optional[int] = None) -> None:
-
-        if max_size is None:
-            self._max_size = self._limit
-        else:
-            if max_size > self._limit or max_size <= 0:
-                self._max_size = self._limit
-            else:
-                self._max_size = max_size
+    def __init__(
+            self,
+            *,
+            max_size: typing.Optional[int] = None,
+            policy: str = CachePolicy.LFU,
+            sizeof: typing.Optional[typing.Callable[[typing.Any], int]] = None,
+            max_bytes: typing.Optional[int] = None,
+            spill: typing.Optional[SpillStore] = None
+            ) -> None:
         self._lock = threading.RLock()
-        self._priority_list = []
+        self._spill = spill
+        self._restores = 0
         self._cache = {}
+        self._sizes = {}
+        self._used_bytes = 0
+        self._evicted = collections.OrderedDict()
+        self._sizeof = sizeof or estimate_size
+        self._max_size = self._validate_size(max_size)
+        self._max_bytes = self._validate_bytes(max_bytes)
+        self._policy_name = self._validate_policy(policy)
+        self._policy = _POLICIES[self._policy_name]()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}: {self._cache}'
 
+    def __contains__(self, key: str) -> bool:
+        return key in self._cache or self._is_spilled(key)
+
+    def _is_spilled(self, key: str) -> bool:
+        return self._spill is not None and key in self._spill
+
+    def _validate_size(self, max_size: typing.Optional[int]) -> int:
+        if max_size is None or max_size <= 0:
+            return DEFAULT_CACHE_SIZE
+        return min(max_size, self._limit)
+
+    @staticmethod
+    def _validate_bytes(max_bytes: typing.Optional[int]) -> typing.Optional[int]:
+        if max_bytes is None or max_bytes <= 0:
+            return None
+        return max_bytes
+
+    @staticmethod
+    def _validate_policy(policy: str) -> CachePolicy:
+        try:
+            return CachePolicy(policy)
+        except ValueError:
+            msg = f'Unknown cache policy: <{policy}>, '\
+                  f'expected one of {[p.value for p in CachePolicy]}.'
+            raise CacheError(msg)
+
+    def configure(
+            self,
+            *,
+            max_size: typing.Optional[int] = None,
+            policy: typing.Optional[str] = None,
+            max_bytes: typing.Optional[int] = None,
+            spill: typing.Optional[SpillStore] = None
+            ) -> None:
+        """Change limits or policy, stored items are kept."""
+        with self._lock:
+            if spill is not None:
+                if self._spill is not None:
+                    self._spill.close()
+                self._spill = spill
+            if max_size is not None:
+                self._max_size = self._validate_size(max_size)
+            if max_bytes is not None:
+                self._max_bytes = self._validate_bytes(max_bytes)
+            if policy is not None:
+                self._policy_name = self._validate_policy(policy)
+                self._policy = _POLICIES[self._policy_name]()
+                for key in self._cache:
+                    self._policy.insert(key, self._sizes[key])
+            while len(self._policy) > self._max_size:
+                self._evict(EvictionReason.ENTRIES)
+            self._release_bytes(0)
+
     @property
     def have_space(self) -> bool:
         """Check have we any space for new singe item?"""
-        return len(self._priority_list) + 1 <= self._max_size
+        return len(self._policy) + 1 <= self._max_size
 
-    def add(self, key: str, item: typing.Any) -> None:
-        """Add Item() as new element."""
-        last = -1
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                    policy=self._policy_name.value,
+                    size=len(self._cache),
+                    max_size=self._max_size,
+                    hits=self._hits,
+                    misses=self._misses,
+                    evictions=self._evictions,
+                    used_bytes=self._used_bytes,
+                    max_bytes=self._max_bytes,
+                    spilled=len(self._spill) if self._spill else 0,
+                    spilled_bytes=self._spill.used_bytes if self._spill else 0,
+                    restores=self._restores,
+                    )
 
+    @property
+    def usage(self) -> str:
+        """Current usage in human readable form."""
+        stats = self.stats
+        budget = 'unlimited'
+        if stats.max_bytes is not None:
+            budget = format_bytes(stats.max_bytes)
+        usage = f'{stats.size}/{stats.max_size} models, '\
+                f'{format_bytes(stats.used_bytes)} of {budget}, '\
+                f'policy: {stats.policy}, hits: {stats.hits}, '\
+                f'misses: {stats.misses}, evictions: {stats.evictions}'
+        if self._spill is not None:
+            usage += f', on disk: {stats.spilled} models, '\
+                     f'{format_bytes(stats.spilled_bytes)}, '\
+                     f'restored: {stats.restores}'
+        return usage
+
+    def keys(self) -> typing.List[str]:
         with self._lock:
+            return list(self._cache)
 
-            if key in self._priority_list:
-                # because of list isn`t thread safe
-                # if we`ve found current key
-                # we shouldn`t do anything
-                pass
+    def entries(self) -> typing.List[typing.Tuple[str, int]]:
+        """Return [(key, size in bytes), ...]."""
+        with self._lock:
+            return [(key, self._sizes[key]) for key in self._cache]
 
-            else:
-                if not self.have_space:
-                    removed = self._priority_list.pop(last)
-                    del self._cache[removed.key]
+    def spilled_entries(self) -> typing.List[typing.Tuple[str, int]]:
+        """Return [(key, size on disk), ...]."""
+        with self._lock:
+            if self._spill is None:
+                return []
+            return self._spill.entries()
 
-                _item = _CachedItem(key)
-                self._priority_list.append(_item)
-                self._cache[key] = item
+    @timings.timed('cache.peek')
+    def peek(self, key: str) -> typing.Any:
+        """Get Item() without appeals and stats counting."""
+        with self._lock:
+            return self._cache.get(key)
 
-            self._sort()
+    def missing_reason(self, key: str) -> str:
+        """Explain why key is absent in cache."""
+        with self._lock:
+            if key in self._cache:
+                return f'Model <{key}> is cached.'
+            if self._is_spilled(key):
+                return f'Model <{key}> is spilled to disk.'
+            reason = self._evicted.get(key)
+            if reason is None:
+                return f'Model <{key}> wasn`t loaded.'
+            return f'Model <{key}> was evicted: {reason}.'
+
+    @timings.timed('cache.add')
+    def add(self, key: str, item: typing.Any) -> None:
+        """Add Item() as new element."""
 
+        with self._lock:
+
+            if key in self._policy:
+                # if we`ve found current key
+                # we shouldn`t do anything
+                return None
+            if self._is_spilled(key):
+                self._spill.discard(key)
+
+            size = self._sizeof(item)
+            if not self.have_space:
+                self._evict(EvictionReason.ENTRIES)
+            self._release_bytes(size)
+
+            self._policy.insert(key, size)
+            self._cache[key] = item
+            self._sizes[key] = size
+            self._used_bytes += size
+            self._evicted.pop(key, None)
+
+    @timings.timed('cache.get')
     def get(self, key: str) -> typing.Any:
         """Get Item() stored in Cache."""
 
         with self._lock:
 
-            if key in self._priority_list:
-                self._increase_cacheditem_appeals(key)
-
-            return self._cache.get(key)
-
+            if key in self._policy:
+                self._hits += 1
+                self._policy.touch(key)
+                return self._cache[key]
+
+            if self._is_spilled(key):
+                return self._restore(key)
+
+            self._misses += 1
+            return None
+
+    def _restore(self, key: str) -> typing.Any:
+        """Move item from disk tier back to memory."""
+        try:
+            item = self._spill.pop(key)
+        except SpillError as e:
+            self._misses += 1
+            self._store_reason(key, f'{e}')
+            return None
+        self._hits += 1
+        self._restores += 1
+        self.add(key, item)
+        return item
+
+    @timings.timed('cache.update')
     def update(self, key: str, item: typing.Any) -> None:
         """Update Item() by key, if registered."""
 
         with self._lock:
 
-            if key in self._priority_list:
-                self._increase_cacheditem_appeals(key)
+            if key in self._policy:
+                size = self._sizeof(item)
+                self._policy.touch(key)
+                self._policy.resize(key, size)
                 self._cache[key] = item
+                self._used_bytes += size - self._sizes[key]
+                self._sizes[key] = size
+                self._release_bytes(0, keep=key)
 
             else:
                 msg = f'Item <{item}> not found. Add previously.'
                 raise CacheError(msg)
 
-    def _increase_cacheditem_appeals(self, key: str) -> None:
+    def _release_bytes(
+            self,
+            size: int,
+            *,
+            keep: typing.Optional[str] = None
+            ) -> None:
+        """
+        Evict coldest items until new item with size
+        fits in memory budget. Use only in thread safe methods.
+        """
+        if self._max_bytes is None:
+            return None
+        while self._cache and self._used_bytes + size > self._max_bytes:
+            key = self._policy.victim(skip=keep)
+            if key is None:
+                # only kept item is left.
+                break
+            self._evict(EvictionReason.MEMORY, key)
+
+    def _evict(
+            self,
+            reason: EvictionReason,
+            key: typing.Optional[str] = None
+            ) -> None:
         """Use only in thread safe methods."""
-        idx = self._priority_list.index(key)
-        self._priority_list[idx].increase()
-        self._sort()
+        if key is None:
+            key = self._policy.victim()
+        self._policy.remove(key)
+        item = self._cache.pop(key)
+        size = self._sizes.pop(key)
+        self._used_bytes -= size
+        self._evictions += 1
+        if self._spill is not None:
+            try:
+                dropped = self._spill.put(key, item)
+            except SpillError as e:
+                self._remember_eviction(key, size, reason, f'{e}')
+                return None
+            for dropped_key in dropped:
+                self._store_reason(dropped_key, EvictionReason.SPILL.value)
+            return None
+        self._remember_eviction(key, size, reason)
+
+    def _remember_eviction(
+            self,
+            key: str,
+            size: int,
+            reason: EvictionReason,
+            details: str = ''
+            ) -> None:
+        msg = f'{reason.value} (model size: {format_bytes(size)}, '\
+              f'cache: {len(self._cache)}/{self._max_size} models, '\
+              f'{format_bytes(self._used_bytes)} used)'
+        if self._max_bytes is not None:
+            msg = msg[:-1] + f' of {format_bytes(self._max_bytes)})'
+        if details:
+            msg += f', {details}'
+        self._store_reason(key, msg)
+
+    def _store_reason(self, key: str, msg: str) -> None:
+        self._evicted[key] = msg
+        self._evicted.move_to_end(key)
+        while len(self._evicted) > EVICTED_HISTORY_SIZE:
+            self._evicted.popitem(last=False)
 
     def clear(self) -> None:
         """Clear Cache."""
-        self._priority_list.clear()
-        self._cache.clear()
-
-    def _sort(self) -> None:
-        """Lasy sort.
-           Biggest - first, lowest - last.
-           Elements in between don`t sorted.
-           """
-        pntr = max_idx = 0
-        elements = self._priority_list.__len__
-        coll = self._priority_list
-        tail = min_idx = elements() - 1
-
-        while pntr < tail:
-
-            if coll[pntr].appeals < coll[tail].appeals:
-                coll[pntr], coll[tail] = coll[tail], coll[pntr]
-
-            if coll[max_idx].appeals < coll[pntr].appeals:
-                max_idx = pntr
-
-            if coll[min_idx].appeals > coll[tail].appeals:
-                min_idx = tail
-
-            pntr += 1
-            tail -= 1
-
-        pntr = 0
-        tail = elements() - 1
-        coll[pntr], coll[max_idx] = coll[max_idx], coll[pntr]
-        coll[tail], coll[min_idx] = coll[min_idx], coll[tail]
+        with self._lock:
+            self._policy = _POLICIES[self._policy_name]()
+            self._cache.clear()
+            self._sizes.clear()
+            self._used_bytes = 0
+            self._evictions = 0
+            self._restores = 0
+            self._evicted.clear()
+            if self._spill is not None:
+                self._spill.clear()
@@ -1,5 +1,7 @@
 import typing
 
+from . import timings
+
 
 Event = typing.NewType("Event", typing.NamedTuple)
 
@@ -24,7 +26,7 @@ class Channel:
 
     def handle(self, event: Event) -> None:
         for handler in self._handlers:
-            handler.handle(event)
+            timings.handle(handler, event)
             self._events.extend(handler.fetch_events())
 
     def clear(self) -> None:
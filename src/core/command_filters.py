@@ -1,11 +1,16 @@
 import re
 import typing
 import abc
+import functools
 import dataclasses
 
 
 DEFAULT_INVOKE_SYMB: str = '~$ '
 PASS_SYMB: str = ''
+# loadfile /path.txt --m name | savefile /path.xlsx
+PIPE_SYMB: str = '|'
+# parsed templates of last raw commands (scripts repeat them).
+TEMPLATES_CACHE_SIZE: int = 256
 
 PATH_FILTER_KEY: str = 'path'
 ARGS_FILTER_KEY: str = 'args'
@@ -17,7 +22,7 @@ POSTPROCESSOR_FILTERS_KEYS: typing.Tuple[str] = (
 
 
 _CMD_PATTERN: re.Pattern = re.compile(
-    '''(?x)(?P<cmd>[a-z]{3,})\s(?P<mode>(?:-[a-z]{1,3})?)
+    '''(?x)(?P<cmd>[a-z]{3,})(?:\s|$)(?P<mode>(?:-[a-z]{1,3})?)
     (\s)?(?P<path>(?:(.+)\.[a-z]{2,6})?)(\s)?
     (?P<flag>(?:--[a-z]{1,3})?)(\s)?(?P<args>(?:.+)?)$''' # noqa
     )
@@ -61,6 +66,7 @@ class TerminalCommand:
     flag: str = dataclasses.field(default_factory=str)
     args: list = dataclasses.field(default_factory=list)
     suffix: str = dataclasses.field(default_factory=str)
+    pipe: list = dataclasses.field(default_factory=list)
 
 
 class Filter(abc.ABC):
@@ -220,6 +226,25 @@ class PostProcessor:
         if cmd_chops:
             return TerminalCommand(**cmd_chops)
 
+    @classmethod
+    def make_pipeline(
+            cls,
+            cmd_templates: typing.List[CommandTemplate]
+            ) -> TerminalCommand:
+        """Make TerminalCommand from pipeline of templates.
+           Next commands are stored in .pipe, name of
+           command is joined names: 'loadfile|savefile'.
+           """
+        if not cmd_templates:
+            raise PostprocessorError('Empty pipeline.')
+        head, *tail = [cls.make_command_from(t) for t in cmd_templates]
+        if tail and head is not None:
+            if not all(tail):
+                raise PostprocessorError(f'Invalid pipeline: {tail}.')
+            head.cmd = PIPE_SYMB.join(c.cmd for c in (head, *tail))
+            head.pipe = tail
+        return head
+
     @staticmethod
     def _parse_dict(
             item: typing.Dict[str, str]
@@ -259,6 +284,29 @@ def read_terminal_cmd(
         return raw_cmd
 
 
+def split_pipeline(
+        raw_cmd: str,
+        *,
+        pipe_symb: str = PIPE_SYMB
+        ) -> typing.List[str]:
+    """Split raw pipeline 'cmd | cmd' to raw commands."""
+    return [cmd.strip() for cmd in raw_cmd.split(pipe_symb) if cmd.strip()]
+
+
+@functools.lru_cache(maxsize=TEMPLATES_CACHE_SIZE)
+def make_templates(
+        raw_cmd: str
+        ) -> typing.Tuple[typing.Optional[CommandTemplate], ...]:
+    """
+    Templates of raw pipeline, repeated command is parsed
+    once. Templates are shared: don`t change them.
+    """
+    return tuple(
+            PreProcessor.make_cmd_template(cmd)
+            for cmd in split_pipeline(raw_cmd)
+            )
+
+
 def check_command_subscribed(
         cmd: TerminalCommand,
         controllers: typing.Dict[str, typing.Callable[..., None]]
@@ -18,6 +18,18 @@ class TableSheetModel:
     def empty(self) -> typing.NoReturn:
         pass
 
+    @property
+    def headers(self) -> typing.NoReturn:
+        pass
+
+    @property
+    def columns(self) -> typing.NoReturn:
+        pass
+
+    @property
+    def source(self) -> typing.NoReturn:
+        pass
+
     @classmethod
     def validate(
             self,
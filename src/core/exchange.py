@@ -1,6 +1,14 @@
+import sys
+import time
 import typing
+import functools
+import threading
 import collections
+import dataclasses
 import inspect
+import concurrent.futures as futures
+
+from . import timings
 
 
 class SelectorError(Exception):
@@ -26,10 +34,17 @@ class Channel(typing.Protocol):
 
 
 class Selector:
+    """
+    Channels are registered by message base class, handlers
+    by message class name. Pair for message class is resolved
+    once by its MRO (subclasses inherit channel and handlers
+    of parents) and cached by type.
+    """
 
     def __init__(self) -> None:
         self._handlers = {}
         self._channels = {}
+        self._dispatch: typing.Dict[type, typing.Tuple[Channel, list]] = {}
 
     @staticmethod
     def make_key_for_channels(
@@ -58,6 +73,7 @@ class Selector:
             ) -> None:
         if not self._channels:
             self._channels.update(channels)
+            self._dispatch.clear()
 
     def set_handlers(
             self,
@@ -65,44 +81,311 @@ class Selector:
             ) -> None:
         if not self._handlers:
             self._handlers.update(handlers)
+            self._dispatch.clear()
 
     def select(self, event: typing.Any) -> typing.Tuple[Channel, list]:
         """Return pair: channel, [handlers] for event/cmd."""
-        event_parent = self.make_key_for_channels(event)
-        event_name = self.make_key_for_messages(event)
-        channel = self._select_channel(event_parent)
-        handlers = self._select_handlers(event_name)
-        if all([channel, handlers]):
-            return channel, handlers
-        raise SelectorError(f'No such key: <{event_name}> registered.')
-
-    def _select_channel(self, event_name: str) -> typing.Optional[Channel]:
-        if self._key_in(event_name, self._channels):
-            return self._channels[event_name]
-
-    def _select_handlers(self, event_name: str) -> typing.Optional[list]:
-        if self._key_in(event_name, self._handlers):
-            return self._handlers[event_name]
+        try:
+            return self._dispatch[type(event)]
+        except KeyError:
+            return self._resolve(type(event))
+
+    def _resolve(self, event_type: type) -> typing.Tuple[Channel, list]:
+        """Find pair for message class, unknown classes aren`t cached."""
+        parents = event_type.__mro__[1:]
+        channel = self._select_channel(parents)
+        handlers = self._select_handlers(
+                [cls.__name__ for cls in event_type.__mro__]
+                )
+        if channel is None or not handlers:
+            name = event_type.__name__
+            raise SelectorError(f'No such key: <{name}> registered.')
+        self._dispatch[event_type] = channel, handlers
+        return channel, handlers
+
+    def _select_channel(
+            self,
+            keys: typing.Iterable[typing.Any]
+            ) -> typing.Optional[Channel]:
+        for key in keys:
+            if self._key_in(key, self._channels):
+                return self._channels[key]
+
+    def _select_handlers(
+            self,
+            keys: typing.Iterable[str]
+            ) -> typing.Optional[list]:
+        for key in keys:
+            if self._key_in(key, self._handlers):
+                return self._handlers[key]
 
     @staticmethod
     def _key_in(key: str, collection: dict) -> bool:
         return key in collection
 
 
+class OrderKey(typing.NamedTuple):
+    """
+    Key of ordered task: model name, or prefix of model
+    names for commands, that write many models.
+    """
+    name: str
+    prefix: bool = False
+
+    def overlaps(self, other: 'OrderKey') -> bool:
+        if self.prefix and other.name.startswith(self.name):
+            return True
+        if other.prefix and self.name.startswith(other.name):
+            return True
+        return self.name == other.name
+
+
+def message_key(msg: typing.Any) -> typing.Optional[OrderKey]:
+    """
+    Model name of command: commands of one model are ordered.
+    fname of command with prefix_key set is prefix of names,
+    empty prefix is prefix of all of them.
+    """
+    fname = getattr(msg, 'fname', None)
+    if getattr(msg, 'prefix_key', False):
+        return OrderKey(fname or '', True)
+    if not fname:
+        return None
+    return OrderKey(fname)
+
+
+def run_handlers(handlers: typing.List[typing.Any], event: typing.Any) -> list:
+    """Handle event by each handler, return their events."""
+    events = []
+    for handler in handlers:
+        timings.handle(handler, event)
+        events.extend(handler.fetch_events())
+    return events
+
+
+@dataclasses.dataclass(eq=False)
+class _OrderedTask:
+    key: OrderKey
+    future: futures.Future
+    fn: typing.Callable
+    args: tuple
+    started: bool = False
+
+
+class OrderedExecutor:
+    """
+    Executor backend of schedulers: tasks with overlapping
+    keys (one model name, or name and its prefix) are run
+    one by one in submit order, so savefile never races
+    loadfile of the same model. Tasks without key and
+    tasks of other keys run at once.
+    """
+
+    def __init__(self, executor: futures.Executor) -> None:
+        self._executor = executor
+        self._lock = threading.Lock()
+        # not finished tasks in submit order.
+        self._pending: typing.List[_OrderedTask] = []
+
+    def submit(
+            self,
+            key: typing.Union[OrderKey, str, None],
+            fn: typing.Callable,
+            *args
+            ) -> futures.Future:
+        if key is None:
+            return self._executor.submit(fn, *args)
+        if isinstance(key, str):
+            key = OrderKey(key)
+        task = _OrderedTask(key, futures.Future(), fn, args)
+        with self._lock:
+            task.started = not self._blocked(task, len(self._pending))
+            self._pending.append(task)
+        if task.started:
+            self._start(task)
+        return task.future
+
+    def _blocked(self, task: _OrderedTask, index: int) -> bool:
+        """Task waits for earlier task with overlapping key."""
+        return any(
+                other.key.overlaps(task.key)
+                for other in self._pending[:index]
+                )
+
+    def _start(self, task: _OrderedTask) -> None:
+        try:
+            running = self._executor.submit(task.fn, *task.args)
+        except Exception as e:
+            task.future.set_exception(e)
+            self._next(task)
+            return None
+        running.add_done_callback(functools.partial(self._done, task))
+
+    def _done(self, task: _OrderedTask, running: futures.Future) -> None:
+        error = running.exception()
+        if error is None:
+            task.future.set_result(running.result())
+        else:
+            task.future.set_exception(error)
+        self._next(task)
+
+    def _next(self, finished: _OrderedTask) -> None:
+        """Start waiting tasks, that aren`t blocked anymore."""
+        ready = []
+        with self._lock:
+            self._pending.remove(finished)
+            for index, task in enumerate(self._pending):
+                if not task.started and not self._blocked(task, index):
+                    task.started = True
+                    ready.append(task)
+        for task in ready:
+            self._start(task)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+class Backpressure:
+    """
+    Watermarks of requests queue: from high depth puts
+    wait until queue is drained to low depth. Without
+    high watermark only free space is checked.
+    """
+
+    def __init__(
+            self,
+            high: typing.Optional[int] = None,
+            low: typing.Optional[int] = None
+            ) -> None:
+        self.high = high
+        self.low = high if low is None or high is None else min(low, high)
+        self.throttled = False
+
+    def can_put(self, depth: int) -> bool:
+        if self.high is None:
+            return True
+        return not self.throttled and depth < self.high
+
+    def update(self, depth: int) -> None:
+        """Called with queue depth after each put and fetch."""
+        if self.high is None:
+            return None
+        if depth >= self.high:
+            self.throttled = True
+        elif depth <= self.low:
+            self.throttled = False
+
+
+@dataclasses.dataclass
+class QueueMetrics:
+    """Counters of exchange, shown by status command."""
+    puts: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+    max_depth: int = 0
+    rejected: int = 0
+    repacked: int = 0
+    dropped: int = 0
+
+    def add_put(self, depth: int, waited: typing.Optional[float]) -> None:
+        self.puts += 1
+        self.max_depth = max(self.max_depth, depth)
+        if waited is not None:
+            self.waits += 1
+            self.wait_time += waited
+
+
+class QueueStats(typing.NamedTuple):
+    name: str
+    depth: int
+    high: typing.Optional[int]
+    low: typing.Optional[int]
+    throttled: bool
+    metrics: QueueMetrics
+
+
 class Exchange:
+    """
+    Requests and results queues. Puts of requests wait
+    for free space (and for drain to low watermark) up
+    to put_timeout seconds: 0 - don`t wait, None - wait
+    forever. Results are never waited for: consumer puts
+    them, failed results are repacked by Scheduler.
+    """
 
     _queue = collections.deque
 
-    def __init__(self, *, max_size: typing.Optional[int] = None) -> None:
-        self._to_read = self._queue([], max_size)
-        self._to_write = self._queue([], max_size)
+    def __init__(
+            self,
+            *,
+            max_size: typing.Optional[int] = None,
+            high_watermark: typing.Optional[int] = None,
+            low_watermark: typing.Optional[int] = None,
+            put_timeout: typing.Optional[float] = 0.0
+            ) -> None:
+        self._to_read = self._queue()
+        self._to_write = self._queue()
         self._qs = None
+        self._space = threading.Condition()
+        self.metrics = QueueMetrics()
+        self.set_limits(
+                max_size=max_size,
+                high_watermark=high_watermark,
+                low_watermark=low_watermark,
+                put_timeout=put_timeout
+                )
+
+    def set_limits(
+            self,
+            *,
+            max_size: typing.Optional[int] = None,
+            high_watermark: typing.Optional[int] = None,
+            low_watermark: typing.Optional[int] = None,
+            put_timeout: typing.Optional[float] = 0.0
+            ) -> None:
+        """Set queues size and watermarks (before start of handling)."""
+        with self._space:
+            self._to_read = self._queue(self._to_read, max_size)
+            self._to_write = self._queue(self._to_write, max_size)
+            if max_size is not None:
+                high_watermark = min(high_watermark or max_size, max_size)
+            self._pressure = Backpressure(high_watermark, low_watermark)
+            self._pressure.update(len(self._to_read))
+            self._put_timeout = put_timeout
+            if self._qs is not None:
+                self._build_order_for_round_robin()
+            self._space.notify_all()
+
+    def __len__(self) -> int:
+        return len(self._to_read) + len(self._to_write)
+
+    def stats(self, name: str = 'exchange') -> QueueStats:
+        with self._space:
+            return QueueStats(
+                    name,
+                    len(self),
+                    self._pressure.high,
+                    self._pressure.low,
+                    self._pressure.throttled,
+                    dataclasses.replace(self.metrics)
+                    )
 
     def put_message(self, msg: typing.Any) -> None:
-        element_count = 1
-        if not self.queue_have_free_space(self._to_read, element_count):
-            raise ExchangeError('Requests queue overflow.')
-        self._to_read.append(msg)
+        started = time.monotonic()
+        with self._space:
+            waited = None
+            if not self._can_put():
+                ready = self._space.wait_for(
+                        self._can_put,
+                        self._put_timeout
+                        )
+                if not ready:
+                    self.metrics.rejected += 1
+                    raise ExchangeError('Requests queue overflow.')
+                waited = time.monotonic() - started
+            self._to_read.append(msg)
+            self._pressure.update(len(self._to_read))
+            self.metrics.add_put(len(self._to_read), waited)
 
     def put_result(self, msg: typing.Any) -> None:
         element_count = 1
@@ -110,6 +393,10 @@ class Exchange:
             raise ExchangeError('Results queue overflow.')
         self._to_write.append(msg)
 
+    def _can_put(self) -> bool:
+        return self.queue_have_free_space(self._to_read, 1) and\
+            self._pressure.can_put(len(self._to_read))
+
     @staticmethod
     def queue_have_free_space(queue: collections.deque, _add: int) -> bool:
         if queue.maxlen is not None:
@@ -125,10 +412,23 @@ class Exchange:
             source = self._qs[first]
             self._qs[first], self._qs[last] = self._qs[last], self._qs[first]
             if source:
-                yield source.popleft()
+                item = source.popleft()
+                if source is self._to_read:
+                    self._drained()
+                yield item
             else:
                 yield None
 
+    def _drained(self) -> None:
+        """Wake up waiting puts, if queue is below watermark."""
+        if self._pressure.high is None and self._to_read.maxlen is None:
+            # unbounded queue: puts never wait.
+            return None
+        with self._space:
+            self._pressure.update(len(self._to_read))
+            if self._can_put():
+                self._space.notify_all()
+
     def _build_order_for_round_robin(self) -> None:
         self._qs = [
             q for k, q in self.__dict__.items()
@@ -144,12 +444,26 @@ class Scheduler:
                  selector: Selector,
                  exchange: Exchange,
                  *,
-                 max_operations: typing.Optional[int] = None) -> None:
+                 max_operations: typing.Optional[int] = None,
+                 backend: typing.Optional[OrderedExecutor] = None) -> None:
         self._operations = self._queue([], max_operations)
         self._selector = selector
         self._exchange = exchange
         self._exchange_collection = self._generate_queues_order()
         self._stopped = False
+        self._backend = backend
+        # events of handlers, finished in backend.
+        self._results = collections.deque()
+        self._pending = set()
+
+    def set_backend(self, backend: typing.Optional[OrderedExecutor]) -> None:
+        """Run handlers in backend, check_events doesn`t wait them."""
+        self._backend = backend
+
+    def join(self, timeout: typing.Optional[float] = None) -> bool:
+        """Wait for handlers in backend, False on timeout."""
+        _, not_done = futures.wait(list(self._pending), timeout)
+        return not not_done
 
     def _shutdown(self) -> None:
         self._stopped = True
@@ -164,6 +478,10 @@ class Scheduler:
         repeats = 0
         repack = []
         while not self._stopped:
+            while self._results:
+                self._operations.append(
+                        self._repack_results(self._results.popleft())
+                        )
             event = next(self._exchange_collection)
             if event is None:
                 if repeats > 0:
@@ -190,6 +508,8 @@ class Scheduler:
         else:
             repeats = 0
             self._restart()
+            if repack:
+                self._exchange.metrics.dropped += len(repack)
 
     def _add_to_plan(self, event: typing.Any) -> None:
 
@@ -205,18 +525,42 @@ class Scheduler:
         channel = None
         try:
             channel, handlers = self._selector.select(event)
+            if self._backend is not None:
+                self._submit(event, handlers)
+                return None
             channel.set_handlers(handlers)
             self._operations.append(create_operation(event, channel))
         except SelectorError as e:
             print(e.__class__.__name__, e, 'SELECTOR ERROR')
 
+    def _submit(self, event: typing.Any, handlers: list) -> None:
+        future = self._backend.submit(
+                message_key(event),
+                run_handlers,
+                handlers,
+                event
+                )
+        self._pending.add(future)
+        future.add_done_callback(self._collect)
+
+    def _collect(self, future: futures.Future) -> None:
+        """Called in backend thread."""
+        self._pending.discard(future)
+        error = future.exception()
+        if error is not None:
+            print(error.__class__.__name__, error, file=sys.stderr)
+        elif future.result():
+            self._results.append(future.result())
+
     def _handle_errors(self) -> None:
         ...
 
     def _schedule_canceled(self, events: list) -> None:
-        if len(self._operations) + 1 <= self._operations.maxlen:
+        maxlen = self._operations.maxlen
+        if maxlen is None or len(self._operations) < maxlen:
             repacked = self._repack_results(events.copy())
             self._operations.append(repacked)
+            self._exchange.metrics.repacked += len(events)
             events.clear()
 
     def _repack_results(self, results: typing.List) -> typing.Generator:
@@ -233,15 +577,23 @@ class Receiver:
         self._buffer = collections.deque()
 
     def receive(self, msg: typing.Any) -> None:
+        """
+        Put messages in order, scheduler drains exchange
+        when it`s full. Messages, that can`t be put after
+        draining, are dropped.
+        """
         self._buffer.append(msg)
-        from_buffer = None
+        drained = False
         while self._buffer:
-            len_buffer = len(self._buffer)
-            for _ in range(len_buffer):
-                from_buffer = self._buffer.popleft()
-                try:
-                    self._exchange.put_message(from_buffer)
-                except ExchangeError as e:
-                    print(e.__class__.__name__, e)
-                    self._buffer.append(from_buffer)
-            self._scheduler.check_events()
+            try:
+                self._exchange.put_message(self._buffer[0])
+            except ExchangeError as e:
+                if not drained:
+                    self._scheduler.check_events()
+                    drained = True
+                    continue
+                self._exchange.metrics.dropped += 1
+                print(e.__class__.__name__, e, file=sys.stderr)
+            self._buffer.popleft()
+            drained = False
+        self._scheduler.check_events()
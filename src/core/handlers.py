@@ -4,6 +4,9 @@ import abc
 
 class Handler:
 
+    # handler without I/O is run in event loop of async scheduler.
+    blocking: bool = True
+
     @abc.abstractmethod
     def get_events(self) -> typing.NoReturn:
         pass
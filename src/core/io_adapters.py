@@ -1,20 +1,61 @@
 from abc import ABC, abstractmethod
-from typing import NoReturn
+from typing import Any, Iterable, NoReturn, Sequence
 
 
 class FileReaderInterface(ABC):
 
+    # reader picks sheet of file by settings.name.
+    reads_sheets: bool = False
+
     @abstractmethod
     def read(self) -> NoReturn:
         pass
 
 
+class ModelReaderInterface(FileReaderInterface):
+    """Reader of parsed models: values aren`t parsed again."""
+
+    @abstractmethod
+    def read_model(self, settings: Any, model: Any, **kwargs) -> Any:
+        pass
+
+
 class FileWriterInterface(ABC):
 
     @abstractmethod
     def write(self) -> NoReturn:
         pass
 
+    def write_rows(self, settings: Any, rows: Iterable) -> int:
+        """
+        Write all rows by one call, return rows count.
+        By default rows are sent one by one to write().
+        """
+        writer = self.write(settings)
+        count = 0
+        for row in rows:
+            writer.send(row)
+            count += 1
+        try:
+            writer.throw(StopIteration)
+        except StopIteration:
+            pass
+        writer.close()
+        return count
+
+
+class ColumnsWriterInterface(FileWriterInterface):
+    """Writer, that takes model values stored by columns."""
+
+    @abstractmethod
+    def write_columns(
+            self,
+            settings: Any,
+            headers: Sequence[str],
+            columns: Sequence[Sequence[Any]]
+            ) -> int:
+        pass
+
 
 class FileDriverInterface(ABC):
     """header for driver-type description."""
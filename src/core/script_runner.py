@@ -0,0 +1,92 @@
+"""
+Batch mode of terminal: commands of script file are run in
+background scheduler, summary of commands is printed at end.
+"""
+import sys
+import time
+import typing
+
+from .async_exchange import AsyncScheduler
+
+
+# script line, that starts with it, is skipped.
+COMMENT_SYMB: str = '#'
+_SUMMARY_ROW: str = '{:>5} {:<8} {:>9}  {}'
+
+
+class ScriptCommand(typing.NamedTuple):
+    """Command of script with ids of its jobs."""
+    line: int
+    raw_cmd: str
+    jobs: range
+
+
+def run_script(
+        lines: typing.Iterable[str],
+        run_command: typing.Callable[[str], bool],
+        scheduler: AsyncScheduler
+        ) -> int:
+    """
+    Run commands of script in background scheduler: commands
+    of one model are run in order, commands of other models
+    (loads too) overlap them. Print time of each command,
+    return exit code: 1 if any command is invalid or failed.
+    """
+    scheduler.set_history(None)
+    if not scheduler.running:
+        scheduler.start()
+    started = time.monotonic()
+    commands = []
+    for number, line in enumerate(lines, 1):
+        raw_cmd = line.strip()
+        if not raw_cmd or raw_cmd.startswith(COMMENT_SYMB):
+            continue
+        first = scheduler.last_id + 1
+        run_command(raw_cmd)
+        jobs = range(first, scheduler.last_id + 1)
+        commands.append(ScriptCommand(number, raw_cmd, jobs))
+    scheduler.join()
+    return _print_summary(commands, time.monotonic() - started, scheduler)
+
+
+def _print_summary(
+        commands: typing.List[ScriptCommand],
+        elapsed: float,
+        scheduler: AsyncScheduler
+        ) -> int:
+    jobs = {job.id: job for job in scheduler.jobs()}
+    print(
+        _SUMMARY_ROW.format('LINE', 'STATE', 'TIME', 'COMMAND'),
+        file=sys.stdout
+        )
+    failed = 0
+    for command in commands:
+        done = [jobs[i] for i in command.jobs if i in jobs]
+        errors = [job.error for job in done if job.error]
+        # command without jobs wasn`t queued: it`s invalid.
+        state = 'failed' if errors or not done else 'done'
+        failed += state == 'failed'
+        spent = 0.0
+        if done:
+            start = min(job.started or job.created for job in done)
+            spent = max(job.finished or start for job in done) - start
+        text = ': '.join([command.raw_cmd, *errors])
+        print(_SUMMARY_ROW.format(
+            command.line,
+            state,
+            f'{spent:.2f}s',
+            text
+            ), file=sys.stdout)
+    print(
+        f'Commands: {len(commands)}, failed: {failed}, '
+        f'total: {elapsed:.2f}s.',
+        file=sys.stdout
+        )
+    return 1 if failed else 0
+
+
+__all__ = (
+        'COMMENT_SYMB',
+        'ScriptCommand',
+        'run_script',
+        )
@@ -11,6 +11,22 @@ ENV_FILE: typing.Final[str] = '.env'
 
 MULTY_HEADERS_KEY: typing.Final[str] = 'MULTY_HEADERS'
 RAIL_HEADERS_KEY: typing.Final[str] = 'RAIL_HEADERS'
+CACHE_SIZE_KEY: typing.Final[str] = 'CACHE_MAX_SIZE'
+CACHE_POLICY_KEY: typing.Final[str] = 'CACHE_POLICY'
+CACHE_MAX_MB_KEY: typing.Final[str] = 'CACHE_MAX_MB'
+CACHE_SPILL_DIR_KEY: typing.Final[str] = 'CACHE_SPILL_DIR'
+CACHE_SPILL_MB_KEY: typing.Final[str] = 'CACHE_SPILL_MB'
+LOAD_WORKERS_KEY: typing.Final[str] = 'LOAD_WORKERS'
+PARSE_CACHE_DIR_KEY: typing.Final[str] = 'PARSE_CACHE_DIR'
+PARSE_CACHE_MB_KEY: typing.Final[str] = 'PARSE_CACHE_MB'
+PARSE_CACHE_HASH_KEY: typing.Final[str] = 'PARSE_CACHE_HASH'
+WATCH_INTERVAL_KEY: typing.Final[str] = 'WATCH_INTERVAL'
+CORE_ASYNC_KEY: typing.Final[str] = 'CORE_ASYNC'
+CORE_WORKERS_KEY: typing.Final[str] = 'CORE_WORKERS'
+CORE_QUEUE_SIZE_KEY: typing.Final[str] = 'CORE_QUEUE_SIZE'
+CORE_QUEUE_HIGH_KEY: typing.Final[str] = 'CORE_QUEUE_HIGH'
+CORE_QUEUE_LOW_KEY: typing.Final[str] = 'CORE_QUEUE_LOW'
+CORE_QUEUE_TIMEOUT_KEY: typing.Final[str] = 'CORE_QUEUE_TIMEOUT'
 _RE_PATTERN_PREF: typing.Final[str] = 'RE'
 _DEF_STR_SEP: typing.Final[str] = ', '
 
@@ -84,6 +100,20 @@ def _fetch_env_value(
         return value
 
 
+def fetch_int_value(
+        key: str,
+        config: typing.Dict[str, str]
+        ) -> typing.Optional[int]:
+    """Return int value from config or None if not set."""
+    value = config.get(key)
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise Exception(f'Invalid int value for <{key}>: {value}.')
+
+
 def _is_multivalue_str(
         string: str
         ) -> bool:
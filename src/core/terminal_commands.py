@@ -21,6 +21,21 @@ _VALID: bool = True
 LOADFILE: typing.Final[str] = 'loadfile'
 SAVEFILE: typing.Final[str] = 'savefile'
 SHOWPREV: typing.Final[str] = 'showprev'
+SHOWCACHED: typing.Final[str] = 'showcached'
+# ~$ loadmany /home/my_dir/*.txt --m [ --r ] [ prefix ]
+LOADMANY: typing.Final[str] = 'loadmany'
+# ~$ watch /home/my_dir/*.txt --m [ --r ] [ prefix ]
+WATCH: typing.Final[str] = 'watch'
+# ~$ unwatch [ /home/my_dir/*.txt ]
+UNWATCH: typing.Final[str] = 'unwatch'
+# ~$ status
+STATUS: typing.Final[str] = 'status'
+# ~$ timings [ on | off ]
+TIMINGS: typing.Final[str] = 'timings'
+# ~$ loadfile /data.txt --m tempname | savefile /data.xlsx
+CONVERT: typing.Final[str] = f'{LOADFILE}|{SAVEFILE}'
+# ~$ loadfile /data.txt --m | showprev
+PREVIEWFILE: typing.Final[str] = f'{LOADFILE}|{SHOWPREV}'
 
 ExtFileDriver: typing.TypeAlias = object
 ExtFileReader: typing.TypeAlias = object
@@ -36,6 +51,7 @@ class CommandParams(str, enum.Enum):
     FLAG: str = 'flag'
     FNAME: str = 'fname'
     SUFFIX: str = 'suffix'
+    DEST_SUFFIX: str = 'dest_suffix'
 
 
 class CommandFlag(str, enum.Enum):
@@ -43,14 +59,33 @@ class CommandFlag(str, enum.Enum):
     RAIL: str = '--r'
 
 
+class LoadMode(str, enum.Enum):
+    """Command mode: ~$ loadfile -p /data.txt --m tempname."""
+    DEFAULT: str = ''
+    PARALLEL: str = '-p'
+    MMAP: str = '-mm'
+    VALUES: str = '-v'
+    XML: str = '-x'
+
+
 class CmdKey(str, enum.Enum):
     LOADFILE: str = LOADFILE
     SAVEFILE: str = SAVEFILE
     SHOWPREV: str = SHOWPREV
+    SHOWCACHED: str = SHOWCACHED
+    LOADMANY: str = LOADMANY
+    WATCH: str = WATCH
+    UNWATCH: str = UNWATCH
+    STATUS: str = STATUS
+    TIMINGS: str = TIMINGS
+    CONVERT: str = CONVERT
+    PREVIEWFILE: str = PREVIEWFILE
 
 
 _FLAGS: typing.Dict[str, typing.Callable] = {}
 _SUBCRIBED_READERS: typing.Dict[str, typing.Any] = {}
+# alternative readers for suffix, selected by command mode.
+_MODE_READERS: typing.Dict[typing.Tuple[str, str], typing.Any] = {}
 _SUBCRIBED_WRITERS: typing.Dict[
                         str,
                         typing.Tuple[
@@ -71,7 +106,31 @@ _REQUIRED_CMD_ARGS = {
             ),
         SHOWPREV: (
             CommandParams.FNAME
-            )
+            ),
+        SHOWCACHED: (),
+        LOADMANY: (
+            CommandParams.FLAG,
+            CommandParams.SUFFIX
+            ),
+        WATCH: (
+            CommandParams.FLAG,
+            CommandParams.SUFFIX
+            ),
+        UNWATCH: (),
+        STATUS: (),
+        TIMINGS: (),
+        CONVERT: (
+            CommandParams.PATH,
+            CommandParams.FLAG,
+            CommandParams.FNAME,
+            CommandParams.SUFFIX,
+            CommandParams.DEST_SUFFIX
+            ),
+        PREVIEWFILE: (
+            CommandParams.PATH,
+            CommandParams.FLAG,
+            CommandParams.SUFFIX
+            ),
         }
 
 
@@ -95,6 +154,10 @@ _VALIDATORS: typing.Dict[typing.Tuple[str, str], typing.Callable] = {
         CommandParams.FLAG: lambda x, y: flags().get(x) if y else _PASS,
         CommandParams.FNAME: _check_fname,
         CommandParams.SUFFIX: _get_io_handlers,
+        CommandParams.DEST_SUFFIX: lambda x, y: _get_io_handlers(
+            x,
+            SysCommandType.IO_WRITE
+            ),
         }
 
 
@@ -132,18 +195,30 @@ def get_readers_repo() -> typing.Callable:
                         ExtFileDriver,
                         FileReaderInterface,
                         ],
+            *,
+            mode: typing.Optional[str] = None
             ) -> None:
-        if suffix not in _SUBCRIBED_READERS:
+        if mode:
+            _MODE_READERS.setdefault((suffix, mode), item)
+        elif suffix not in _SUBCRIBED_READERS:
             _SUBCRIBED_READERS[suffix] = item
 
     def _get(suffix: str) -> bool:
         return suffix in _SUBCRIBED_READERS
 
-    def _get_item(suffix: str) -> typing.Tuple[
-                                    ExtFileDriver,
-                                    FileReaderInterface,
-                                    ]:
-        """return Driver, Reader for file operations."""
+    def _get_item(
+            suffix: str,
+            mode: typing.Optional[str] = None
+            ) -> typing.Tuple[
+                    ExtFileDriver,
+                    FileReaderInterface,
+                    ]:
+        """
+        return Driver, Reader for file operations.
+        Reader for mode is returned if registered.
+        """
+        if mode and (suffix, mode) in _MODE_READERS:
+            return _MODE_READERS[(suffix, mode)]
         return _SUBCRIBED_READERS.get(suffix)
 
     get_readers_repo.add = _add_suff
@@ -204,7 +279,8 @@ class command_validator:
             check_path: bool = False,
             check_flag: bool = False,
             check_args: bool = False,
-            check_suffix: bool = False
+            check_suffix: bool = False,
+            check_dest_suffix: bool = False
             ) -> None:
         self._t_type = sys_task_type
         self.mode = check_mode
@@ -212,6 +288,7 @@ class command_validator:
         self.flag = check_flag
         self.args = check_args
         self.suffix = check_suffix
+        self.dest_suffix = check_dest_suffix
 
     def __call__(self, command: type) -> typing.Callable:
         functools.wraps(command)
@@ -313,5 +390,6 @@ __all__ = [
         'flags',
         'get_readers_repo',
         'command_validator',
-        'CmdKey'
+        'CmdKey',
+        'LoadMode'
         ]
@@ -0,0 +1,134 @@
+"""
+Per-stage timings of commands (timings command). Stages are
+collected in thread of handler while timings are on: timed()
+wrappers cost one flag check when they are off, per-row
+stages are wrapped by wrap() once per call of hot loop.
+"""
+import sys
+import time
+import typing
+import functools
+import threading
+import contextlib
+
+
+# ~$ timings [on | off], off by default.
+_enabled: bool = False
+_local = threading.local()
+_ROW: str = '  {:<22} {:>9} {:>10} {:>6}'
+
+
+class StageTimes:
+    """Calls count and seconds of stages of one command."""
+
+    def __init__(self) -> None:
+        self._stages: typing.Dict[str, typing.List] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._stages)
+
+    def add(self, stage: str, seconds: float, calls: int = 1) -> None:
+        times = self._stages.setdefault(stage, [0, 0.0])
+        times[0] += calls
+        times[1] += seconds
+
+    def get(self, stage: str) -> typing.Tuple[int, float]:
+        calls, seconds = self._stages.get(stage, (0, 0.0))
+        return calls, seconds
+
+    def format(self, title: str, total: float) -> typing.List[str]:
+        """
+        Lines of breakdown, slowest stage first. Stages are
+        inclusive: writer time contains driver.read time.
+        """
+        lines = [f'timings: {title}: {total:.3f}s']
+        lines.append(_ROW.format('STAGE', 'CALLS', 'TIME', '%'))
+        stages = sorted(self._stages.items(), key=lambda i: -i[1][1])
+        for stage, (calls, seconds) in stages:
+            share = seconds / total * 100 if total else 0.0
+            lines.append(_ROW.format(
+                stage,
+                calls,
+                f'{seconds:.3f}s',
+                f'{share:.0f}'
+                ))
+        return lines
+
+
+def enable(on: bool = True) -> None:
+    global _enabled
+    _enabled = on
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def current() -> typing.Optional[StageTimes]:
+    """Timings collected in current thread or None."""
+    return getattr(_local, 'times', None)
+
+
+@contextlib.contextmanager
+def collect() -> typing.Generator:
+    """Collect stages of current thread, nested calls share times."""
+    times = current()
+    if times is not None:
+        yield times
+        return
+    _local.times = times = StageTimes()
+    try:
+        yield times
+    finally:
+        _local.times = None
+
+
+def timed(stage: str) -> typing.Callable:
+    """Time calls of function as stage, while collecting."""
+    def decorator(func: typing.Callable) -> typing.Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> typing.Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            times = current()
+            if times is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                times.add(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def wrap(stage: str, func: typing.Callable) -> typing.Callable:
+    """
+    Timed func, if collecting, else func as is. Used
+    before hot loops: no overhead per call when off.
+    """
+    times = current() if _enabled else None
+    if times is None:
+        return func
+    return timed(stage)(func)
+
+
+def handle(handler: typing.Any, event: typing.Any) -> None:
+    """Call handler, print stages of it, if timings are on."""
+    if not _enabled or not getattr(handler, 'blocking', True):
+        handler.handle(event)
+        return None
+    with collect() as times:
+        start = time.perf_counter()
+        try:
+            handler.handle(event)
+        finally:
+            total = time.perf_counter() - start
+            title = ' '.join(
+                    str(part) for part in (
+                        type(event).__name__,
+                        getattr(event, 'fname', '')
+                        ) if part
+                    )
+            lines = times.format(title, total)
+            print('\n'.join(lines), file=sys.stdout)
@@ -1,15 +1,66 @@
+import sys
+import argparse
+import typing
+
 from config import system_logger as logger
 from config import cmd_filters as cf
 from config import Postprocessor
 from config import on_startup
 from config import on_shutdown
 from config import api_router
+from config import async_scheduler
 from config import ValidationError
+from config import timings
+from config import script_runner
+
 
+def run_command(raw_cmd: str) -> bool:
+    """Parse and dispatch raw command, False if it`s invalid."""
+    try:
+        templates = list(cf.make_templates(raw_cmd))
+        term_command = Postprocessor.make_pipeline(templates)
+        cf.check_command_subscribed(
+                term_command,
+                api_router.controllers
+                )
+        api_router.dispatch(term_command.cmd, term_command)
+    except cf.SystemValidationError as err:
+        logger.critical(err)
+    except cf.PostprocessorError as err:
+        logger.critical(err)
+    except ValidationError as err:
+        logger.critical(err)
+    else:
+        return True
+    return False
 
-def main() -> None:
+
+def run_script(lines: typing.Iterable[str]) -> int:
+    """Run commands of script, return exit code."""
+    return script_runner.run_script(lines, run_command, async_scheduler)
+
+
+def parse_args(argv: typing.Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Rates parser terminal.')
+    parser.add_argument(
+            'script',
+            nargs='?',
+            type=argparse.FileType('r'),
+            help='run commands of file (- for stdin) and exit'
+            )
+    parser.add_argument(
+            '--timings',
+            action='store_true',
+            help='print time of load and save stages of each command'
+            )
+    return parser.parse_args(argv)
+
+
+def main() -> int:
     """Application main_loop() func."""
 
+    args = parse_args()
+    timings.enable(args.timings)
     _running = False
     try:
         on_startup()
@@ -17,26 +68,23 @@ def main() -> None:
     except Exception as err:  # BootstrapError(msg)
         logger.critical(err)
 
+    if args.script is not None:
+        if not _running:
+            return 1
+        try:
+            with args.script:
+                return run_script(args.script)
+        finally:
+            on_shutdown()
+
     while _running:
         raw_cmd = cf.read_terminal_cmd()
         if raw_cmd:
-            template = cf.PreProcessor.make_cmd_template(raw_cmd)
-            try:
-                term_command = Postprocessor.make_command_from(template)
-                cf.check_command_subscribed(
-                        term_command,
-                        api_router.controllers
-                        )
-                api_router.dispatch(term_command.cmd, term_command)
-            except cf.SystemValidationError as err:
-                logger.critical(err)
-            except cf.PostprocessorError as err:
-                logger.critical(err)
-            except ValidationError as err:
-                logger.critical(err)
+            run_command(raw_cmd)
     else:
         on_shutdown()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,534 @@
+"""
+Binary columnar format .rtc for sheet models.
+
+File is magic, meta (json: name, headers) and blocks of rows.
+Each block is rows count and columns of block:
+strings are stored as table of unique strings and indexes,
+ints and floats as arrays, mixed columns as tagged values
+(None, bool, int, float, date, datetime, time, timedelta and
+str). Values are
+never pickled: reading of file doesn`t run any code.
+Block with zero rows ends file.
+"""
+import io
+import sys
+import json
+import array
+import struct
+import typing
+import datetime
+import itertools
+
+from .core_presets import sys_io_interface as sii
+from .services import _starter
+from .services import SourceState
+
+
+RTC_MAGIC: bytes = b'RTC\x01'
+# rows in one block: memory of writer and reader is bounded by block.
+RTC_BLOCK_ROWS: int = 2 ** 16
+RTC_READ_BUFFER: int = 2 ** 20
+
+_SIZE: struct.Struct = struct.Struct('<I')
+_COLUMN: struct.Struct = struct.Struct('<BQ')
+_LITTLE_ENDIAN: bool = sys.byteorder == 'little'
+_TEXT_ERRORS: str = 'surrogatepass'
+
+_STRINGS: int = 1
+_INTS: int = 2
+_FLOATS: int = 3
+_VALUES: int = 5
+
+# tags of values in mixed column.
+_NONE: int = 0
+_FALSE: int = 1
+_TRUE: int = 2
+_INT: int = 3
+_BIG_INT: int = 4
+_FLOAT: int = 5
+_DATE: int = 6
+_DATETIME: int = 7
+_STR: int = 8
+_TIME: int = 9
+_TIMEDELTA: int = 10
+_INT64: struct.Struct = struct.Struct('<q')
+# days, seconds and microseconds of timedelta.
+_DELTA: struct.Struct = struct.Struct('<qii')
+_FLOAT64: struct.Struct = struct.Struct('<d')
+_INT64_RANGE: range = range(-2 ** 63, 2 ** 63)
+
+
+class RtcFormatError(Exception):
+    pass
+
+
+def _array_bytes(items: array.array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        items.byteswap()
+    return items.tobytes()
+
+
+def _bytes_array(typecode: str, data: bytes) -> array.array:
+    items = array.array(typecode)
+    items.frombytes(data)
+    if not _LITTLE_ENDIAN:
+        items.byteswap()
+    return items
+
+
+def _index_typecode(count: int) -> str:
+    if count < 2 ** 8:
+        return 'B'
+    if count < 2 ** 16:
+        return 'H'
+    return 'I'
+
+
+def _encode_strings(column: typing.Sequence[typing.Any]) -> bytes:
+    """Unique strings table and index of value, index 0 is None."""
+    uniques = dict.fromkeys(column)
+    uniques.pop(None, None)
+    indexes = {value: idx for idx, value in enumerate(uniques, 1)}
+    indexes[None] = 0
+    encoded = [value.encode('utf-8', _TEXT_ERRORS) for value in uniques]
+    typecode = _index_typecode(len(indexes))
+    return b''.join((
+            typecode.encode(),
+            _SIZE.pack(len(encoded)),
+            _array_bytes(array.array('I', map(len, encoded))),
+            b''.join(encoded),
+            _array_bytes(array.array(typecode, map(indexes.get, column))),
+            ))
+
+
+def _decode_strings(
+        data: bytes,
+        intern_strings: bool
+        ) -> typing.List[typing.Optional[str]]:
+    typecode = chr(data[0])
+    count, = _SIZE.unpack_from(data, 1)
+    pos = 1 + _SIZE.size
+    lengths = _bytes_array('I', data[pos:pos + 4 * count])
+    pos += 4 * count
+    values = [None]
+    for length in lengths:
+        values.append(data[pos:pos + length].decode('utf-8', _TEXT_ERRORS))
+        pos += length
+    if intern_strings:
+        values[1:] = map(sys.intern, values[1:])
+    return list(map(values.__getitem__, _bytes_array(typecode, data[pos:])))
+
+
+def _encode_text(tag: int, text: str) -> typing.Tuple[int, bytes]:
+    data = text.encode('utf-8', _TEXT_ERRORS)
+    return tag, _SIZE.pack(len(data)) + data
+
+
+def _encode_value(value: typing.Any) -> typing.Tuple[int, bytes]:
+    """Tag and payload of value, datetime is checked before date."""
+    if value is None:
+        return _NONE, b''
+    if isinstance(value, bool):
+        return (_TRUE if value else _FALSE), b''
+    if isinstance(value, int):
+        if value in _INT64_RANGE:
+            return _INT, _INT64.pack(value)
+        return _encode_text(_BIG_INT, str(value))
+    if isinstance(value, float):
+        return _FLOAT, _FLOAT64.pack(value)
+    if isinstance(value, datetime.datetime):
+        return _encode_text(_DATETIME, value.isoformat())
+    if isinstance(value, datetime.date):
+        return _encode_text(_DATE, value.isoformat())
+    if isinstance(value, datetime.time):
+        return _encode_text(_TIME, value.isoformat())
+    if isinstance(value, datetime.timedelta):
+        return _TIMEDELTA, _DELTA.pack(
+                value.days,
+                value.seconds,
+                value.microseconds
+                )
+    if isinstance(value, str):
+        return _encode_text(_STR, value)
+    raise RtcFormatError(f'Unsupported value type: {type(value).__name__}.')
+
+
+def _encode_values(column: typing.Sequence[typing.Any]) -> bytes:
+    """Tags of values (byte per value) and their payloads."""
+    tags, payloads = zip(*map(_encode_value, column)) if column else ((), ())
+    return bytes(tags) + b''.join(payloads)
+
+
+def _decode_values(data: bytes, count: int) -> typing.List[typing.Any]:
+    values = []
+    pos = count
+    for tag in data[:count]:
+        if tag == _NONE:
+            values.append(None)
+        elif tag == _FALSE or tag == _TRUE:
+            values.append(tag == _TRUE)
+        elif tag == _INT:
+            values.append(_INT64.unpack_from(data, pos)[0])
+            pos += _INT64.size
+        elif tag == _FLOAT:
+            values.append(_FLOAT64.unpack_from(data, pos)[0])
+            pos += _FLOAT64.size
+        elif tag == _TIMEDELTA:
+            values.append(datetime.timedelta(*_DELTA.unpack_from(data, pos)))
+            pos += _DELTA.size
+        elif tag in (_BIG_INT, _DATE, _DATETIME, _TIME, _STR):
+            size, = _SIZE.unpack_from(data, pos)
+            pos += _SIZE.size
+            if pos + size > len(data):
+                raise RtcFormatError('Unexpected end of column.')
+            text = data[pos:pos + size].decode('utf-8', _TEXT_ERRORS)
+            pos += size
+            if tag == _BIG_INT:
+                values.append(int(text))
+            elif tag == _DATE:
+                values.append(datetime.date.fromisoformat(text))
+            elif tag == _DATETIME:
+                values.append(datetime.datetime.fromisoformat(text))
+            elif tag == _TIME:
+                values.append(datetime.time.fromisoformat(text))
+            else:
+                values.append(text)
+        else:
+            raise RtcFormatError(f'Unknown value tag: {tag}.')
+    if len(values) != count or pos != len(data):
+        raise RtcFormatError('Column size mismatch.')
+    return values
+
+
+def encode_column(column: typing.Sequence[typing.Any]) -> bytes:
+    """Column as kind, payload size and payload."""
+    kinds = set(map(type, column))
+    payload = None
+    if kinds <= {str, type(None)}:
+        kind, payload = _STRINGS, _encode_strings(column)
+    elif kinds == {int}:
+        try:
+            kind, payload = _INTS, _array_bytes(array.array('q', column))
+        except OverflowError:
+            pass
+    elif kinds == {float}:
+        kind, payload = _FLOATS, _array_bytes(array.array('d', column))
+    if payload is None:
+        kind, payload = _VALUES, _encode_values(column)
+    return _COLUMN.pack(kind, len(payload)) + payload
+
+
+def _decode_column(
+        kind: int,
+        data: bytes,
+        rows: int,
+        intern_strings: bool = False
+        ) -> typing.List[typing.Any]:
+    """Values of column, broken column raises RtcFormatError."""
+    try:
+        if kind == _STRINGS:
+            values = _decode_strings(data, intern_strings)
+        elif kind == _INTS:
+            values = _bytes_array('q', data).tolist()
+        elif kind == _FLOATS:
+            values = _bytes_array('d', data).tolist()
+        elif kind == _VALUES:
+            values = _decode_values(data, rows)
+        else:
+            raise RtcFormatError(f'Unknown column kind: {kind}.')
+    except (ValueError, IndexError, OverflowError, struct.error) as e:
+        # UnicodeDecodeError is ValueError too.
+        raise RtcFormatError(f'Broken column: {e}.') from e
+    if len(values) != rows:
+        raise RtcFormatError('Column size mismatch.')
+    return values
+
+
+def encode_block(columns: typing.Sequence[typing.Sequence]) -> bytes:
+    rows = len(columns[0]) if columns else 0
+    return _SIZE.pack(rows) + b''.join(map(encode_column, columns))
+
+
+def encode_meta(
+        name: str,
+        headers: typing.Sequence[str],
+        *,
+        source: typing.Optional[typing.Sequence] = None
+        ) -> bytes:
+    """Magic and meta, source state of model is optional."""
+    meta = {'name': name, 'headers': list(headers)}
+    if source is not None:
+        meta['source'] = list(source)
+    meta = json.dumps(meta).encode()
+    return RTC_MAGIC + _SIZE.pack(len(meta)) + meta
+
+
+def _read(stream: typing.BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise RtcFormatError('Unexpected end of file.')
+    return data
+
+
+def read_meta(stream: typing.BinaryIO) -> typing.Dict[str, typing.Any]:
+    if stream.read(len(RTC_MAGIC)) != RTC_MAGIC:
+        raise RtcFormatError('File is not .rtc file.')
+    size, = _SIZE.unpack(_read(stream, _SIZE.size))
+    try:
+        meta = json.loads(_read(stream, size))
+    except ValueError as e:
+        raise RtcFormatError(f'Broken meta: {e}.') from e
+    headers = meta.get('headers') if isinstance(meta, dict) else None
+    if not isinstance(headers, list) or not all(
+            isinstance(header, str) for header in headers
+            ):
+        raise RtcFormatError('Meta has no headers.')
+    return meta
+
+
+def iter_blocks(
+        stream: typing.BinaryIO,
+        width: int,
+        *,
+        intern_strings: bool = False
+        ) -> typing.Generator:
+    """
+    Yield columns of each block, stream is read after meta.
+    If intern_strings is set, strings table is interned,
+    so equal strings of all blocks are one object.
+    """
+    while True:
+        rows, = _SIZE.unpack(_read(stream, _SIZE.size))
+        if not rows:
+            return
+        columns = []
+        for _ in range(width):
+            kind, size = _COLUMN.unpack(_read(stream, _COLUMN.size))
+            columns.append(_decode_column(
+                    kind,
+                    _read(stream, size),
+                    rows,
+                    intern_strings
+                    ))
+        yield columns
+
+
+def read_columns(
+        stream: typing.BinaryIO,
+        *,
+        max_rows: typing.Optional[int] = None,
+        intern_strings: bool = False
+        ) -> typing.Tuple[typing.Dict[str, typing.Any], typing.List[list]]:
+    """Meta and columns of file (max_rows rows at most)."""
+    meta = read_meta(stream)
+    columns = [[] for _ in meta['headers']]
+    blocks = iter_blocks(stream, len(columns), intern_strings=intern_strings)
+    for block in blocks:
+        for column, values in zip(columns, block):
+            column.extend(values)
+        if max_rows is not None and columns and len(columns[0]) >= max_rows:
+            for column in columns:
+                del column[max_rows:]
+            break
+    return meta, columns
+
+
+class _BlockWriter:
+    """Collect rows to blocks, first row is headers."""
+
+    def __init__(
+            self,
+            stream: typing.BinaryIO,
+            name: str,
+            block_rows: int
+            ) -> None:
+        self._stream = stream
+        self._name = name
+        self._block_rows = block_rows
+        self._headers = None
+        self._rows = []
+        self.count = 0
+
+    def add_rows(self, rows: typing.Iterable) -> None:
+        rows = iter(rows)
+        if self._headers is None:
+            headers = next(rows, None)
+            if headers is None:
+                return
+            self._headers = list(headers)
+            self._stream.write(encode_meta(self._name, self._headers))
+            self.count += 1
+        while True:
+            free = self._block_rows - len(self._rows)
+            before = len(self._rows)
+            self._rows.extend(itertools.islice(rows, free))
+            self.count += len(self._rows) - before
+            if len(self._rows) < self._block_rows:
+                return
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._rows:
+            width = len(self._headers)
+            if set(map(len, self._rows)) != {width}:
+                raise RtcFormatError(f'Rows length != {width}.')
+            self._stream.write(encode_block(list(zip(*self._rows))))
+            self._rows = []
+
+    def close(self) -> None:
+        if self._headers is None:
+            raise RtcFormatError('No headers to write.')
+        self._flush()
+        self._stream.write(_SIZE.pack(0))
+
+
+class RtcFileWriter(sii.ColumnsWriterInterface):
+    """Writer of .rtc files, model columns are written as is."""
+
+    def __init__(self, *, block_rows: int = RTC_BLOCK_ROWS) -> None:
+        self._block_rows = block_rows
+
+    @_starter
+    def write(
+            self,
+            settings: typing.Any,
+            *,
+            auto_closing: bool = False,
+            ) -> None:
+
+        with open(settings.path, 'wb') as file:
+            block = _BlockWriter(file, settings.name, self._block_rows)
+            while True:
+                try:
+                    line = yield
+                    if isinstance(line, list):
+                        block.add_rows((line,))
+                except StopIteration:
+                    block.close()
+
+    def write_rows(self, settings: typing.Any, rows: typing.Iterable) -> int:
+        with open(settings.path, 'wb') as file:
+            block = _BlockWriter(file, settings.name, self._block_rows)
+            block.add_rows(rows)
+            block.close()
+        return block.count
+
+    def write_columns(
+            self,
+            settings: typing.Any,
+            headers: typing.Sequence[str],
+            columns: typing.Sequence[typing.Sequence]
+            ) -> int:
+        rows = len(columns[0]) if columns else 0
+        with open(settings.path, 'wb') as file:
+            file.write(encode_meta(settings.name, headers))
+            for start in range(0, rows, self._block_rows):
+                stop = start + self._block_rows
+                file.write(encode_block([c[start:stop] for c in columns]))
+            file.write(_SIZE.pack(0))
+        return rows + 1
+
+
+def load_columns(path: str, **kwargs) -> typing.Tuple[dict, typing.List]:
+    """Meta and columns of .rtc file by path."""
+    with open(path, 'rb', buffering=RTC_READ_BUFFER) as file:
+        return read_columns(file, **kwargs)
+
+
+class RtcFileReader(sii.ModelReaderInterface):
+    """
+    Reader of .rtc snapshots: columns are set to model
+    as is, drivers and model.add_values aren`t used.
+    """
+
+    def __init__(self, *, intern_strings: bool = True) -> None:
+        self._intern = intern_strings
+
+    def read(self, settings: typing.Any) -> typing.Generator:
+        """Rows of file, first row is headers."""
+        with open(settings.path, 'rb', buffering=RTC_READ_BUFFER) as file:
+            meta = read_meta(file)
+            yield list(meta['headers'])
+            blocks = iter_blocks(
+                    file,
+                    len(meta['headers']),
+                    intern_strings=self._intern
+                    )
+            for block in blocks:
+                yield from map(list, zip(*block))
+
+    def read_model(
+            self,
+            settings: typing.Any,
+            model: typing.Any,
+            *,
+            max_rows: typing.Optional[int] = None
+            ) -> typing.Any:
+        meta, columns = load_columns(
+                settings.path,
+                max_rows=max_rows,
+                intern_strings=self._intern
+                )
+        model.restore(meta['headers'], columns)
+        return model
+
+
+def _decode_source(source: typing.Any) -> SourceState:
+    types = [type(item) for item in source] if isinstance(source, list) else []
+    if types != [str, str, int, str]:
+        raise RtcFormatError('Broken source state.')
+    return SourceState(*source)
+
+
+class RtcModelCodec:
+    """
+    Spill codec of system cache: model is kept as .rtc bytes
+    with its source state in meta, nothing is pickled.
+    """
+
+    def __init__(
+            self,
+            make_model: typing.Callable[[], typing.Any],
+            *,
+            block_rows: int = RTC_BLOCK_ROWS
+            ) -> None:
+        self._make_model = make_model
+        self._block_rows = block_rows
+
+    def dumps(self, model: typing.Any) -> bytes:
+        columns = model.columns
+        rows = len(columns[0]) if columns else 0
+        parts = [encode_meta(model.name, model.headers, source=model.source)]
+        for start in range(0, rows, self._block_rows):
+            stop = start + self._block_rows
+            parts.append(encode_block([c[start:stop] for c in columns]))
+        parts.append(_SIZE.pack(0))
+        return b''.join(parts)
+
+    def loads(self, data: bytes) -> typing.Any:
+        meta, columns = read_columns(io.BytesIO(data))
+        if not isinstance(meta.get('name'), str):
+            raise RtcFormatError('Meta has no name.')
+        model = self._make_model()
+        model.name = meta['name']
+        if meta['headers']:
+            model.restore(meta['headers'], columns)
+        if meta.get('source') is not None:
+            model.source = _decode_source(meta['source'])
+        return model
+
+
+__all__ = (
+        'RTC_MAGIC',
+        'RtcFormatError',
+        'RtcFileWriter',
+        'RtcFileReader',
+        'RtcModelCodec',
+        'encode_column',
+        'encode_block',
+        'encode_meta',
+        'read_meta',
+        'iter_blocks',
+        'read_columns',
+        'load_columns',
+        )
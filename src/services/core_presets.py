@@ -2,6 +2,8 @@ from core import io_adapters
 from core import sys_exceptions
 from core import domain_models
 from core import io_adapters
+from core import timings
+from core.cache import is_private_dir
 
 
 sys_io_interface = io_adapters
@@ -13,4 +15,6 @@ __all__ = [
         "sys_io_exceptions",
         "int_tabl_model",
         "io_adapters",
+        "timings",
+        "is_private_dir",
         ]
@@ -1,5 +1,8 @@
 import typing
+import re
+import copy
 import inspect
+import functools
 import abc
 
 import openpyxl as opxl
@@ -134,12 +137,46 @@ class DumpConfigurator(DumpSourceConfigurator, IOConfigurator):
         dummy.close = _close
         return self._driver, dummy
 
+    @property
+    def writes_columns(self) -> bool:
+        return isinstance(self._writer, ia.ColumnsWriterInterface)
+
+    def get_columns_writer(self) -> typing.Tuple[
+                                        ia.FileDriverInterface,
+                                        typing.Callable,
+                                        ]:
+        """Driver and writer of model columns."""
+        return self._driver, functools.partial(
+                self._writer.write_columns,
+                self._settings
+                )
+
+    def get_rows_writer(self) -> typing.Tuple[
+                                        ia.FileDriverInterface,
+                                        typing.Callable,
+                                        ]:
+        """Driver and writer of all rows by one call."""
+        return self._driver, functools.partial(
+                self._writer.write_rows,
+                self._settings
+                )
+
     def clean_setup(self) -> None:
         self._writer.close()
         self._settings = None
         self._driver = None
 
 
+class _ExportedRepo:
+    """Picklable repo of exported loader: items by key args."""
+
+    def __init__(self) -> None:
+        self.items: typing.Dict[tuple, typing.Any] = {}
+
+    def get_pattern(self, *key: typing.Any) -> typing.Any:
+        return self.items.get(key)
+
+
 class LoadConfigurator(LoadSourceConfigurator, IOConfigurator):
 
     def __init__(self,
@@ -150,6 +187,43 @@ class LoadConfigurator(LoadSourceConfigurator, IOConfigurator):
         self._settings = None
         self._driver = None
         self._reader = None
+        self._preset = None
+        # own copies of (driver, reader) by (suffix, mode), if forked.
+        self._sources: typing.Optional[typing.Dict[tuple, tuple]] = None
+
+    @property
+    def preset(self) -> typing.Optional[typing.Mapping]:
+        """Patterns map of flag from last setup."""
+        return self._preset
+
+    def export(
+            self,
+            settings: typing.Iterable[typing.Any]
+            ) -> 'LoadConfigurator':
+        """
+        New loader with readers and flag presets of settings
+        only, kept in plain dicts: it can be pickled to pool
+        workers, that are started without parent state.
+        """
+        readers, flags = _ExportedRepo(), _ExportedRepo()
+        for item in settings:
+            mode = getattr(item, 'load_mode', None)
+            reader = self._readers.get_pattern(item.suffix, mode)
+            readers.items[(item.suffix, mode)] = reader
+            preset = self._flags.get_pattern(item.flag)
+            if preset is not None:
+                flags.items[(item.flag, )] = dict(preset)
+        return LoadConfigurator(readers, flags)
+
+    def fork(self) -> 'LoadConfigurator':
+        """
+        New loader with the same repos, that sets up own copies
+        of drivers and readers: forked loaders don`t share
+        per file state, so they can load at the same time.
+        """
+        loader = LoadConfigurator(self._readers, self._flags)
+        loader._sources = {}
+        return loader
 
     def setup(self, settings: typing.Any) -> None:
         """
@@ -160,18 +234,44 @@ class LoadConfigurator(LoadSourceConfigurator, IOConfigurator):
         """
         pattern_builder = self._flags.get_pattern(settings.flag)
         if pattern_builder is not None:
-            driver, reader = self._readers.get_pattern(settings.suffix)
+            driver, reader = self._get_sources(
+                    settings.suffix,
+                    getattr(settings, 'load_mode', None)
+                    )
             self._reader = reader
             self._driver = driver
             self._driver.headers_preset = pattern_builder
             self._settings = settings
+            self._preset = pattern_builder
 
-    def get_load_sources(self) -> typing.Tuple[
-                                    ia.FileDriverInterface, typing.Callable
-                                    ]:
-        """Return Driver and func, that read data from reader."""
-
-        reader = self._reader.read(self._settings)
+    def _get_sources(
+            self,
+            suffix: str,
+            mode: typing.Any
+            ) -> typing.Tuple[ia.FileDriverInterface, typing.Any]:
+        sources = self._readers.get_pattern(suffix, mode)
+        if self._sources is None or sources is None:
+            return sources
+        key = (suffix, mode)
+        if key not in self._sources:
+            # per file state isn`t copied (see __getstate__).
+            self._sources[key] = copy.deepcopy(sources)
+        return self._sources[key]
+
+    def get_load_sources(
+            self,
+            *,
+            byte_range: typing.Optional[typing.Tuple[int, int]] = None
+            ) -> typing.Tuple[ia.FileDriverInterface, typing.Callable]:
+        """
+        Return Driver and func, that read data from reader.
+        If byte_range is set, only lines from range are read.
+        """
+        if byte_range is None:
+            reader = self._reader.read(self._settings)
+        else:
+            read_range = self._get_reader_method('read_range')
+            reader = read_range(self._settings, *byte_range)
 
         is_gen = inspect.isgenerator
         is_gen_func = inspect.isgeneratorfunction
@@ -190,10 +290,7 @@ class LoadConfigurator(LoadSourceConfigurator, IOConfigurator):
 
         def stop_loading() -> None:
             nonlocal reader
-            try:
-                reader.throw(StopIteration)
-            except StopIteration:
-                pass
+            reader.close()
 
         def dummy() -> None:
             """dummy for closure."""
@@ -203,6 +300,40 @@ class LoadConfigurator(LoadSourceConfigurator, IOConfigurator):
         dummy.stop_loading = stop_loading
         return self._driver, dummy
 
+    def split_source(self, chunk_size: int) -> typing.List[
+                                                    typing.Tuple[int, int]
+                                                    ]:
+        """
+        Split file to newline aligned byte ranges,
+        headers line isn`t included.
+        """
+        split = self._get_reader_method('split')
+        return split(self._settings, chunk_size)
+
+    @property
+    def reads_models(self) -> bool:
+        return isinstance(self._reader, ia.ModelReaderInterface)
+
+    @property
+    def reads_sheets(self) -> bool:
+        return getattr(self._reader, 'reads_sheets', False)
+
+    @property
+    def reads_ranges(self) -> bool:
+        return hasattr(self._reader, 'read_range')
+
+    def read_model(self, model: typing.Any, **kwargs) -> typing.Any:
+        """Fill model by reader, values aren`t parsed."""
+        return self._reader.read_model(self._settings, model, **kwargs)
+
+    def _get_reader_method(self, name: str) -> typing.Callable:
+        method = getattr(self._reader, name, None)
+        if method is None:
+            msg = f'Reader {self._reader.__class__.__name__} '\
+                  f'doesn`t support <{name}>.'
+            raise LoaderConfigError(msg)
+        return method
+
     def clean_setup(self) -> None:
         try:
             self._reader.close()
@@ -210,6 +341,7 @@ class LoadConfigurator(LoadSourceConfigurator, IOConfigurator):
             self._reader = None
             self._driver = None
             self._settings = None
+            self._preset = None
 
 
 class BaseDriver(DriverForLoadIntf, ia.FileDriverInterface):
@@ -233,6 +365,13 @@ class BaseDriver(DriverForLoadIntf, ia.FileDriverInterface):
         # validate
         self._headers_preset = preset
 
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        """Preset is set up per file, it isn`t sent to pool workers."""
+        state = self.__dict__.copy()
+        state['_headers_preset'] = None
+        state['_errors'] = []
+        return state
+
     @abc.abstractmethod
     def fetch_values(self, item: str) -> typing.NoReturn:
         """NotImplemented."""
@@ -256,6 +395,7 @@ class BaseDriver(DriverForLoadIntf, ia.FileDriverInterface):
         if self._errors:
             for e in self._errors:
                 self._logger.warning(e)
+            self._errors.clear()
 
 
 class ExcelSaveDriver(DriverForSaveIntf, ia.FileDriverInterface):
@@ -268,6 +408,28 @@ class ExcelSaveDriver(DriverForSaveIntf, ia.FileDriverInterface):
         return line
 
 
+class SnapshotDriver(ia.FileDriverInterface):
+    """
+    Driver for snapshots of parsed models: values are
+    parsed already, so preset is only kept.
+    """
+
+    def __init__(self, logger: typing.Any) -> None:
+        self._logger = logger
+        self._headers_preset = None
+
+    @property
+    def headers_preset(self) -> typing.List[str]:
+        return self._headers_preset
+
+    @headers_preset.setter
+    def headers_preset(self, preset: typing.List[str]) -> None:
+        self._headers_preset = preset
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        return {**self.__dict__, '_headers_preset': None}
+
+
 class TxtDriver(BaseDriver):
     """ Driver for .txt files."""
     def __init__(self,
@@ -277,10 +439,65 @@ class TxtDriver(BaseDriver):
         self._logger = logger
         self._headers_preset = None
         self._errors = []
+        self._plan = None
+        self._plans = {}
+
+    @property
+    def headers_preset(self) -> typing.List[str]:
+        """List of headers is a preset."""
+        return self._headers_preset
+
+    @headers_preset.setter
+    def headers_preset(self, preset: typing.List[str]) -> None:
+        self._headers_preset = preset
+        self._plan = self._get_line_plan(preset)
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        state = super().__getstate__()
+        state['_plan'] = None
+        state['_plans'] = {}
+        return state
+
+    def _get_line_plan(
+            self,
+            preset: typing.Any
+            ) -> typing.Optional['TxtLinePlan']:
+        """Line plan is built once per preset."""
+        if preset is None:
+            return None
+        key = id(preset)
+        if key not in self._plans:
+            self._plans[key] = (preset, TxtLinePlan.build(preset))
+        _, plan = self._plans[key]
+        return plan
 
     def fetch_values(self, item: str) -> typing.List[str]:
 
         self.validate(item)
+        if self._plan is None:
+            return self._fetch_values_by_headers(item)
+
+        values = []
+        matched = self._plan.match(item, self._compiler)
+        for idx, (header, fetched_value) in enumerate(matched):
+            if isinstance(fetched_value, CompilerError):
+                err_msg = f'Expected error: {fetched_value} on pos {idx}, '\
+                          f'item: {header} line:\n\t{item}.\n'
+                self._errors.append(err_msg)
+                fetched_value = None
+
+            if fetched_value is None:
+                msg = f'[-] Value for header <{header}> not found. '\
+                      f'Check with exact file. Header pos: {idx}.'
+                fetched_value = msg
+
+            values.append(fetched_value)
+
+        self._handle_errors()
+        return values
+
+    def _fetch_values_by_headers(self, item: str) -> typing.List[str]:
+        """Per header loop, one compiler call for each header."""
 
         values = []
         for idx, header in enumerate(self._headers_preset):
@@ -496,7 +713,7 @@ class BaseExcelCompiler(_Compiler):
         positions = []
 
         for idx, cell in enumerate(item):
-            header = cell.value
+            header = self._cell_value(cell)
             if header:
                 header = header.upper()
                 if header in headers_names:
@@ -526,9 +743,12 @@ class BaseExcelCompiler(_Compiler):
         return ''
 
     def _convert_value(self, cell: opxl.cell) -> str:
-        value = cell.value
+        value = self._cell_value(cell)
         return value
 
+    def _cell_value(self, cell: opxl.cell) -> typing.Any:
+        return cell.value
+
 
 class ExcelCompiler(BaseExcelCompiler):
 
@@ -537,6 +757,21 @@ class ExcelCompiler(BaseExcelCompiler):
         return self._pattern
 
 
+class ExcelValuesCompiler(BaseExcelCompiler):
+    """
+    Compiler for rows of plain values (values_only reading),
+    comments aren`t available, so they never fetched.
+    """
+
+    @property
+    def pattern(self) -> typing.Tuple[bool, int]:
+        _, positions = self._pattern
+        return False, positions
+
+    def _cell_value(self, cell: typing.Any) -> typing.Any:
+        return cell
+
+
 class TxtCompiler(BaseTxtCompiler):
 
     @property
@@ -546,3 +781,169 @@ class TxtCompiler(BaseTxtCompiler):
     @pattern.setter
     def pattern(self, value: typing.Any) -> None:
         self._pattern = value
+
+
+class TxtLinePlan:
+    """
+    Compiled line plan for a txt headers preset.
+    All header patterns are joined in one regex, where
+    every header is an optional lookahead with alternation
+    of its patterns (in preset order), so all columns
+    are fetched by a single match() call per line.
+    Headers, which patterns can`t be joined (numeric backrefs,
+    no named groups, etc.) are compiled by the per pattern loop.
+    """
+
+    _group_name: typing.Final[re.Pattern] = re.compile(
+            r'\(\?P(?P<kind>[<=])(?P<name>\w+)(?P<end>[>)])'
+            )
+    _global_flags: typing.Final[re.Pattern] = re.compile(
+            r'^\(\?(?P<flags>[aiLmsux]+)\)'
+            )
+    _numeric_backref: typing.Final[re.Pattern] = re.compile(
+            r'(?<!\\)\\[1-9]'
+            )
+    _inline_flags: typing.Final[typing.Dict[str, int]] = {
+            'a': re.ASCII,
+            'i': re.IGNORECASE,
+            'L': re.LOCALE,
+            'm': re.MULTILINE,
+            's': re.DOTALL,
+            'u': re.UNICODE,
+            'x': re.VERBOSE,
+            }
+
+    @classmethod
+    def build(cls, preset: typing.Mapping[str, list]) -> 'TxtLinePlan':
+        return cls(preset)
+
+    def __init__(self, preset: typing.Mapping[str, list]) -> None:
+        self._headers = []
+        self._slots = []
+        self._regex = None
+        parts = []
+        for h_idx, header in enumerate(preset):
+            patterns = list(preset[header])
+            self._headers.append((header, patterns))
+            part = self._join_header_patterns(h_idx, patterns)
+            if part is None:
+                self._slots.append(None)
+            else:
+                parts.append(part)
+                self._slots.append(h_idx)
+        if parts:
+            try:
+                self._regex = re.compile(''.join(parts))
+            except re.error:
+                self._slots = [None] * len(self._headers)
+        self._resolve_slots()
+
+    @property
+    def combined(self) -> bool:
+        """True if at least one header is fetched in a single pass."""
+        return self._regex is not None
+
+    def _join_header_patterns(
+            self,
+            h_idx: int,
+            patterns: typing.List[re.Pattern]
+            ) -> typing.Optional[str]:
+        """Return '(?:(?=(?:p1)(?P<m>)|(?:p2)(?P<m>))|)' or None."""
+        if not patterns:
+            return None
+        alternatives = []
+        for p_idx, pattern in enumerate(patterns):
+            source = self._rename_groups(h_idx, p_idx, pattern)
+            if source is None:
+                return None
+            marker = f'(?P<_m{h_idx}_{p_idx}>)'
+            alternatives.append(f'(?:{source}){marker}')
+        try:
+            for alt in alternatives:
+                re.compile(alt)
+        except re.error:
+            return None
+        return '(?:(?={})|)'.format('|'.join(alternatives))
+
+    def _rename_groups(
+            self,
+            h_idx: int,
+            p_idx: int,
+            pattern: re.Pattern
+            ) -> typing.Optional[str]:
+        source = pattern.pattern
+        if not isinstance(source, str) or not pattern.groupindex:
+            return None
+        if self._numeric_backref.search(source):
+            return None
+
+        inline = 0
+        flags = self._global_flags.match(source)
+        if flags:
+            for symb in flags.group('flags'):
+                inline |= self._inline_flags[symb]
+            source = '(?{}:{})'.format(
+                    flags.group('flags'),
+                    source[flags.end():]
+                    )
+        if pattern.flags & ~re.UNICODE != inline & ~re.UNICODE:
+            return None
+
+        def _rename(mth: re.Match) -> str:
+            name = f'_g{h_idx}_{p_idx}_{mth.group("name")}'
+            return f'(?P{mth.group("kind")}{name}{mth.group("end")}'
+
+        return self._group_name.sub(_rename, source)
+
+    def _resolve_slots(self) -> None:
+        """Map every header to [(marker idx, value idx), ...]."""
+        resolved = []
+        for h_idx, slot in enumerate(self._slots):
+            if slot is None or self._regex is None:
+                resolved.append(None)
+                continue
+            _, patterns = self._headers[h_idx]
+            pairs = []
+            for p_idx, pattern in enumerate(patterns):
+                first = min(pattern.groupindex, key=pattern.groupindex.get)
+                value = self._regex.groupindex[f'_g{h_idx}_{p_idx}_{first}']
+                marker = self._regex.groupindex[f'_m{h_idx}_{p_idx}']
+                pairs.append((marker - 1, value - 1))
+            resolved.append(tuple(pairs))
+        self._slots = resolved
+
+    def match(
+            self,
+            item: str,
+            compiler: 'BaseTxtCompiler'
+            ) -> typing.List[typing.Tuple[str, typing.Any]]:
+        """
+        Return [(header, value), ...] in preset order.
+        Value is None if pattern matched without value
+        or CompilerError if no one pattern matched.
+        """
+        groups = None
+        if self._regex is not None:
+            groups = self._regex.match(item).groups()
+
+        result = []
+        for (header, patterns), slots in zip(self._headers, self._slots):
+            value = None
+            if slots is None:
+                compiler.pattern = patterns
+                try:
+                    value = compiler.compile_values(item)
+                except CompilerError as e:
+                    value = e
+            else:
+                for marker, value_idx in slots:
+                    if groups[marker] is not None:
+                        value = groups[value_idx]
+                        break
+                else:
+                    err_msg = f'Unknown item format: {item} '\
+                              f'{compiler.__class__.__name__} can`t parse '\
+                              f'it.\nCurrent pattern: {patterns[-1]}.'
+                    value = CompilerError(err_msg)
+            result.append((header, value))
+        return result
@@ -0,0 +1,200 @@
+"""
+Persistent cache of parse results. Models are stored as .rtc
+snapshots in directory, file name is made from digest of flag
+preset (headers and regexes) and file identity: path, size and
+mtime, or content hash. Changed file or changed patterns in .env
+give new name, so stale snapshot is never loaded. Directory
+is created private (0o700); directory of other user or writable
+by others isn`t used, so nobody can plant snapshots.
+"""
+import os
+import re
+import typing
+import hashlib
+import threading
+
+from . import columnar
+from .core_presets import timings
+from .core_presets import is_private_dir
+
+
+# change to drop snapshots made by previous parsing code.
+PARSE_CACHE_VERSION: int = 1
+HASH_CHUNK_SIZE: int = 2 ** 20
+_SUFFIX: typing.Final[str] = '.rtc'
+_TMP_SUFFIX: typing.Final[str] = '.tmp'
+
+
+class _Snapshot(typing.NamedTuple):
+    name: str
+    path: str
+
+
+def preset_digest(
+        preset: typing.Mapping[str, typing.List[re.Pattern]]
+        ) -> str:
+    """Digest of headers and their patterns."""
+    digest = hashlib.sha1(f'v{PARSE_CACHE_VERSION}'.encode())
+    for header, patterns in preset.items():
+        digest.update(f'\0{header}'.encode())
+        for item in patterns:
+            digest.update(f'\1{item.pattern}\2{item.flags}'.encode())
+    return digest.hexdigest()[:16]
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    Directory of parsed models. Least recently used
+    snapshots are removed, when max_bytes is exceeded.
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            *,
+            max_bytes: typing.Optional[int] = None,
+            by_content: bool = False
+            ) -> None:
+        self._directory = os.path.expanduser(directory)
+        self._max_bytes = max_bytes if max_bytes and max_bytes > 0 else None
+        self._by_content = by_content
+        self._reader = columnar.RtcFileReader()
+        self._writer = columnar.RtcFileWriter()
+        self.hits = 0
+        self.misses = 0
+
+    def key(
+            self,
+            settings: typing.Any,
+            preset: typing.Mapping[str, typing.List[re.Pattern]],
+            *,
+            by_name: bool = False
+            ) -> typing.Optional[str]:
+        """
+        Key of file state and preset, None if file isn`t found.
+        by_name - reader picks sheet by name: name is in key.
+        """
+        try:
+            stat = os.stat(settings.path)
+            parts = [settings.suffix, getattr(settings, 'load_mode', '')]
+            if by_name:
+                parts.append(f'sheet:{settings.name}')
+            if self._by_content:
+                parts.append(_file_digest(settings.path))
+            else:
+                parts.extend((
+                    os.path.abspath(settings.path),
+                    stat.st_size,
+                    stat.st_mtime_ns
+                    ))
+        except OSError:
+            return None
+        state = '\0'.join(str(part) for part in parts)
+        file_key = hashlib.sha1(state.encode()).hexdigest()[:24]
+        return f'{preset_digest(preset)}-{file_key}'
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + _SUFFIX)
+
+    def _is_private(self) -> bool:
+        return is_private_dir(self._directory)
+
+    @timings.timed('parse_cache.get')
+    def get(self, key: str, model: typing.Any) -> typing.Optional[typing.Any]:
+        """Fill model from snapshot, None on miss."""
+        if not self._is_private():
+            self.misses += 1
+            return None
+        path = self._path(key)
+        try:
+            model = self._reader.read_model(_Snapshot(model.name, path), model)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, columnar.RtcFormatError, ValueError):
+            # broken snapshot: parse again.
+            self._remove(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return model
+
+    @timings.timed('parse_cache.put')
+    def put(self, key: str, model: typing.Any) -> None:
+        if model.empty:
+            return None
+        os.makedirs(self._directory, mode=0o700, exist_ok=True)
+        if not self._is_private():
+            return None
+        path = self._path(key)
+        # one file can be loaded by threads and pool workers at once.
+        owner = f'.{os.getpid()}-{threading.get_ident()}'
+        tmp_path = path + owner + _TMP_SUFFIX
+        try:
+            self._writer.write_columns(
+                    _Snapshot(model.name, tmp_path),
+                    model.headers,
+                    model.columns
+                    )
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        self._evict(keep=path)
+
+    def _entries(self) -> typing.List[os.DirEntry]:
+        try:
+            with os.scandir(self._directory) as entries:
+                return [e for e in entries if e.name.endswith(_SUFFIX)]
+        except FileNotFoundError:
+            return []
+
+    def _evict(self, *, keep: str) -> None:
+        if self._max_bytes is None:
+            return None
+        entries = sorted(self._entries(), key=lambda e: e.stat().st_mtime)
+        total = sum(e.stat().st_size for e in entries)
+        for entry in entries:
+            if total <= self._max_bytes:
+                break
+            if entry.path != keep:
+                total -= entry.stat().st_size
+                self._remove(entry.path)
+
+    def prune(self, presets: typing.Iterable[typing.Mapping]) -> int:
+        """
+        Remove snapshots made with other presets (patterns
+        in .env were changed). Return removed count.
+        """
+        digests = {preset_digest(preset) for preset in presets}
+        removed = 0
+        for entry in self._entries():
+            if entry.name.split('-', 1)[0] not in digests:
+                self._remove(entry.path)
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        return self.prune(())
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+__all__ = (
+        'ParseCache',
+        'preset_digest',
+        )
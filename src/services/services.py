@@ -1,14 +1,197 @@
+import io
+import csv
+import os
+import re
+import mmap
+import locale
+import hashlib
+import zipfile
+import contextlib
+import tempfile
+import threading
 import typing
 import abc
 import functools
+import itertools
 import collections
+import multiprocessing
+import concurrent.futures as futures
 
 import openpyxl as oppxl
+from openpyxl.cell.read_only import EMPTY_CELL
 
 from .core_presets import sys_io_interface as sii
 from .core_presets import sys_io_exceptions as sie
 from .core_presets import int_tabl_model as itm
+from .core_presets import timings
 from .drivers import LoaderConfigError
+from . import xlsx_writer as xlw
+
+
+# .csv writer: files are opened with big buffer.
+CSV_BUFFER_SIZE: int = 2 ** 20
+CSV_DELIMITER: str = ','
+CSV_ENCODING: str = 'utf-8'
+# rows count in one batch of streaming load.
+STREAM_BATCH_SIZE: int = 1024
+# mmap txt reader decodes only lines with $ or digit.
+MMAP_PREFILTER: bytes = rb'[$\d]'
+# bytes in one range of chunked parallel load.
+PARALLEL_CHUNK_SIZE: int = 8 * 2 ** 20
+# start methods of pool, first supported is used. Workers get
+# picklable loader setup, threads of parent are never forked.
+POOL_START_METHODS: typing.Tuple[str, ...] = ('forkserver', 'spawn')
+# parsed prefix of text file is compared by digest before tail parsing.
+SOURCE_DIGEST_SIZE: int = 16
+SOURCE_HASH_CHUNK: int = 2 ** 20
+
+
+class LoadResult(typing.NamedTuple):
+    """Result of one file loading in load_many."""
+    settings: typing.Any
+    model: typing.Optional[itm.TableSheetModel] = None
+    errors: typing.Tuple[str, ...] = ()
+    failure: typing.Optional[str] = None
+
+
+class SourceState(typing.NamedTuple):
+    """
+    Parsed part of text file: bytes before offset
+    (whole lines) with digest. Lines appended later
+    are parsed from offset.
+    """
+    path: str
+    flag: str
+    offset: int
+    digest: str
+
+
+def _hash_lines(
+        path: str,
+        start: int,
+        end: int,
+        digest: typing.Any
+        ) -> bool:
+    """
+    Update digest by bytes [start, end) of file. Return False,
+    if file is shorter or bytes don`t end by newline.
+    """
+    last = b''
+    with open(path, 'rb') as file:
+        file.seek(start)
+        left = end - start
+        while left > 0:
+            chunk = file.read(min(left, SOURCE_HASH_CHUNK))
+            if not chunk:
+                return False
+            digest.update(chunk)
+            left -= len(chunk)
+            last = chunk[-1:]
+    return last == b'\n' or start == end
+
+
+def _lines_end(path: str, start: int, end: int) -> int:
+    """
+    End of whole lines in bytes [start, end) of file: position
+    after last newline, start if range has no newline.
+    """
+    with open(path, 'rb') as file:
+        while end > start:
+            begin = max(start, end - SOURCE_HASH_CHUNK)
+            file.seek(begin)
+            chunk = file.read(end - begin)
+            newline = chunk.rfind(b'\n')
+            if newline >= 0:
+                return begin + newline + 1
+            end = begin
+    return start
+
+
+def _locked(*names: str) -> typing.Callable:
+    """Call adapter method under adapter locks, in order of names."""
+    def decorator(method: typing.Callable) -> typing.Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs) -> typing.Any:
+            with contextlib.ExitStack() as stack:
+                for name in names:
+                    stack.enter_context(getattr(self, name))
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _WorkerSetup(typing.NamedTuple):
+    """Picklable state of pool worker adapter."""
+    loader: typing.Any
+    model: itm.TableSheetModel
+    parse_cache: typing.Optional[typing.Any] = None
+
+
+# adapter used by pool worker process, set by initializer.
+_worker_port: typing.Optional['BaseFileIOAdapter'] = None
+
+
+def _init_worker(setup: _WorkerSetup) -> None:
+    global _worker_port
+    # worker only loads: it has no dumper.
+    _worker_port = BaseFileIOAdapter(
+            setup.loader,
+            None,
+            setup.model,
+            parse_cache=setup.parse_cache
+            )
+
+
+def _describe_error(err: BaseException) -> str:
+    cause = err.__cause__ or err.__context__
+    if cause is not None and not str(err):
+        return f'{err.__class__.__name__}: {cause!r}'
+    return repr(err)
+
+
+def _load_in_worker(read_params: typing.Any) -> LoadResult:
+    return _worker_port.load_one(read_params)
+
+
+def _fetch_in_worker(
+        read_params: typing.Any,
+        byte_range: typing.Tuple[int, int]
+        ) -> typing.Tuple[list, list]:
+    return _worker_port.fetch_range(read_params, byte_range)
+
+
+def _pool_context() -> typing.Optional[typing.Any]:
+    methods = multiprocessing.get_all_start_methods()
+    for method in POOL_START_METHODS:
+        if method in methods:
+            return multiprocessing.get_context(method)
+    return None
+
+
+def _make_pool(
+        port: 'BaseFileIOAdapter',
+        read_params: typing.Sequence[typing.Any],
+        workers: int
+        ) -> typing.Optional[futures.ProcessPoolExecutor]:
+    """
+    Return pool of workers, that load read_params, or None,
+    if pool isn`t needed. Workers get loader exported for
+    read_params, not the live adapter.
+    """
+    context = _pool_context()
+    if workers <= 1 or context is None:
+        return None
+    setup = _WorkerSetup(
+            port._loader.export(read_params),
+            port._model,
+            port._parse_cache
+            )
+    return futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(setup, )
+            )
 
 
 class FileIoInterface(abc.ABC):
@@ -61,146 +244,83 @@ def _starter(
     return wrapper
 
 
-class _ExcelPostLoader:
+def _cell_value(cell: typing.Any) -> typing.Any:
+    return cell.value
 
-    def __init__(self) -> None:
-        self._active = False
-        self._max_idx = None
 
-    @property
-    def active(self) -> bool:
-        return self._active
+def _plain_value(value: typing.Any) -> typing.Any:
+    return value
 
-    def validate_first(
-            self,
-            line: typing.Tuple[typing.Any]
-            ) -> None:
-        if not self._first_item(line):
-            msg = 'Value in first sheet cell not found'
-            raise Exception(msg)
-
-    def analyse_borders_equality(
-            self,
-            line: typing.Tuple[typing.Any],
-            max_line_pos: int
-            ) -> bool:
-        self._max_idx = self._find_max_index(line)
-        return self._max_idx == len(line) - 1
-
-    def activate_postprocessing(self) -> None:
-        self._active = True
-
-    def deactivate_postprocessing(self) -> None:
-        self._active = False
-
-    def _first_item(
-            self,
-            line: typing.Tuple[typing.Any]
-            ) -> bool:
-
-        first = 0
-        if line[first].value:
-            return True
-        return False
-
-    def _last_item(
-            self,
-            line: typing.Tuple[typing.Any]
-            ) -> bool:
-
-        last = -1
-        if line[last].value:
-            return True
-        return False
-
-    def _find_max_index(
-            self,
-            line: typing.Tuple[typing.Any]
-            ) -> int:
 
-        x, dx = 0, len(line) - 1
-        indexes = []
-
-        while True:
-            px = x + (dx - x) // 2
-            if line[px].value:
-                indexes.append(px)
-            else:
-                dx = px
-                x = 0
-                continue
-
-            if x == px:
-                return max(indexes)
-            x = px
-
-    def load(
-            self,
-            line: typing.Any
-            ) -> typing.Tuple[typing.Any]:
-
-        def _wrapped_loader(
-                line: typing.Tuple[str]
-                ) -> typing.Tuple[typing.Any]:
-
-            checked_cells = []
-            border = self._max_idx + 1
-
-            for item in line[:border]:
-                result = item.value is not None
-                checked_cells.append(result)
-
-            if any(checked_cells):
-                return line[:border]
-            else:
-                raise StopIteration from None
+class ExcelFileReader(sii.FileReaderInterface):
+    """
+    Excel reader, yields rows of cells. With values_only
+    book is read only and rows are tuples of values
+    (no cell objects, no comments), they are compiled
+    by ExcelValuesCompiler.
+    Sheet dimensions aren`t used (they may be wrong in
+    read only books): rows width is a width of headers
+    row, rows are read up to first blank row.
+    """
 
-        def _base_loader(
-                line: typing.Tuple[str]
-                ) -> typing.Tuple[typing.Any]:
-            return line
+    reads_sheets: bool = True
 
-        if self._active:
-            return _wrapped_loader(line)
-        return _base_loader(line)
+    def __init__(self, *, values_only: bool = False) -> None:
+        self._values_only = values_only
+        self._value = _plain_value if values_only else _cell_value
+        self._filler = None if values_only else EMPTY_CELL
 
+    def read(self, settings: typing.Any) -> typing.Generator:
+        # cells aren`t needed for values, so book is read only.
+        book = oppxl.load_workbook(settings.path,
+                                   read_only=settings.mode
+                                   or self._values_only)
+        try:
+            sheet = self._set_active_sheet(book, settings.name)
+            yield from self._read_rows(sheet)
+        finally:
+            book.close()
+
+    def _read_rows(self, sheet: typing.Any) -> typing.Generator:
+        if hasattr(sheet, 'reset_dimensions'):
+            # read only sheet: rows are parsed as they are in file.
+            sheet.reset_dimensions()
+        rows = sheet.iter_rows(values_only=self._values_only)
+        yield from self._shape_rows(rows)
+
+    def _shape_rows(self, rows: typing.Iterator[tuple]) -> typing.Generator:
+        """Cut rows by headers width, stop on first blank row."""
+        headers = next(rows, None)
+        if headers is None:
+            return
+        self._validate_first(headers)
+        width = self._find_width(headers)
+        yield tuple(headers[:width])
+
+        padding = (self._filler,) * width
+        for row in rows:
+            row = tuple(row[:width])
+            if len(row) < width:
+                row += padding[len(row):]
+            if self._is_blank(row):
+                break
+            yield row
 
-class ExcelFileReader(sii.FileReaderInterface):
+    def _validate_first(self, row: typing.Sequence[typing.Any]) -> None:
+        if not row or not self._value(row[0]):
+            msg = 'Value in first sheet cell not found'
+            raise Exception(msg)
 
-    def read(self, settings: typing.Any) -> oppxl.Workbook:
-        book = oppxl.load_workbook(settings.path,
-                                   read_only=settings.mode)
-        sheet = self._set_active_sheet(book, settings.name)
-        max_col, max_row = self._calculate_dims(sheet)
-
-        need_postload_check = True
-        postloader = None
-
-        for row in sheet.iter_rows(
-                max_row=max_row,
-                max_col=max_col
-                ):
-            if need_postload_check:
-                postloader = _ExcelPostLoader()
-                postloader.validate_first(row)
-                all_cells_valid = postloader.analyse_borders_equality(
-                        row,
-                        max_col
-                        )
-                if not all_cells_valid:
-                    postloader.activate_postprocessing()
-                need_postload_check = False
-
-            if postloader is None or not postloader.active:
-                yield row
-            else:
-                try:
-                    yield postloader.load(row)
-                except StopIteration:
-                    break
+    def _find_width(self, row: typing.Sequence[typing.Any]) -> int:
+        """Width is a position of last not empty header."""
+        for idx in range(len(row) - 1, -1, -1):
+            if self._value(row[idx]) is not None:
+                return idx + 1
+        return 0
 
-        if postloader:
-            postloader.deactivate_postprocessing()
+    def _is_blank(self, row: typing.Sequence[typing.Any]) -> bool:
+        value = self._value
+        return all(value(item) is None for item in row)
 
     def _set_active_sheet(
             self,
@@ -214,13 +334,6 @@ class ExcelFileReader(sii.FileReaderInterface):
             return book[sheetname]
         return book.active
 
-    def _calculate_dims(
-            self,
-            sheet: typing.Any
-            ) -> typing.Tuple[int, int]:
-
-        return sheet.max_column, sheet.max_row
-
 
 class TxtFileReader(sii.FileReaderInterface):
     """
@@ -235,8 +348,111 @@ class TxtFileReader(sii.FileReaderInterface):
             for line in file:
                 yield line
 
+    def read_range(
+            self,
+            settings: typing.Any,
+            start: int,
+            end: int
+            ) -> typing.Generator:
+        """Read lines from byte range, range starts from new line."""
+        with open(settings.path, 'rb') as file:
+            file.seek(start)
+            data = file.read(end - start)
+        # decoding and newlines are the same as in read().
+        with io.TextIOWrapper(io.BytesIO(data)) as text:
+            for line in text:
+                yield line
+
+    def split(
+            self,
+            settings: typing.Any,
+            chunk_size: int,
+            *,
+            skip_lines: int = 1
+            ) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Split file to byte ranges about chunk_size bytes,
+        each range ends by new line. First skip_lines
+        lines (headers) aren`t included.
+        """
+        ranges = []
+        with open(settings.path, 'rb') as file:
+            for _ in range(skip_lines):
+                file.readline()
+            start = file.tell()
+            size = os.fstat(file.fileno()).st_size
+            while start < size:
+                file.seek(start + max(chunk_size, 1) - 1)
+                file.readline()
+                end = min(file.tell(), size)
+                ranges.append((start, end))
+                start = end
+        return ranges
+
+
+class MmapTxtFileReader(TxtFileReader):
+    """
+    Txt reader over memory mapped file. Lines are found
+    in mapped buffer and only lines passed prefilter
+    (with $ or digit by default) are decoded, first
+    skip_lines lines (headers) are passed always.
+    """
+
+    def __init__(
+            self,
+            prefilter: bytes = MMAP_PREFILTER,
+            *,
+            encoding: typing.Optional[str] = None,
+            skip_lines: int = 1
+            ) -> None:
+        # runs of passed lines, each run is decoded at once.
+        self._lines = re.compile(
+                rb'(?m)^(?:[^\n]*?(?:' + prefilter + rb')[^\n]*(?:\n|\Z))+'
+                )
+        self._encoding = encoding or locale.getpreferredencoding(False)
+        self._skip_lines = skip_lines
+
+    def read(
+            self,
+            settings: typing.Any
+            ) -> typing.Generator:
+        with open(settings.path, 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                yield from self._read_lines(buf)
+
+    def _read_lines(self, buf: mmap.mmap) -> typing.Generator:
+        pos = 0
+        for _ in range(self._skip_lines):
+            end = buf.find(b'\n', pos)
+            end = len(buf) if end < 0 else end + 1
+            if pos == end:
+                return
+            yield self._decode(buf[pos:end])
+            pos = end
+
+        for match in self._lines.finditer(buf, pos):
+            yield from self._decode_lines(match.group())
+
+    def _decode(self, line: bytes) -> str:
+        # newlines like in text mode open().
+        if line.endswith(b'\r\n'):
+            line = line[:-2] + b'\n'
+        return line.decode(self._encoding)
+
+    def _decode_lines(self, lines: bytes) -> typing.Iterator[str]:
+        if lines.count(b'\n') <= 1:
+            return (self._decode(lines),)
+        return io.TextIOWrapper(io.BytesIO(lines), encoding=self._encoding)
+
 
 class ExcelFileWriter(sii.FileWriterInterface):
+    """
+    Rows are streamed through write-only workbook. If file
+    exists, new sheet is added on zip level, other sheets
+    aren`t loaded.
+    """
 
     def __init__(self) -> None:
         self._wb = None
@@ -249,10 +465,7 @@ class ExcelFileWriter(sii.FileWriterInterface):
             auto_closing: bool = False,
             ) -> None:
 
-        sheet = None
-        self._configure_workbook(settings)
-        if self._wb:
-            sheet = self._get_worksheet(settings.name)
+        sheet = self._create_sheet(settings)
 
         while True:
             try:
@@ -260,31 +473,60 @@ class ExcelFileWriter(sii.FileWriterInterface):
                 if isinstance(line, list):
                     sheet.append(line)
             except StopIteration:
-                self._save(settings.path)
+                self._save(settings)
         else:
             if auto_closing:
                 self.close()
 
-    def _configure_workbook(self, settings: typing.Any) -> None:
-        if not isinstance(self._wb, oppxl.Workbook):
+    def write_rows(self, settings: typing.Any, rows: typing.Iterable) -> int:
+        """Write rows without generator send() per row."""
+        append = self._create_sheet(settings).append
+        count = 0
+        try:
+            for count, row in enumerate(rows, 1):
+                append(row)
+            self._save(settings)
+        finally:
+            self.close()
+        return count
+
+    def _create_sheet(self, settings: typing.Any) -> typing.Any:
+        self._wb = oppxl.Workbook(write_only=True)
+        return self._wb.create_sheet(settings.name)
+
+    def _save(self, settings: typing.Any) -> None:
+        if not zipfile.is_zipfile(settings.path):
+            self._wb.save(settings.path)
+            return
+
+        fd, new_book = tempfile.mkstemp(
+                suffix=settings.suffix,
+                dir=os.path.dirname(os.path.abspath(settings.path))
+                )
+        os.close(fd)
+        try:
+            self._wb.save(new_book)
             try:
-                self._wb = oppxl.load_workbook(
-                                filename=settings.path,
-                                )
-            except Exception:
-                pass
-            finally:
-                if self._wb is None:
-                    self._wb = oppxl.Workbook(write_only=settings.mode)
-
-    def _get_worksheet(self, name: str) -> typing.Any:
-        if name not in self._wb.sheetnames:
-            return self._wb.create_sheet(name)
+                xlw.append_sheet(settings.path, new_book, settings.name)
+            except xlw.XlsxMergeError:
+                self._append_by_reload(settings, new_book)
+        finally:
+            os.remove(new_book)
+
+    def _append_by_reload(self, settings: typing.Any, new_book: str) -> None:
+        """Slow way: existing sheet or unusual book."""
+        book = oppxl.load_workbook(filename=settings.path)
+        if settings.name not in book.sheetnames:
+            sheet = book.create_sheet(settings.name)
         else:
-            return self._wb[name]
-
-    def _save(self, path: str) -> None:
-        self._wb.save(path)
+            sheet = book[settings.name]
+        rows = oppxl.load_workbook(filename=new_book, read_only=True)
+        try:
+            for row in rows.active.iter_rows(values_only=True):
+                sheet.append(row)
+        finally:
+            rows.close()
+        book.save(settings.path)
 
     def close(self) -> None:
         try:
@@ -294,6 +536,80 @@ class ExcelFileWriter(sii.FileWriterInterface):
         self._wb = None
 
 
+class _CountedRows:
+    """Rows iterator, that counts passed rows."""
+
+    def __init__(self, rows: typing.Iterable) -> None:
+        self._rows = iter(rows)
+        self.count = 0
+
+    def __iter__(self) -> '_CountedRows':
+        return self
+
+    def __next__(self) -> typing.Any:
+        row = next(self._rows)
+        self.count += 1
+        return row
+
+
+class CsvFileWriter(sii.ColumnsWriterInterface):
+    """Buffered .csv writer, file is rewritten."""
+
+    def __init__(
+            self,
+            *,
+            delimiter: str = CSV_DELIMITER,
+            encoding: str = CSV_ENCODING
+            ) -> None:
+        self._delimiter = delimiter
+        self._encoding = encoding
+
+    def _open(self, path: str) -> typing.TextIO:
+        return open(
+                path,
+                'w',
+                newline='',
+                encoding=self._encoding,
+                buffering=CSV_BUFFER_SIZE
+                )
+
+    @_starter
+    def write(
+            self,
+            settings: typing.Any,
+            *,
+            auto_closing: bool = False,
+            ) -> None:
+
+        with self._open(settings.path) as file:
+            writer = csv.writer(file, delimiter=self._delimiter)
+            while True:
+                try:
+                    line = yield
+                    if isinstance(line, list):
+                        writer.writerow(line)
+                except StopIteration:
+                    file.flush()
+
+    def write_rows(self, settings: typing.Any, rows: typing.Iterable) -> int:
+        counted = _CountedRows(rows)
+        with self._open(settings.path) as file:
+            csv.writer(file, delimiter=self._delimiter).writerows(counted)
+        return counted.count
+
+    def write_columns(
+            self,
+            settings: typing.Any,
+            headers: typing.Sequence[str],
+            columns: typing.Sequence[typing.Sequence]
+            ) -> int:
+        with self._open(settings.path) as file:
+            writer = csv.writer(file, delimiter=self._delimiter)
+            writer.writerow(headers)
+            writer.writerows(zip(*columns))
+        return (len(columns[0]) if columns else 0) + 1
+
+
 class BaseFileIOAdapter(FileIoInterface):
 
     def __init__(
@@ -301,11 +617,40 @@ class BaseFileIOAdapter(FileIoInterface):
             loader: typing.Any,
             dumper: typing.Any,
             model: itm.TableSheetModel,
+            *,
+            parse_cache: typing.Optional[typing.Any] = None
             ) -> None:
-        self._loader = loader
+        self._loaders = loader
         self._dumper = dumper
         self._model = model
-        self._errors = collections.deque()
+        self._local = threading.local()
+        self._parse_cache = parse_cache
+        self.reset_locks()
+
+    def reset_locks(self) -> None:
+        """
+        Dumper keeps driver set up for one file, so saves are
+        run one by one. Loads of each thread are run by own
+        loader (see _loader), so loads of other models aren`t
+        blocked by running load or save.
+        """
+        self._save_lock = threading.RLock()
+
+    @property
+    def _loader(self) -> typing.Any:
+        """Loader of current thread, forked on first load."""
+        loader = getattr(self._local, 'loader', None)
+        if loader is None:
+            loader = self._local.loader = self._loaders.fork()
+        return loader
+
+    @property
+    def _errors(self) -> collections.deque:
+        """Errors of current thread: loads of threads overlap."""
+        errors = getattr(self._local, 'errors', None)
+        if errors is None:
+            errors = self._local.errors = collections.deque()
+        return errors
 
     @property
     def errors(self) -> typing.Any:
@@ -313,39 +658,376 @@ class BaseFileIOAdapter(FileIoInterface):
         while self._errors:
             yield self._errors.popleft()
 
-    def load(self, read_params: typing.Any) -> typing.Any:
+    def load(
+            self,
+            read_params: typing.Any,
+            *,
+            max_rows: typing.Optional[int] = None
+            ) -> typing.Any:
+        """
+        Load file into new model.
+        If max_rows is set, loading stops when model
+        have max_rows rows (used for previews).
+        """
         driver, loader = self._configure_load_sources(read_params)
         model = self._model.make_new_model()
         model.name = read_params.name
 
+        if self._loader.reads_models:
+            loader.stop_loading()
+            return self._loader.read_model(model, max_rows=max_rows)
+
+        size = self._source_size(read_params)
+        key = self._parse_cache_key(read_params)
+        if key is not None and max_rows is None:
+            cached = self._parse_cache.get(key, model)
+            if cached is not None:
+                loader.stop_loading()
+                self._set_source(read_params, cached, size)
+                return cached
+
+        add_values = timings.wrap('model.add_values', model.add_values)
+        for values in self._parse(driver, loader, model):
+            add_values(values)
+            if max_rows is not None and model.rows_count >= max_rows:
+                loader.stop_loading()
+                break
+        else:
+            self._store_parsed(key, read_params, model)
+            self._set_source(read_params, model, size)
+
+        return model
+
+    def _parse_cache_key(
+            self,
+            read_params: typing.Any
+            ) -> typing.Optional[str]:
+        """Parse cache key, loader have to be set up."""
+        if self._parse_cache is None or self._loader.preset is None:
+            return None
+        return self._parse_cache.key(
+                read_params,
+                self._loader.preset,
+                by_name=self._loader.reads_sheets
+                )
+
+    def _store_parsed(
+            self,
+            key: typing.Optional[str],
+            read_params: typing.Any,
+            model: itm.TableSheetModel
+            ) -> None:
+        """Store model, if file wasn`t changed while parsing."""
+        if key is None or key != self._parse_cache_key(read_params):
+            return None
+        try:
+            self._parse_cache.put(key, model)
+        except Exception as e:
+            self._errors.append(e)
+
+    def _source_size(self, read_params: typing.Any) -> typing.Optional[int]:
+        """File size, if file can be read by ranges."""
+        if not self._loader.reads_ranges:
+            return None
+        try:
+            return os.path.getsize(read_params.path)
+        except OSError:
+            return None
+
+    def _set_source(
+            self,
+            read_params: typing.Any,
+            model: itm.TableSheetModel,
+            size: typing.Optional[int]
+            ) -> None:
+        """
+        Remember parsed part of file (size before parsing),
+        if file wasn`t changed while parsing.
+        """
+        model.source = None
+        if size is None or model.empty:
+            return None
+        if size != self._source_size(read_params):
+            return None
+        digest = hashlib.blake2b(digest_size=SOURCE_DIGEST_SIZE)
+        if _hash_lines(read_params.path, 0, size, digest):
+            model.source = SourceState(
+                    os.path.abspath(read_params.path),
+                    read_params.flag,
+                    size,
+                    digest.hexdigest()
+                    )
+
+    def load_appended(
+            self,
+            read_params: typing.Any,
+            model: itm.TableSheetModel
+            ) -> typing.Optional[itm.TableSheetModel]:
+        """
+        Parse lines appended to file since model was loaded,
+        rows are added to model. Last line without newline
+        is left for next call. Return None, if file was
+        changed otherwise: model have to be loaded again.
+        """
+        state = model.source
+        if state is None or model.empty:
+            return None
+        if state.path != os.path.abspath(read_params.path):
+            return None
+        if state.flag != read_params.flag:
+            return None
+
+        _, loader = self._configure_load_sources(read_params)
+        loader.stop_loading()
+        size = self._source_size(read_params)
+        if size is None or size < state.offset:
+            return None
+        digest = hashlib.blake2b(digest_size=SOURCE_DIGEST_SIZE)
+        if not _hash_lines(read_params.path, 0, state.offset, digest):
+            return None
+        if digest.hexdigest() != state.digest:
+            return None
+        # line without newline may be half-written: it`s parsed later.
+        end = _lines_end(read_params.path, state.offset, size)
+        if end == state.offset:
+            return model
+
+        fetched, errors = self.fetch_range(read_params, (state.offset, end))
+        self._errors.extend(errors)
+        add_values = timings.wrap('model.add_values', model.add_values)
+        for values in fetched:
+            if model.validate(values):
+                add_values(values)
+        model.source = None
+        if _hash_lines(read_params.path, state.offset, end, digest):
+            model.source = state._replace(
+                    offset=end,
+                    digest=digest.hexdigest()
+                    )
+        return model
+
+    def load_one(self, read_params: typing.Any) -> LoadResult:
+        """
+        Load file, never raise: failure and driver
+        errors are returned with result.
+        """
+        try:
+            model = self.load(read_params)
+            failure = None
+        except Exception as e:
+            model, failure = None, _describe_error(e)
+        errors = tuple(_describe_error(e) for e in self.errors)
+        return LoadResult(read_params, model, errors, failure)
+
+    def load_many(
+            self,
+            read_params: typing.Sequence[typing.Any],
+            *,
+            workers: typing.Optional[int] = None
+            ) -> typing.Generator:
+        """
+        Load files in process pool, yield LoadResult
+        for each file in order of completion.
+        Without process pool support or with one
+        worker files are loaded in current process.
+        """
+        workers = min(workers or os.cpu_count() or 1, len(read_params))
+        pool = _make_pool(self, read_params, workers)
+        if pool is None:
+            for params in read_params:
+                yield self.load_one(params)
+            return
+
+        with pool:
+            pending = {
+                    pool.submit(_load_in_worker, params): params
+                    for params in read_params
+                    }
+            for done in futures.as_completed(pending):
+                try:
+                    yield done.result()
+                except Exception as e:
+                    # worker crashed or result wasn`t pickled.
+                    params = pending[done]
+                    yield LoadResult(params, failure=_describe_error(e))
+
+    def load_chunked(
+            self,
+            read_params: typing.Any,
+            *,
+            workers: typing.Optional[int] = None,
+            chunk_size: int = PARALLEL_CHUNK_SIZE
+            ) -> typing.Any:
+        """
+        Load file by newline aligned byte ranges: values are
+        fetched in process pool, model is filled in file order,
+        so empty cells are filled forward like in load().
+        File, that reader can`t split, is loaded by load().
+        """
+        driver, loader = self._configure_load_sources(read_params)
+        size = self._source_size(read_params)
+        raw_data = loader.load()
+        loader.stop_loading()
+        try:
+            ranges = self._loader.split_source(chunk_size)
+        except LoaderConfigError:
+            return self.load(read_params)
+
+        model = self._model.make_new_model()
+        model.name = read_params.name
+        key = self._parse_cache_key(read_params)
+        if key is not None:
+            cached = self._parse_cache.get(key, model)
+            if cached is not None:
+                self._set_source(read_params, cached, size)
+                return cached
+        if raw_data is None:
+            return model
+        try:
+            model.add_headers(driver.fetch_headers(raw_data))
+        except sie.DriverError:
+            # next line will be headers, it`s a load() case.
+            return self.load(read_params)
+
+        add_values = timings.wrap('model.add_values', model.add_values)
+        for fetched, errors in self._map_ranges(read_params, ranges, workers):
+            self._errors.extend(errors)
+            for values in fetched:
+                if model.validate(values):
+                    add_values(values)
+        self._store_parsed(key, read_params, model)
+        self._set_source(read_params, model, size)
+        return model
+
+    def fetch_range(
+            self,
+            read_params: typing.Any,
+            byte_range: typing.Tuple[int, int]
+            ) -> typing.Tuple[list, list]:
+        """
+        Fetch values from lines in byte range of file.
+        Return fetched values and driver errors.
+        """
+        driver, loader = self._configure_load_sources(
+                read_params,
+                byte_range=byte_range
+                )
+        fetched, errors = [], []
+        load = timings.wrap('reader', loader.load)
+        fetch_values = timings.wrap('driver.fetch_values', driver.fetch_values)
+        while True:
+            raw_data = load()
+            if raw_data is None:
+                break
+            try:
+                fetched.append(fetch_values(raw_data))
+            except sie.DriverError as e:
+                errors.append(e)
+        return fetched, errors
+
+    def _map_ranges(
+            self,
+            read_params: typing.Any,
+            ranges: typing.List[typing.Tuple[int, int]],
+            workers: typing.Optional[int]
+            ) -> typing.Generator:
+        """Yield fetch_range results in order of ranges."""
+        workers = min(workers or os.cpu_count() or 1, len(ranges))
+        pool = _make_pool(self, [read_params], workers)
+        if pool is None:
+            for byte_range in ranges:
+                yield self.fetch_range(read_params, byte_range)
+            return
+
+        with pool:
+            yield from pool.map(
+                    _fetch_in_worker,
+                    itertools.repeat(read_params),
+                    ranges
+                    )
+
+    def stream(
+            self,
+            read_params: typing.Any,
+            *,
+            batch_size: int = STREAM_BATCH_SIZE
+            ) -> typing.Generator:
+        """
+        Load file by batches of rows without model materialization.
+        Each batch is a list of rows, first row is headers
+        (like model.rows). Memory is bounded by one batch.
+        """
+        driver, loader = self._configure_load_sources(read_params)
+        if self._loader.reads_models:
+            # rows of parsed model: headers first, no parsing.
+            rows = iter(loader.load, None)
+            while batch := list(itertools.islice(rows, batch_size)):
+                yield batch
+            return
+
+        model = self._model.make_new_model()
+        model.name = read_params.name
+
+        batch = []
+        headers_sent = False
+        expand = timings.wrap('model.expand_values', model.expand_values)
+        for values in self._parse(driver, loader, model):
+            if not headers_sent:
+                batch.append(next(model.rows))
+                headers_sent = True
+            batch.extend(expand(values))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if not headers_sent and not model.empty:
+            batch.append(next(model.rows))
+        if batch:
+            yield batch
+
+    def _parse(
+            self,
+            driver: typing.Any,
+            loader: typing.Any,
+            model: itm.TableSheetModel
+            ) -> typing.Generator:
+        """
+        Set headers to model from first line,
+        yield validated values from next lines.
+        """
+        load = timings.wrap('reader', loader.load)
+        fetch_headers = timings.wrap(
+                'driver.fetch_headers',
+                driver.fetch_headers
+                )
+        fetch_values = timings.wrap('driver.fetch_values', driver.fetch_values)
         while True:
-            raw_data = loader.load()
+            raw_data = load()
             if raw_data is None:
                 break
 
             try:
                 if model.empty:
-                    headers = driver.fetch_headers(raw_data)
+                    headers = fetch_headers(raw_data)
                     model.add_headers(headers)
                 else:
-                    values = driver.fetch_values(raw_data)
+                    values = fetch_values(raw_data)
                     if model.validate(values):
-                        model.add_values(values)
+                        yield values
             except sie.DriverError as e:
                 self._errors.append(e)
 
-        return model
-
     def _configure_load_sources(
                     self,
-                    settings: typing.Any
+                    settings: typing.Any,
+                    **kwargs
                     ) -> typing.Optional[typing.Tuple[
                                 sii.FileDriverInterface,
                                 str,
                                 ]]:
         try:
             self._loader.setup(settings)
-            sources = self._loader.get_load_sources()
+            sources = self._loader.get_load_sources(**kwargs)
             self._validate_sources(sources)
             return sources
         except (LoaderConfigError, FileNotFoundError) as e:
@@ -361,33 +1043,61 @@ class BaseFileIOAdapter(FileIoInterface):
             msg = f'Invalid sources: <{sources}>.'
             raise sie.AdapterError(msg)
 
+    @_locked('_save_lock')
     def save(self, model: itm.TableSheetModel,
              write_params: typing.Any) -> None:
-        """Write by line."""
-        sources = self._get_dump_sources(write_params)
+        """
+        Write all rows by one writer call, columnar
+        writers take model columns as is.
+        """
+        sources = self._get_rows_writer(write_params)
         self._validate_sources(sources)
-        driver, writer = sources
+        if self._dumper.writes_columns:
+            _, write_columns = self._dumper.get_columns_writer()
+            write_columns = timings.wrap('writer', write_columns)
+            write_columns(model.headers, model.columns)
+            return
+        driver, write_rows = sources
+        write_rows = timings.wrap('writer', write_rows)
+        write_rows(self._compile_rows(driver, model.rows))
+
+    @_locked('_save_lock')
+    def convert(
+            self,
+            read_params: typing.Any,
+            write_params: typing.Any
+            ) -> int:
+        """
+        Stream rows from source file to destination file,
+        model isn`t materialized. Return written rows count.
+        """
+        sources = self._get_rows_writer(write_params)
+        self._validate_sources(sources)
+        driver, write_rows = sources
+        write_rows = timings.wrap('writer', write_rows)
+        lines = itertools.chain.from_iterable(self.stream(read_params))
+        return write_rows(self._compile_rows(driver, lines))
 
-        for line in model.rows:
+    def _compile_rows(
+            self,
+            driver: sii.FileDriverInterface,
+            lines: typing.Iterable
+            ) -> typing.Generator:
+        """Rows for writer, rows with driver errors are skipped."""
+        read = timings.wrap('driver.read', driver.read)
+        for line in lines:
             try:
-                compiled = driver.read(line)
-                writer.send(compiled)
+                yield read(line)
             except sie.DriverError as e:
                 self._errors.append(e)
 
-        writer.throw(StopIteration)
-        writer.close()
-
-    def _get_dump_sources(
+    def _get_rows_writer(
                 self,
                 settings: typing.Any
-                ) -> typing.Optional[typing.Tuple[
-                            sii.FileDriverInterface,
-                            str,
-                            ]]:
+                ) -> typing.Tuple[sii.FileDriverInterface, typing.Callable]:
         try:
             self._dumper.setup(settings)
-            return self._dumper.get_dump_sources()
+            return self._dumper.get_rows_writer()
         except (LoaderConfigError, FileNotFoundError) as e:
             self._errors.append(e)
             self._dumper.clean_setup()
@@ -396,6 +1106,7 @@ class BaseFileIOAdapter(FileIoInterface):
             self._dumper.clean_setup()
             raise sie.AdapterError from e
 
+    @_locked('_save_lock')
     def close(self) -> None:
         self._loader.clean_setup()
         self._dumper.clean_setup()
@@ -0,0 +1,390 @@
+import re
+import typing
+import zipfile
+import xml.etree.ElementTree as ET
+
+from openpyxl.comments.comment_sheet import CommentSheet
+from openpyxl.formula.translate import Translator
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.styles.numbers import (
+                BUILTIN_FORMATS,
+                is_date_format,
+                is_timedelta_format,
+                )
+from openpyxl.utils import column_index_from_string, coordinate_to_tuple
+from openpyxl.utils.datetime import (
+                CALENDAR_MAC_1904,
+                CALENDAR_WINDOWS_1900,
+                from_ISO8601,
+                from_excel,
+                )
+
+from .services import ExcelFileReader
+
+
+_MAIN_NS: str = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS: str = 'http://schemas.openxmlformats.org/officeDocument/2006/'\
+               'relationships'
+_ROOT_RELS: str = '_rels/.rels'
+_DEFAULT_WORKBOOK: str = 'xl/workbook.xml'
+
+_ROW: str = f'{{{_MAIN_NS}}}row'
+_VALUE: str = f'{{{_MAIN_NS}}}v'
+_FORMULA: str = f'{{{_MAIN_NS}}}f'
+_INLINE_STR: str = f'{{{_MAIN_NS}}}is'
+_TEXT: str = f'{{{_MAIN_NS}}}t'
+_RUN: str = f'{{{_MAIN_NS}}}r'
+_STRING_ITEM: str = f'{{{_MAIN_NS}}}si'
+
+# sheet xml bytes parsed at once, rows are cut by </row>.
+XML_BATCH_SIZE: int = 2 ** 20
+_SHEET_DATA_START: re.Pattern = re.compile(rb'<(?:[\w.-]+:)?sheetData\b[^>]*>')
+_SHEET_DATA_END: re.Pattern = re.compile(rb'</(?:[\w.-]+:)?sheetData\s*>')
+_ROW_END: re.Pattern = re.compile(rb'</(?:[\w.-]+:)?row\s*>')
+_TAG_NAME: re.Pattern = re.compile(rb'<([\w.:-]+)')
+_WORKSHEET_START: re.Pattern = re.compile(
+        rb'<((?:[\w.-]+:)?worksheet)\b[^>]*>'
+        )
+
+
+class XlsxReaderError(Exception):
+    pass
+
+
+class XmlCell(typing.NamedTuple):
+    """Lightweight cell: value and comment like openpyxl cell has."""
+    value: typing.Any = None
+    comment: typing.Any = None
+
+
+_EMPTY_CELL: XmlCell = XmlCell()
+
+
+def _path(*tags: str) -> str:
+    return '/'.join(f'{{{_MAIN_NS}}}{tag}' for tag in tags)
+
+
+def _cast_number(value: str) -> typing.Union[int, float]:
+    if '.' in value or 'E' in value or 'e' in value:
+        return float(value)
+    return int(value)
+
+
+def _text_content(node: ET.Element) -> str:
+    """Text of string item without formatting and phonetic runs."""
+    if len(node) == 1 and node[0].tag == _TEXT:
+        return node[0].text or ''
+    snippets = [node.findtext(_TEXT) or '']
+    for run in node.iterfind(_RUN):
+        snippets.append(run.findtext(_TEXT) or '')
+    return ''.join(snippets)
+
+
+class _XlsxBook:
+    """
+    Parts of workbook, needed for values reading:
+    sheets paths, shared strings and date styles.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile) -> None:
+        self._archive = archive
+        self._names = set(archive.namelist())
+        self._path = self._find_workbook_path()
+        self._rels = self._read_rels(self._path)
+        self.sheets = []
+        self.active = 0
+        self.epoch = CALENDAR_WINDOWS_1900
+        self._read_workbook()
+        self.strings = self._read_strings()
+        self.date_formats, self.timedelta_formats = self._read_styles()
+
+    def sheet_path(self, name: str) -> str:
+        """Path of sheet by name, path of active sheet by default."""
+        if not self.sheets:
+            raise XlsxReaderError('Workbook has no worksheets.')
+        paths = dict(self.sheets)
+        if name in paths:
+            return paths[name]
+        active = self.active if self.active < len(self.sheets) else 0
+        return self.sheets[active][1]
+
+    def comments(self, sheet_path: str) -> typing.Dict[tuple, typing.Any]:
+        """Comments of sheet by (row, column)."""
+        found = {}
+        for rel in self._read_rels(sheet_path):
+            if not rel.Type.endswith('/comments'):
+                continue
+            tree = ET.fromstring(self._archive.read(rel.target))
+            for ref, comment in CommentSheet.from_tree(tree).comments:
+                found[coordinate_to_tuple(ref)] = comment
+        return found
+
+    def _find_workbook_path(self) -> str:
+        for rel in self._read_rels(''):
+            if rel.Type.endswith('/officeDocument'):
+                return rel.target
+        return _DEFAULT_WORKBOOK
+
+    def _read_rels(self, path: str) -> list:
+        rels_path = get_rels_path(path) if path else _ROOT_RELS
+        if rels_path not in self._names:
+            return []
+        return list(get_dependents(self._archive, rels_path).Relationship)
+
+    def _find_part(self, rel_type: str) -> typing.Optional[str]:
+        for rel in self._rels:
+            if rel.Type.endswith(rel_type) and rel.target in self._names:
+                return rel.target
+        return None
+
+    def _read_workbook(self) -> None:
+        root = ET.fromstring(self._archive.read(self._path))
+        targets = {rel.Id: rel for rel in self._rels}
+
+        props = root.find(_path('workbookPr'))
+        if props is not None and props.get('date1904') in ('1', 'true'):
+            self.epoch = CALENDAR_MAC_1904
+
+        view = root.find(_path('bookViews', 'workbookView'))
+        if view is not None:
+            self.active = int(view.get('activeTab', 0))
+
+        for sheet in root.iterfind(_path('sheets', 'sheet')):
+            rel = targets.get(sheet.get(f'{{{_REL_NS}}}id'))
+            if rel is None or 'chartsheet' in rel.Type:
+                continue
+            if rel.target in self._names:
+                self.sheets.append((sheet.get('name'), rel.target))
+
+    def _read_strings(self) -> typing.List[str]:
+        path = self._find_part('/sharedStrings')
+        if path is None:
+            return []
+        strings = []
+        with self._archive.open(path) as source:
+            for _, node in ET.iterparse(source):
+                if node.tag == _STRING_ITEM:
+                    strings.append(_text_content(node).replace('x005F_', ''))
+                    node.clear()
+        return strings
+
+    def _read_styles(self) -> typing.Tuple[set, set]:
+        """Indexes of cell styles with date and timedelta formats."""
+        path = self._find_part('/styles')
+        if path is None:
+            return set(), set()
+        root = ET.fromstring(self._archive.read(path))
+        custom = {
+                int(fmt.get('numFmtId')): fmt.get('formatCode')
+                for fmt in root.iterfind(_path('numFmts', 'numFmt'))
+                }
+        date_formats, timedelta_formats = set(), set()
+        styles = root.iterfind(_path('cellXfs', 'xf'))
+        for idx, style in enumerate(styles):
+            fmt_id = int(style.get('numFmtId', 0))
+            fmt = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id))
+            if fmt is None:
+                continue
+            if is_date_format(fmt):
+                date_formats.add(idx)
+            if is_timedelta_format(fmt):
+                timedelta_formats.add(idx)
+        return date_formats, timedelta_formats
+
+
+class XlsxXmlReader(ExcelFileReader):
+    """
+    .xlsx reader, that parses sheet xml straight from zip by
+    iterparse, openpyxl cells and workbook aren`t created.
+    Rows are tuples of values (for ExcelValuesCompiler),
+    with need_comments rows are tuples of XmlCell (for
+    ExcelCompiler), comments part is parsed only then.
+    Values are the same as openpyxl gives: dates by styles,
+    formulas text (cached values with data_only).
+    """
+
+    def __init__(
+            self,
+            *,
+            need_comments: bool = False,
+            data_only: bool = False
+            ) -> None:
+        super().__init__(values_only=not need_comments)
+        self._need_comments = need_comments
+        self._data_only = data_only
+        if need_comments:
+            self._filler = _EMPTY_CELL
+        self._columns = {}
+
+    def read(self, settings: typing.Any) -> typing.Generator:
+        with zipfile.ZipFile(settings.path) as archive:
+            book = _XlsxBook(archive)
+            sheet_path = book.sheet_path(settings.name)
+            comments = book.comments(sheet_path) if self._need_comments else {}
+            with archive.open(sheet_path) as source:
+                rows = self._iter_rows(source, book, comments)
+                yield from self._shape_rows(rows)
+
+    def _iter_rows(
+            self,
+            source: typing.IO[bytes],
+            book: _XlsxBook,
+            comments: typing.Dict[tuple, typing.Any]
+            ) -> typing.Generator:
+        row_idx = 0
+        formulas = {}
+        for row in self._iter_row_elements(source):
+            ref = row.get('r')
+            idx = int(float(ref)) if ref else row_idx + 1
+            # missing rows are blank.
+            for _ in range(row_idx + 1, idx):
+                yield ()
+            row_idx = idx
+            yield self._parse_row(row, row_idx, book, comments, formulas)
+
+    def _iter_row_elements(
+            self,
+            source: typing.IO[bytes]
+            ) -> typing.Generator:
+        """
+        Yield row elements of sheetData. Batches of whole rows
+        are parsed by one fromstring() call inside copy of
+        sheet head (for namespaces), so there is no python
+        work for each xml event.
+        """
+        data = b''
+        start = None
+        while start is None:
+            chunk = source.read(XML_BATCH_SIZE)
+            if not chunk:
+                return
+            data += chunk
+            start = _SHEET_DATA_START.search(data)
+        if data[start.end() - 2:start.end()] == b'/>':
+            return
+        root = _WORKSHEET_START.search(data, 0, start.start())
+        if root is None:
+            raise XlsxReaderError('Worksheet element not found.')
+        head = root.group() + start.group()
+        sheet_data = _TAG_NAME.match(start.group()).group(1)
+        tail = b'</' + sheet_data + b'></' + root.group(1) + b'>'
+
+        data = data[start.end():]
+        finished = False
+        while not finished:
+            end = _SHEET_DATA_END.search(data)
+            if end is not None:
+                batch, finished = data[:end.start()], True
+            else:
+                cut = data.rfind(b'>') + 1
+                last_row = None
+                for last_row in _ROW_END.finditer(data, 0, cut):
+                    pass
+                cut = last_row.end() if last_row else 0
+                batch, data = data[:cut], data[cut:]
+                chunk = source.read(XML_BATCH_SIZE)
+                if not chunk and not batch:
+                    raise XlsxReaderError('Unexpected end of worksheet xml.')
+                data += chunk
+            if batch.strip():
+                root = ET.fromstring(head + batch + tail)
+                yield from root.iter(_ROW)
+
+    def _parse_row(
+            self,
+            row: ET.Element,
+            row_idx: int,
+            book: _XlsxBook,
+            comments: typing.Dict[tuple, typing.Any],
+            formulas: typing.Dict[str, Translator]
+            ) -> tuple:
+        values = []
+        col = 0
+        parse_cell = self._parse_cell
+        for cell in row:
+            ref = cell.get('r')
+            col = self._column(ref) if ref else col + 1
+            if len(values) < col - 1:
+                values.extend([self._filler] * (col - 1 - len(values)))
+            value = parse_cell(cell, ref, book, formulas)
+            if self._need_comments:
+                value = XmlCell(value, comments.get((row_idx, col)))
+            values.append(value)
+        return tuple(values)
+
+    def _column(self, ref: str) -> int:
+        letters = ref.rstrip('0123456789')
+        col = self._columns.get(letters)
+        if col is None:
+            col = self._columns[letters] = column_index_from_string(letters)
+        return col
+
+    def _parse_cell(
+            self,
+            cell: ET.Element,
+            ref: typing.Optional[str],
+            book: _XlsxBook,
+            formulas: typing.Dict[str, Translator]
+            ) -> typing.Any:
+        value = formula = inline = None
+        for child in cell:
+            tag = child.tag
+            if tag == _VALUE:
+                value = child.text or None
+            elif tag == _FORMULA:
+                formula = child
+            elif tag == _INLINE_STR:
+                inline = child
+
+        data_type = cell.get('t', 'n')
+        if formula is not None and not self._data_only:
+            return self._parse_formula(formula, ref, formulas)
+
+        if data_type == 'inlineStr':
+            return _text_content(inline) if inline is not None else None
+        if value is None:
+            return None
+        if data_type == 'n':
+            value = _cast_number(value)
+            style = cell.get('s')
+            if style and int(style) in book.date_formats:
+                try:
+                    value = from_excel(
+                            value,
+                            book.epoch,
+                            timedelta=int(style) in book.timedelta_formats
+                            )
+                except (OverflowError, ValueError):
+                    value = '#VALUE!'
+        elif data_type == 's':
+            value = book.strings[int(value)]
+        elif data_type == 'b':
+            value = bool(int(value))
+        elif data_type == 'd':
+            value = from_ISO8601(value)
+        return value
+
+    def _parse_formula(
+            self,
+            formula: ET.Element,
+            ref: typing.Optional[str],
+            formulas: typing.Dict[str, Translator]
+            ) -> str:
+        """Formula text, shared formulas are translated to cell."""
+        value = '='
+        if formula.text is not None:
+            value += formula.text
+        if formula.get('t') == 'shared':
+            idx = formula.get('si')
+            if idx in formulas:
+                value = formulas[idx].translate_formula(ref)
+            elif value != '=':
+                formulas[idx] = Translator(value, ref)
+        return value
+
+
+__all__ = [
+        'XlsxXmlReader',
+        'XlsxReaderError',
+        'XmlCell',
+        ]
@@ -0,0 +1,368 @@
+import os
+import re
+import shutil
+import typing
+import zipfile
+import tempfile
+import posixpath
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.xml.constants import (
+                ARC_CONTENT_TYPES,
+                ARC_ROOT_RELS,
+                ARC_WORKBOOK,
+                REL_NS,
+                SHEET_MAIN_NS,
+                WORKSHEET_TYPE,
+                )
+
+
+_SHEET_REL: str = f'{REL_NS}/worksheet'
+_FIRST_CUSTOM_FORMAT: int = 164
+# sheet xml is copied by chunks, chunk is cut after last '>'.
+XML_CHUNK_SIZE: int = 2 ** 20
+_STYLE_ID: re.Pattern = re.compile(rb'(\ss=")(\d+)(")')
+_SHARED_STRING: re.Pattern = re.compile(rb'\st="s"')
+_PREFIX: str = r'(?:[\w.-]+:)?'
+
+
+class XlsxMergeError(Exception):
+    """Sheet can`t be added on zip level, book should be reloaded."""
+    pass
+
+
+def _tag(name: str) -> str:
+    return f'{{{SHEET_MAIN_NS}}}{name}'
+
+
+def _attr(value: str) -> str:
+    return escape(value, {'"': '&quot;'})
+
+
+def _rels(archive: zipfile.ZipFile, path: str) -> list:
+    rels_path = get_rels_path(path) if path else ARC_ROOT_RELS
+    if rels_path not in archive.namelist():
+        return []
+    return list(get_dependents(archive, rels_path).Relationship)
+
+
+def _workbook_path(archive: zipfile.ZipFile) -> str:
+    for rel in _rels(archive, ''):
+        if rel.Type.endswith('/officeDocument'):
+            return rel.target
+    return ARC_WORKBOOK
+
+
+def _find_rel(rels: list, rel_type: str) -> typing.Optional[str]:
+    for rel in rels:
+        if rel.Type.endswith(rel_type):
+            return rel.target
+    return None
+
+
+def _iter_chunks(stream: typing.BinaryIO) -> typing.Generator:
+    """Yield xml chunks, that aren`t cut inside of tag."""
+    rest = b''
+    while chunk := stream.read(XML_CHUNK_SIZE):
+        chunk = rest + chunk
+        end = chunk.rfind(b'>') + 1
+        rest = chunk[end:]
+        if end:
+            yield chunk[:end]
+    if rest:
+        yield rest
+
+
+def _insert(
+        data: bytes,
+        pattern: str,
+        item: str,
+        part: str
+        ) -> bytes:
+    """Insert item before closing tag, found by pattern."""
+    found = re.search(pattern.encode(), data)
+    if found is None:
+        raise XlsxMergeError(f'Unexpected xml of part {part}.')
+    pos = found.start()
+    return data[:pos] + item.encode() + data[pos:]
+
+
+def _set_count(data: bytes, tag: str, count: int) -> bytes:
+    pattern = rf'(<{_PREFIX}{tag}\b[^>]*?\scount=")\d+(")'.encode()
+    return re.sub(pattern, rb'\g<1>%d\g<2>' % count, data, count=1)
+
+
+def _prefix(data: bytes, tag: str) -> str:
+    found = re.search(rf'<({_PREFIX}){tag}\b'.encode(), data)
+    return found.group(1).decode() if found else ''
+
+
+class _StylesMerger:
+    """
+    Copy number formats of new sheet cells into styles
+    of existing book. Write-only workbook gives only
+    number formats to cells, other styles aren`t merged.
+    """
+
+    def __init__(self, source: bytes, dest: bytes) -> None:
+        src_root = ET.fromstring(source)
+        dest_root = ET.fromstring(dest)
+        self._dest = dest
+        self._src_xfs = list(src_root.iterfind(f"{_tag('cellXfs')}/*"))
+        self._src_formats = self._formats(src_root)
+        self._formats_ids = {
+                code: idx for idx, code in self._formats(dest_root).items()
+                }
+        self._xfs_count = len(dest_root.findall(f"{_tag('cellXfs')}/*"))
+        self._has_formats = dest_root.find(_tag('numFmts')) is not None
+        self._prefix = _prefix(dest, 'cellXfs')
+        self._new_xfs = []
+        self._new_formats = []
+
+    @staticmethod
+    def _formats(root: ET.Element) -> typing.Dict[int, str]:
+        return {
+                int(fmt.get('numFmtId')): fmt.get('formatCode')
+                for fmt in root.iterfind(f"{_tag('numFmts')}/*")
+                }
+
+    def merge(self, styles: typing.Set[int]) -> typing.Dict[int, int]:
+        """Return map of source style id to id in existing book."""
+        mapping = {0: 0}
+        for style in sorted(styles - {0}):
+            if style >= len(self._src_xfs):
+                raise XlsxMergeError(f'Unknown cell style {style}.')
+            mapping[style] = self._xfs_count + len(self._new_xfs)
+            self._new_xfs.append(self._make_xf(self._src_xfs[style]))
+        return mapping
+
+    def _make_xf(self, xf: ET.Element) -> str:
+        if any(int(xf.get(k, 0)) for k in ('fontId', 'fillId', 'borderId')):
+            raise XlsxMergeError('Sheet cells have not only number format.')
+        fmt_id = int(xf.get('numFmtId', 0))
+        if fmt_id >= _FIRST_CUSTOM_FORMAT:
+            fmt_id = self._format_id(self._src_formats[fmt_id])
+        return (
+                f'<{self._prefix}xf numFmtId="{fmt_id}" fontId="0" '
+                'fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+                )
+
+    def _format_id(self, code: str) -> int:
+        if code not in self._formats_ids:
+            ids = [_FIRST_CUSTOM_FORMAT - 1, *self._formats_ids.values()]
+            self._formats_ids[code] = max(ids) + 1
+            self._new_formats.append(
+                    f'<{self._prefix}numFmt '
+                    f'numFmtId="{self._formats_ids[code]}" '
+                    f'formatCode="{_attr(code)}"/>'
+                    )
+        return self._formats_ids[code]
+
+    def dump(self) -> bytes:
+        """Existing styles with new cell formats."""
+        data = self._dest
+        if not self._new_xfs:
+            return data
+        prefix = self._prefix
+        data = _insert(
+                data, f'</{prefix}cellXfs\\s*>', ''.join(self._new_xfs),
+                'styles'
+                )
+        data = _set_count(
+                data, 'cellXfs', self._xfs_count + len(self._new_xfs)
+                )
+        if not self._new_formats:
+            return data
+        formats = ''.join(self._new_formats)
+        count = len(self._formats_ids)
+        if self._has_formats:
+            data = _insert(data, f'</{prefix}numFmts\\s*>', formats, 'styles')
+            return _set_count(data, 'numFmts', count)
+        found = re.search(rf'<{_PREFIX}styleSheet\b[^>]*>'.encode(), data)
+        if found is None or found.group().endswith(b'/>'):
+            raise XlsxMergeError('Unexpected xml of part styles.')
+        formats = (
+                f'<{prefix}numFmts count="{count}">'
+                f'{formats}</{prefix}numFmts>'
+                )
+        return data[:found.end()] + formats.encode() + data[found.end():]
+
+
+def _scan_sheet(archive: zipfile.ZipFile, path: str) -> typing.Set[int]:
+    """Style ids of sheet cells."""
+    styles = set()
+    with archive.open(path) as stream:
+        for chunk in _iter_chunks(stream):
+            if _SHARED_STRING.search(chunk):
+                raise XlsxMergeError('Sheet has shared strings.')
+            styles.update(int(m[1]) for m in _STYLE_ID.findall(chunk))
+    return styles
+
+
+def _copy_sheet(
+        archive: zipfile.ZipFile,
+        path: str,
+        dest: typing.BinaryIO,
+        mapping: typing.Dict[int, int]
+        ) -> None:
+
+    def _replace(found: re.Match) -> bytes:
+        style = mapping[int(found.group(2))]
+        return b'%s%d%s' % (found.group(1), style, found.group(3))
+
+    with archive.open(path) as stream:
+        for chunk in _iter_chunks(stream):
+            if len(mapping) > 1:
+                chunk = _STYLE_ID.sub(_replace, chunk)
+            dest.write(chunk)
+
+
+def _copy_info(
+        info: zipfile.ZipInfo,
+        filename: typing.Optional[str] = None
+        ) -> zipfile.ZipInfo:
+    copied = zipfile.ZipInfo(filename or info.filename, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.external_attr = info.external_attr
+    copied.file_size = info.file_size
+    return copied
+
+
+class _SheetAppender:
+    """New sheet parts of existing book."""
+
+    def __init__(self, book: zipfile.ZipFile, name: str) -> None:
+        self._book = book
+        self._names = set(book.namelist())
+        self._name = name
+        self.workbook = _workbook_path(book)
+        self.rels_path = get_rels_path(self.workbook)
+        self._rels = _rels(book, self.workbook)
+        self.styles = _find_rel(self._rels, '/styles')
+        if self.styles not in self._names:
+            raise XlsxMergeError('Workbook has no styles.')
+        self.part = self._new_part_name()
+
+    def _new_part_name(self) -> str:
+        folder = posixpath.join(posixpath.dirname(self.workbook), 'worksheets')
+        idx = 1
+        while posixpath.join(folder, f'sheet{idx}.xml') in self._names:
+            idx += 1
+        return posixpath.join(folder, f'sheet{idx}.xml')
+
+    def _new_rel_id(self) -> str:
+        used = {rel.Id for rel in self._rels}
+        idx = len(used) + 1
+        while f'rId{idx}' in used:
+            idx += 1
+        return f'rId{idx}'
+
+    def workbook_xml(self, rel_id: str) -> bytes:
+        data = self._book.read(self.workbook)
+        root = ET.fromstring(data)
+        sheets = list(root.iterfind(f"{_tag('sheets')}/*"))
+        names = {sheet.get('name', '').lower() for sheet in sheets}
+        if self._name.lower() in names:
+            raise XlsxMergeError(f'Sheet {self._name} exists.')
+        sheet_id = max((int(s.get('sheetId', 0)) for s in sheets), default=0)
+
+        prefix = _prefix(data, 'sheets')
+        found = re.search(
+                rf'xmlns:([\w.-]+)="{re.escape(REL_NS)}"'.encode(), data
+                )
+        if found:
+            rel_attr = f'{found.group(1).decode()}:id="{rel_id}"'
+        else:
+            rel_attr = f'xmlns:r="{REL_NS}" r:id="{rel_id}"'
+        item = (
+                f'<{prefix}sheet name="{_attr(self._name)}" '
+                f'sheetId="{sheet_id + 1}" {rel_attr}/>'
+                )
+        return _insert(data, f'</{prefix}sheets\\s*>', item, self.workbook)
+
+    def rels_xml(self, rel_id: str) -> bytes:
+        target = posixpath.relpath(
+                self.part, posixpath.dirname(self.workbook) or '.'
+                )
+        item = (
+                f'<Relationship Id="{rel_id}" Type="{_SHEET_REL}" '
+                f'Target="{target}"/>'
+                )
+        return _insert(
+                self._book.read(self.rels_path), r'</Relationships\s*>',
+                item, self.rels_path
+                )
+
+    def content_types_xml(self) -> bytes:
+        item = (
+                f'<Override PartName="/{self.part}" '
+                f'ContentType="{WORKSHEET_TYPE}"/>'
+                )
+        return _insert(
+                self._book.read(ARC_CONTENT_TYPES), r'</Types\s*>', item,
+                ARC_CONTENT_TYPES
+                )
+
+    def changed_parts(self, styles: bytes) -> typing.Dict[str, bytes]:
+        rel_id = self._new_rel_id()
+        return {
+                self.workbook: self.workbook_xml(rel_id),
+                self.rels_path: self.rels_xml(rel_id),
+                ARC_CONTENT_TYPES: self.content_types_xml(),
+                self.styles: styles,
+                }
+
+
+def append_sheet(path: str, source: str, name: str) -> None:
+    """
+    Add first sheet of book [source] to book [path] as sheet [name].
+    Other parts of [path] are copied as is, without parsing.
+    """
+    with zipfile.ZipFile(path) as book, zipfile.ZipFile(source) as new:
+        appender = _SheetAppender(book, name)
+        new_workbook = _workbook_path(new)
+        new_rels = _rels(new, new_workbook)
+        sheet = _find_rel(new_rels, '/worksheet')
+        new_styles = _find_rel(new_rels, '/styles')
+        if sheet is None or new_styles is None:
+            raise XlsxMergeError(f'Unexpected book {source}.')
+
+        merger = _StylesMerger(
+                new.read(new_styles), book.read(appender.styles)
+                )
+        mapping = merger.merge(_scan_sheet(new, sheet))
+        changed = appender.changed_parts(merger.dump())
+
+        fd, tmp_path = tempfile.mkstemp(
+                suffix='.xlsx', dir=os.path.dirname(os.path.abspath(path))
+                )
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as out:
+                for info in book.infolist():
+                    if info.filename in changed:
+                        out.writestr(
+                                _copy_info(info), changed[info.filename]
+                                )
+                        continue
+                    with book.open(info) as src, \
+                            out.open(_copy_info(info), 'w') as dest:
+                        shutil.copyfileobj(src, dest, XML_CHUNK_SIZE)
+
+                info = _copy_info(new.getinfo(sheet), appender.part)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with out.open(info, 'w') as dest:
+                    _copy_sheet(new, sheet, dest, mapping)
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+__all__ = (
+        'XlsxMergeError',
+        'append_sheet',
+        )
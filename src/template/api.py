@@ -5,10 +5,16 @@ from .core_presets import receiver
 from .messages import LoadExcelFile
 from .messages import LoadTxtFile
 from .messages import SaveExcelFile
+from .messages import ConvertFile
+from .messages import LoadManyFiles
+from .messages import WatchFiles
+from .messages import UnwatchFiles
 
 
 MEMORY_SAFE_LOAD_MODE: bool = False
 WRITE_ONLY: bool = False
+# streaming conversion keeps only one batch in memory.
+STREAMING_MODE: bool = True
 
 
 @api_router.route(CmdKey.LOADFILE)
@@ -22,7 +28,8 @@ def load_excel_file(
             flag=cmd.flag,
             mode=MEMORY_SAFE_LOAD_MODE,
             fname=filename,
-            suffix=cmd.suffix
+            suffix=cmd.suffix,
+            load_mode=cmd.mode
             )
     receiver.receive(_cmd)
 
@@ -38,11 +45,52 @@ def load_txt_file(
             flag=cmd.flag,
             mode='r',
             fname=filename,
-            suffix=cmd.suffix
+            suffix=cmd.suffix,
+            load_mode=cmd.mode
             )
     receiver.receive(load_txt)
 
 
+@api_router.route(CmdKey.LOADMANY)
+def load_many_files(
+        cmd: cf.TerminalCommand
+        ) -> None:
+    prefix = ''.join(cmd.args)
+    load_many = LoadManyFiles(
+            name=cmd.cmd,
+            path=cmd.path,
+            flag=cmd.flag,
+            mode=MEMORY_SAFE_LOAD_MODE,
+            fname=prefix,
+            suffix=cmd.suffix
+            )
+    receiver.receive(load_many)
+
+
+@api_router.route(CmdKey.WATCH)
+def watch_files(
+        cmd: cf.TerminalCommand
+        ) -> None:
+    prefix = ''.join(cmd.args)
+    watch = WatchFiles(
+            name=cmd.cmd,
+            path=cmd.path,
+            flag=cmd.flag,
+            mode=MEMORY_SAFE_LOAD_MODE,
+            fname=prefix,
+            suffix=cmd.suffix,
+            load_mode=cmd.mode
+            )
+    receiver.receive(watch)
+
+
+@api_router.route(CmdKey.UNWATCH)
+def unwatch_files(
+        cmd: cf.TerminalCommand
+        ) -> None:
+    receiver.receive(UnwatchFiles(name=cmd.cmd, path=cmd.path))
+
+
 @api_router.route(CmdKey.SAVEFILE)
 def save_excel_file(
         cmd: cf.TerminalCommand,
@@ -57,3 +105,22 @@ def save_excel_file(
             suffix=cmd.suffix,
             )
     receiver.receive(save_xl_file)
+
+
+@api_router.route(CmdKey.CONVERT)
+def convert_file(
+        cmd: cf.TerminalCommand,
+        ) -> None:
+    dest = cmd.pipe[0]
+    filename = ''.join(dest.args) or ''.join(cmd.args)
+    convert = ConvertFile(
+            name=cmd.cmd,
+            path=cmd.path,
+            flag=cmd.flag,
+            mode=STREAMING_MODE,
+            fname=filename,
+            suffix=cmd.suffix,
+            dest_path=dest.path,
+            dest_suffix=dest.suffix,
+            )
+    receiver.receive(convert)
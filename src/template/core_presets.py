@@ -4,7 +4,7 @@ from core import receiver
 from core import api_router
 from core import handlers
 from core import command_filters
-from core.terminal_commands import CmdKey, command_validator
+from core.terminal_commands import CmdKey, LoadMode, command_validator
 from core import domain_models
 from core import text_utils
 from core import sys_constants
@@ -20,6 +20,7 @@ __all__ = [
         'handlers',
         'api_router',
         'CmdKey',
+        'LoadMode',
         'command_filters',
         'command_validator',
         'domain_models',
@@ -1,14 +1,72 @@
+import os
+import sys
+import glob
 import typing
+import functools
 
 from .messages import LoadExcelFile
 from .messages import LoadTxtFile
 from .messages import SaveExcelFile
+from .messages import ConvertFile
+from .messages import LoadManyFiles
+from .messages import WatchFiles
+from .messages import UnwatchFiles
 from .io_presets import ReadSettings
 from .io_presets import TxtReadSettings
 from .io_presets import WriteSettings
+from .watcher import FileWatcher
+from .watcher import Watchers
+from .watcher import WATCH_INTERVAL
 
 from .core_presets import handlers as h
 from .core_presets import Cache
+from .core_presets import LoadMode
+
+
+def load_model(
+        port: typing.Any,
+        read_set: typing.Any,
+        load_mode: str,
+        *,
+        workers: typing.Optional[int] = None,
+        cached: typing.Optional[typing.Any] = None
+        ) -> typing.Any:
+    """
+    Load model by port method, selected by command mode.
+    If cached model of the same file is set and file was
+    only appended, new lines are parsed into cached model.
+    """
+    if load_mode not in set(LoadMode):
+        raise Exception(f'Unknown load mode <{load_mode}>.')
+    if cached is not None:
+        model = port.load_appended(read_set, cached)
+        if model is not None:
+            return model
+    if load_mode == LoadMode.PARALLEL:
+        return port.load_chunked(read_set, workers=workers)
+    # other modes select reader, see readers.add(..., mode=).
+    return port.load(read_set)
+
+
+def make_cached_name(prefix: str, path: str) -> str:
+    """Name of model loaded from path: file stem with prefix."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f'{prefix}_{stem}' if prefix else stem
+
+
+def find_cached(cache: Cache, name: str) -> typing.Optional[typing.Any]:
+    """Cached model (spilled is restored), misses aren`t counted."""
+    if name in cache:
+        return cache.get(name)
+    return None
+
+
+def cache_model(cache: Cache, model: typing.Any) -> None:
+    """Add model to cache or replace model with the same name."""
+    if cache.peek(model.name) is None:
+        cache.add(model.name, model)
+    else:
+        cache.update(model.name, model)
 
 
 class SaveExcelFileCmdHandler(h.Handler):
@@ -35,14 +93,16 @@ class SaveExcelFileCmdHandler(h.Handler):
                     )
             model = self._cache.get(write_set.name)
             if model is None:
-                raise Exception(f"File {write_set.name} not found.")
+                reason = self._cache.missing_reason(write_set.name)
+                raise Exception(f"File {write_set.name} not found. {reason}")
             try:
                 dest.save(model, write_set)
             except Exception as e:
                 raise Exception(f"SAVING FAILED: file {model.name}, {e=}")
 
 
-class LoadExcelFileCmdHandler(h.Handler):
+class ConvertFileCmdHandler(h.Handler):
+    """Stream rows from source to destination file."""
 
     def __init__(
             self,
@@ -55,6 +115,44 @@ class LoadExcelFileCmdHandler(h.Handler):
     def fetch_events(self) -> typing.List[typing.Any]:
         return self._uow.events
 
+    def handle(self, cmd: ConvertFile) -> None:
+        with self._uow as operator:
+            port = operator.port
+            read_set = ReadSettings(
+                    name=cmd.fname,
+                    path=cmd.path,
+                    mode=cmd.mode,
+                    flag=cmd.flag,
+                    suffix=cmd.suffix
+                    )
+            write_set = WriteSettings(
+                    name=cmd.fname,
+                    path=cmd.dest_path,
+                    mode=cmd.mode,
+                    suffix=cmd.dest_suffix,
+                    )
+            try:
+                port.convert(read_set, write_set)
+            except Exception as e:
+                raise Exception(f"CONVERSION FAILED: file {cmd.path}, {e=}")
+
+
+class LoadExcelFileCmdHandler(h.Handler):
+
+    def __init__(
+            self,
+            uow: typing.Any,
+            cache: Cache,
+            *,
+            workers: typing.Optional[int] = None
+            ) -> None:
+        self._uow = uow
+        self._cache = cache
+        self._workers = workers
+
+    def fetch_events(self) -> typing.List[typing.Any]:
+        return self._uow.events
+
     def handle(self, cmd: LoadExcelFile) -> None:
         with self._uow as operator:
             source = operator.port
@@ -64,10 +162,17 @@ class LoadExcelFileCmdHandler(h.Handler):
                         path=cmd.path,
                         mode=cmd.mode,
                         flag=cmd.flag,
-                        suffix=cmd.suffix
+                        suffix=cmd.suffix,
+                        load_mode=cmd.load_mode
+                        )
+                model = load_model(
+                        source,
+                        read_set,
+                        cmd.load_mode,
+                        workers=self._workers,
+                        cached=find_cached(self._cache, cmd.fname)
                         )
-                model = source.load(read_set)
-                self._cache.add(model.name, model)
+                cache_model(self._cache, model)
             except Exception as err:
                 msg = f'Command handling failed with: {err}.'
                 raise Exception(msg)
@@ -78,10 +183,13 @@ class LoadTxtFileCmdHandler(h.Handler):
     def __init__(
             self,
             uow: typing.Any,
-            cache: Cache
+            cache: Cache,
+            *,
+            workers: typing.Optional[int] = None
             ) -> None:
         self._uow = uow
         self._cache = cache
+        self._workers = workers
 
     def fetch_events(self) -> typing.List[typing.Any]:
         return self._uow.events
@@ -97,9 +205,175 @@ class LoadTxtFileCmdHandler(h.Handler):
                         flag=cmd.flag,
                         suffix=cmd.suffix
                         )
-                model = source.load(read_txt)
-                self._cache.add(model.name, model)
+                model = load_model(
+                        source,
+                        read_txt,
+                        cmd.load_mode,
+                        workers=self._workers,
+                        cached=find_cached(self._cache, cmd.fname)
+                        )
+                cache_model(self._cache, model)
             except Exception as err:
                 msg = f'{self.__class__.__name__} failed '\
                       f'with exception: {err}.'
                 raise Exception(msg)
+
+
+class LoadManyFilesCmdHandler(h.Handler):
+    """
+    Load files matched by glob in process pool,
+    each model is cached by file name (with prefix).
+    """
+
+    def __init__(
+            self,
+            uow: typing.Any,
+            cache: Cache,
+            *,
+            workers: typing.Optional[int] = None
+            ) -> None:
+        self._uow = uow
+        self._cache = cache
+        self._workers = workers
+
+    def fetch_events(self) -> typing.List[typing.Any]:
+        return self._uow.events
+
+    def handle(self, cmd: LoadManyFiles) -> None:
+        paths = sorted(glob.glob(cmd.path))
+        if not paths:
+            raise Exception(f'No files match {cmd.path}.')
+
+        with self._uow as operator:
+            read_sets = [
+                    ReadSettings(
+                        name=make_cached_name(cmd.fname, path),
+                        path=path,
+                        mode=cmd.mode,
+                        flag=cmd.flag,
+                        suffix=cmd.suffix
+                        )
+                    for path in paths
+                    ]
+            failed = []
+            results = operator.port.load_many(
+                    read_sets,
+                    workers=self._workers
+                    )
+            for result in results:
+                self._report(result)
+                if result.model is None:
+                    failed.append(result.settings.path)
+                else:
+                    self._cache.add(result.model.name, result.model)
+
+        if failed:
+            msg = f'{len(failed)} of {len(paths)} files not loaded: '\
+                  f'{", ".join(failed)}.'
+            raise Exception(msg)
+
+    @staticmethod
+    def _report(result: typing.Any) -> None:
+        name = result.settings.name
+        if result.model is None:
+            line = f'FAILED {name}: {result.failure}'
+        else:
+            line = f'loaded {name}: {result.model.rows_count} rows'
+        print(line, file=sys.stdout)
+        for err in result.errors:
+            print(f'    {name}: {err}', file=sys.stdout)
+
+
+class WatchFilesCmdHandler(h.Handler):
+    """
+    Watch files matched by glob: new and changed files are
+    loaded in background thread and cached by file name
+    (with prefix), like loadmany does. Appended lines of
+    cached .txt model are parsed only. With backend, loads
+    are ordered with commands of the same model.
+    """
+
+    def __init__(
+            self,
+            uow: typing.Any,
+            cache: Cache,
+            watchers: Watchers,
+            *,
+            interval: typing.Optional[float] = None,
+            backend: typing.Optional[typing.Any] = None
+            ) -> None:
+        self._uow = uow
+        self._cache = cache
+        self._watchers = watchers
+        self._interval = interval or WATCH_INTERVAL
+        self._backend = backend
+
+    def fetch_events(self) -> typing.List[typing.Any]:
+        return self._uow.events
+
+    def handle(self, cmd: WatchFiles) -> None:
+        watcher = FileWatcher(
+                cmd.path,
+                functools.partial(self._load_changed, cmd),
+                interval=self._interval
+                )
+        self._watchers.start(watcher)
+        print(f'watching {cmd.path}', file=sys.stdout)
+
+    def _load_changed(self, cmd: WatchFiles, paths: typing.List[str]) -> None:
+        """Called in watcher thread."""
+        for path in paths:
+            read_set = ReadSettings(
+                    name=make_cached_name(cmd.fname, path),
+                    path=path,
+                    mode=cmd.mode,
+                    flag=cmd.flag,
+                    suffix=cmd.suffix,
+                    load_mode=cmd.load_mode
+                    )
+            try:
+                if self._backend is None:
+                    model = self._load(read_set)
+                else:
+                    model = self._backend.submit(
+                            read_set.name,
+                            self._load,
+                            read_set
+                            ).result()
+                line = f'watch: loaded {model.name}: {model.rows_count} rows'
+            except Exception as e:
+                line = f'watch: FAILED {read_set.name}: {e}'
+            print(line, file=sys.stdout)
+
+    def _load(self, read_set: ReadSettings) -> typing.Any:
+        with self._uow as operator:
+            model = load_model(
+                    operator.port,
+                    read_set,
+                    read_set.load_mode,
+                    cached=find_cached(self._cache, read_set.name)
+                    )
+        cache_model(self._cache, model)
+        return model
+
+
+class UnwatchFilesCmdHandler(h.Handler):
+    """Stop watcher of glob or all watchers."""
+
+    def __init__(
+            self,
+            uow: typing.Any,
+            watchers: Watchers
+            ) -> None:
+        self._uow = uow
+        self._watchers = watchers
+
+    def fetch_events(self) -> typing.List[typing.Any]:
+        return self._uow.events
+
+    def handle(self, cmd: UnwatchFiles) -> None:
+        stopped = self._watchers.stop(cmd.path)
+        if not stopped:
+            raise Exception(f'No watchers of {cmd.path or "files"}.')
+        for pattern in stopped:
+            print(f'stopped watching {pattern}', file=sys.stdout)
@@ -7,6 +7,7 @@ class ReadSettings(typing.NamedTuple):
     mode: bool
     flag: str
     suffix: str
+    load_mode: str = ''
 
 
 class WriteSettings(typing.NamedTuple):
@@ -20,6 +20,7 @@ class LoadExcelFile(c_msg.Command):
     mode: bool  # read_only -> bool
     fname: str
     suffix: str
+    load_mode: str
 
 
 @command_validator(
@@ -37,6 +38,51 @@ class LoadTxtFile(c_msg.Command):
     mode: str
     fname: str
     suffix: str
+    load_mode: str
+
+
+@command_validator(
+        cst.SysCommandType.IO_READ,
+        check_flag=True,
+        check_suffix=True
+        )
+@dataclasses.dataclass
+class LoadManyFiles(c_msg.Command):
+    # fname is prefix: command is ordered with models of prefix.
+    prefix_key = True
+
+    name: str
+    path: str  # glob pattern: /dir/*.txt
+    flag: str
+    mode: bool  # read_only -> bool
+    fname: str  # prefix of cached names
+    suffix: str
+
+
+@command_validator(
+        cst.SysCommandType.IO_READ,
+        check_flag=True,
+        check_suffix=True
+        )
+@dataclasses.dataclass
+class WatchFiles(c_msg.Command):
+    # fname is prefix: command is ordered with models of prefix.
+    prefix_key = True
+
+    name: str
+    path: str  # glob pattern: /dir/*.txt
+    flag: str
+    mode: bool  # read_only -> bool
+    fname: str  # prefix of cached names
+    suffix: str
+    load_mode: str
+
+
+@command_validator(cst.SysCommandType.INT_TASK)
+@dataclasses.dataclass
+class UnwatchFiles(c_msg.Command):
+    name: str
+    path: str  # all watchers are stopped, if empty
 
 
 @command_validator(
@@ -52,3 +98,23 @@ class SaveExcelFile(c_msg.Command):
     mode: bool  # write_only -> bool
     fname: str
     suffix: str
+
+
+@command_validator(
+        cst.SysCommandType.IO_READ,
+        check_path=True,
+        check_flag=True,
+        check_args=True,
+        check_suffix=True,
+        check_dest_suffix=True
+        )
+@dataclasses.dataclass
+class ConvertFile(c_msg.Command):
+    name: str
+    path: str
+    flag: str
+    mode: bool  # read_only, write_only -> bool
+    fname: str
+    suffix: str
+    dest_path: str
+    dest_suffix: str
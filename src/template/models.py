@@ -1,6 +1,8 @@
 import typing
 import enum
 import collections
+import functools
+import sys
 
 from .core_presets import text_utils as t_ut
 from .core_presets import domain_models as dm
@@ -22,6 +24,11 @@ NEW_SYMBOLS: typing.List[str] = [
         TAB_REPLACE
         ]
 
+# repeated cities and carriers share one str object.
+INTERN_STRINGS: bool = True
+# values per column, used for footprint estimation.
+FOOTPRINT_SAMPLE_SIZE: typing.Final[int] = 512
+
 
 class TemplateError(Exception):
     pass
@@ -82,7 +89,7 @@ class _CellValueCleaner:
 
     def clean_values(
             self,
-            values: typing.List[str],
+            values: typing.Iterable[typing.Sequence[str]],
             *,
             max_item: int = 10
             ) -> typing.Tuple[typing.Tuple[str]]:
@@ -91,7 +98,7 @@ class _CellValueCleaner:
         max_item = max_item if isinstance(max_item, int) else 10
         for idx, val in enumerate(values):
             if idx <= max_item:
-                cleaned = self._clean(val.values)
+                cleaned = self._clean(val)
                 result.append(cleaned)
             else:
                 break
@@ -275,6 +282,126 @@ class _StringArrayDropper:
             return idx - max(indexes)
 
 
+@functools.lru_cache(maxsize=128)
+def _make_row_type(
+        name: str,
+        headers: typing.Tuple[str]
+        ) -> typing.Type[tuple]:
+    """One namedtuple class per headers set."""
+    return collections.namedtuple(name, headers)
+
+
+class _ColumnStorage:
+    """
+    Sheet values stored by columns:
+    one list per header instead of object per row.
+    """
+
+    __slots__ = [
+            '_columns',
+            '_intern',
+            '_count',
+            ]
+
+    def __init__(
+            self,
+            width: int,
+            *,
+            intern_strings: bool = INTERN_STRINGS
+            ) -> None:
+        self._columns = tuple([] for _ in range(width))
+        self._intern = intern_strings
+        self._count = 0
+
+    @classmethod
+    def from_columns(
+            cls,
+            columns: typing.Sequence[typing.List[typing.Any]],
+            *,
+            intern_strings: bool = INTERN_STRINGS
+            ) -> '_ColumnStorage':
+        """Storage over ready columns, lists aren`t copied."""
+        counts = {len(column) for column in columns}
+        if len(counts) > 1:
+            raise InvalidRowValues(f'Columns have different length: {counts}.')
+        storage = cls(0, intern_strings=intern_strings)
+        storage._columns = tuple(columns)
+        storage._count = counts.pop() if counts else 0
+        return storage
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def width(self) -> int:
+        return len(self._columns)
+
+    @property
+    def columns(self) -> typing.Tuple[typing.List[typing.Any]]:
+        return self._columns
+
+    def append(self, values: typing.Sequence[typing.Any]) -> None:
+        if len(values) != len(self._columns):
+            err_msg = f'Row {values} length != {len(self._columns)}.'
+            raise InvalidRowValues(err_msg)
+        if self._intern:
+            intern = sys.intern
+            for column, value in zip(self._columns, values):
+                if type(value) is str:
+                    value = intern(value)
+                column.append(value)
+        else:
+            for column, value in zip(self._columns, values):
+                column.append(value)
+        self._count += 1
+
+    def estimate_nbytes(
+            self,
+            *,
+            sample_size: int = FOOTPRINT_SAMPLE_SIZE
+            ) -> int:
+        """
+        Estimate memory, used by columns.
+        Values size is calculated on evenly spaced sample:
+        values met once are scaled to column length,
+        repeated objects (interned strings) are counted once.
+        """
+        getsize = sys.getsizeof
+        total = getsize(self._columns)
+        for column in self._columns:
+            total += getsize(column)
+            count = len(column)
+            if not count:
+                continue
+            step = max(count // sample_size, 1)
+            sample = column[::step]
+            seen = collections.Counter(id(v) for v in sample)
+            single = shared = 0
+            for value in {id(v): v for v in sample}.values():
+                if seen[id(value)] == 1:
+                    single += getsize(value)
+                else:
+                    shared += getsize(value)
+            total += shared + single * count // len(sample)
+        return total
+
+    def rows(
+            self,
+            start: int = 0,
+            stop: typing.Optional[int] = None
+            ) -> typing.Generator:
+        """Return generator that return list at each iteration."""
+        stop = self._count if stop is None else min(stop, self._count)
+        if start >= stop:
+            return (_ for _ in ())
+        if start == 0 and stop == self._count:
+            return (list(row) for row in zip(*self._columns))
+        return (
+                [column[idx] for column in self._columns]
+                for idx in range(start, stop)
+                )
+
+
 class TableRow:
 
     __slots__ = [
@@ -292,9 +419,9 @@ class TableRow:
             err_msg = f'Some values in {headers} are empty.'
             raise InvalidRowValues(err_msg)
         try:
-            self._rate = collections.namedtuple(
+            self._rate = _make_row_type(
                     self._name,
-                    headers
+                    tuple(headers)
                     )
         except ValueError as e:
             inst_name = self.__class__.__name__
@@ -363,20 +490,26 @@ class SheetTemplate(dm.TableSheetModel):
             return t_ut.SymbolsGroupOrder(positions)
 
     _groups = SymbolsGroupPosition
+    _preview_rows: int = 11
 
     @classmethod
     def make_new_model(cls, *args, **kwargs) -> "dm.TableSheetModel":
         """base impl of factory method."""
         return cls(*args, **kwargs)
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+            self,
+            *args,
+            intern_strings: bool = INTERN_STRINGS,
+            **kwargs
+            ) -> None:
         self._name = None
         self._events = collections.deque()
         self._headers: typing.Optional[TableRow] = None
-        self._values: typing.Optional[
-                typing.List[TableRow]
-                ] = []
+        self._values: typing.Optional[_ColumnStorage] = None
+        self._intern = intern_strings
         self._rows_count = 0
+        self._source = None
         self._cache = ValueCache()
         self._cleaner = _CellValueCleaner(
                 REPLACED_SYMBOLS,
@@ -386,6 +519,33 @@ class SheetTemplate(dm.TableSheetModel):
     def __repr__(self) -> str:
         return f'{self.__class__.__name__} {self._rows_count}.'
 
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        """Compact state for pickling: headers and columns only."""
+        headers = None
+        if self._headers is not None:
+            headers = list(self._headers.values)
+        return {
+                'name': self._name,
+                'intern': self._intern,
+                'headers': headers,
+                'values': self._values,
+                'rows_count': self._rows_count,
+                'cached': self._cache._items_map,
+                'source': self._source,
+                }
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        self.__init__(intern_strings=state['intern'])
+        self._name = state['name']
+        if state['headers'] is not None:
+            table_row = TableRow(state['headers'])
+            table_row.set_values(0, state['headers'])
+            self._headers = table_row
+        self._values = state['values']
+        self._rows_count = state['rows_count']
+        self._cache._items_map = state['cached']
+        self._source = state.get('source')
+
     @property
     def name(self) -> str:
         if self._name is None:
@@ -405,6 +565,38 @@ class SheetTemplate(dm.TableSheetModel):
     def rows_count(self) -> int:
         return self._rows_count
 
+    @property
+    def headers(self) -> typing.List[str]:
+        if self._headers is None:
+            return []
+        return [*self._headers.values]
+
+    @property
+    def columns(self) -> typing.Tuple[typing.List[typing.Any]]:
+        """Values stored by columns, rows aren`t built."""
+        if self._values is None:
+            return ()
+        return self._values.columns
+
+    @property
+    def source(self) -> typing.Any:
+        """Parsed part of source file, set by adapter."""
+        return self._source
+
+    @source.setter
+    def source(self, state: typing.Any) -> None:
+        self._source = state
+
+    @property
+    def memory_footprint(self) -> int:
+        """Estimated size of model in bytes."""
+        total = sys.getsizeof(self)
+        if self._headers is not None:
+            total += sum(sys.getsizeof(h) for h in self._headers.values)
+        if self._values is not None:
+            total += self._values.estimate_nbytes()
+        return total
+
     @property
     def events(self) -> typing.List:
         events_cnt = len(self._events)
@@ -417,7 +609,9 @@ class SheetTemplate(dm.TableSheetModel):
     def get_sheet_struct(self) -> ExcelSheetStruct:
         headers = tuple(self._headers.values)
         if self._values is not None:
-            cleaned_values = self._cleaner.clean_values(self._values)
+            cleaned_values = self._cleaner.clean_values(
+                    self._values.rows(stop=self._preview_rows)
+                    )
             return ExcelSheetStruct(name=self._name,
                                     headers=headers,
                                     values=cleaned_values)
@@ -431,9 +625,9 @@ class SheetTemplate(dm.TableSheetModel):
         Return generator that return list[str] at each iteration.
         """
 
-        return (
-                [*v.values] for v in (self._headers, *self._values)
-                )
+        yield [*self._headers.values]
+        if self._values is not None:
+            yield from self._values.rows()
 
     def validate(
             self,
@@ -456,11 +650,39 @@ class SheetTemplate(dm.TableSheetModel):
                     headers
                     )
             self._headers = table_row
+            self._values = _ColumnStorage(
+                    table_row.columns,
+                    intern_strings=self._intern
+                    )
         except InvalidRowValues as e:
             print(e)
         except (Exception, BaseException) as err:
             print(f'Unexpected Exception: {err}')
 
+    def restore(
+            self,
+            headers: typing.List[str],
+            columns: typing.Sequence[typing.List[typing.Any]]
+            ) -> None:
+        """
+        Set parsed headers and values (snapshot loading),
+        values aren`t validated and expanded again.
+        """
+        table_row = TableRow(headers)
+        table_row.set_values(0, headers)
+        values = _ColumnStorage.from_columns(
+                columns,
+                intern_strings=self._intern
+                )
+        if values.width != table_row.columns:
+            err_msg = f'{values.width} columns for {len(headers)} headers.'
+            raise InvalidRowValues(err_msg)
+        self._headers = table_row
+        self._values = values
+        self._rows_count = len(values)
+        if self._rows_count:
+            self._cache.update(next(values.rows(self._rows_count - 1)))
+
     def _reorder_headers(
             self,
             headers: typing.List[str]
@@ -478,6 +700,18 @@ class SheetTemplate(dm.TableSheetModel):
             self,
             values: typing.List[str]
             ) -> None:
+        for row in self.expand_values(values):
+            self._make_row(row)
+
+    def expand_values(
+            self,
+            values: typing.List[str]
+            ) -> typing.Generator:
+        """
+        Return rows, made from values: empty cells filled
+        by previous values, arrays like a/b dropped to rows.
+        Rows aren`t stored in model.
+        """
         arrays_dropper = _StringArrayDropper()
         self._cache.update(values, fill_none=True)
         collected = arrays_dropper.collect_array_items(values)
@@ -485,15 +719,10 @@ class SheetTemplate(dm.TableSheetModel):
             for row in collected.rows():
                 start, end = arrays_dropper.array_slice
                 values[start:end] = row
-                self._make_row(values)
+                yield list(values)
         else:
-            self._make_row(values)
+            yield values
 
     def _make_row(self, values: typing.List[str]) -> None:
-        rate_row = TableRow(tuple(self._headers.keys))
+        self._values.append(values)
         self._rows_count += 1
-        rate_row.set_values(
-                self._rows_count,
-                values
-                )
-        self._values.append(rate_row)
@@ -0,0 +1,119 @@
+"""
+Polling file watcher. Files matched by glob are checked
+by stat() in background thread, new or changed (size or
+mtime) files are passed to callback. Stdlib has no inotify
+binding, and stat() of supplier directory is cheap.
+"""
+import os
+import sys
+import glob
+import stat
+import typing
+import threading
+
+
+# seconds between two scans of watched files.
+WATCH_INTERVAL: float = 2.0
+
+
+class FileWatcher:
+    """Call on_change(paths) for new or changed files."""
+
+    def __init__(
+            self,
+            pattern: str,
+            on_change: typing.Callable[[typing.List[str]], None],
+            *,
+            interval: float = WATCH_INTERVAL
+            ) -> None:
+        self._pattern = pattern
+        self._on_change = on_change
+        self._interval = interval
+        self._seen: typing.Dict[str, typing.Tuple[int, int]] = {}
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def pattern(self) -> str:
+        return self._pattern
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def poll(self) -> typing.List[str]:
+        """Scan files once, return new or changed paths."""
+        current = {}
+        for path in sorted(glob.glob(self._pattern)):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                current[path] = (st.st_size, st.st_mtime_ns)
+        changed = [
+                path for path, state in current.items()
+                if self._seen.get(path) != state
+                ]
+        self._seen = current
+        return changed
+
+    def start(self) -> None:
+        if self.running:
+            return None
+        self._stopped.clear()
+        self._thread = threading.Thread(
+                target=self._run,
+                name=f'watch {self._pattern}',
+                daemon=True
+                )
+        self._thread.start()
+
+    def stop(self, timeout: typing.Optional[float] = None) -> None:
+        """Stop watching, file in loading is loaded to the end."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                changed = self.poll()
+                if changed:
+                    self._on_change(changed)
+            except Exception as e:
+                print(f'watch {self._pattern} failed: {e!r}', file=sys.stderr)
+            self._stopped.wait(self._interval)
+
+
+class Watchers:
+    """Running watchers by glob pattern."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._watchers: typing.Dict[str, FileWatcher] = {}
+
+    @property
+    def patterns(self) -> typing.List[str]:
+        with self._lock:
+            return [p for p, w in self._watchers.items() if w.running]
+
+    def start(self, watcher: FileWatcher) -> None:
+        with self._lock:
+            current = self._watchers.get(watcher.pattern)
+            if current is not None and current.running:
+                raise Exception(f'{watcher.pattern} is watched already.')
+            self._watchers[watcher.pattern] = watcher
+            watcher.start()
+
+    def stop(self, pattern: str = '') -> typing.List[str]:
+        """Stop watcher of pattern (all, if not set), return patterns."""
+        with self._lock:
+            if pattern:
+                stopped = [pattern] if pattern in self._watchers else []
+            else:
+                stopped = list(self._watchers)
+            watchers = [self._watchers.pop(p) for p in stopped]
+        for watcher in watchers:
+            watcher.stop()
+        return stopped
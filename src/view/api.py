@@ -2,9 +2,17 @@ from .core_presets import command_filters as cf
 from .core_presets import CmdKey
 from .core_presets import receiver
 from .messages import ShowModelPreview
+from .messages import ShowCachedModels
+from .messages import ShowFilePreview
+from .messages import ShowJobs
+from .messages import SetTimings
 from .core_presets import api_router
 
 
+# preview reads only first rows of file.
+READ_ONLY: bool = True
+
+
 @api_router.route(CmdKey.SHOWPREV.value)
 def display_preview(
         cmd: cf.TerminalCommand
@@ -15,3 +23,39 @@ def display_preview(
             fname=filename
             )
     receiver.receive(_cmd)
+
+
+@api_router.route(CmdKey.SHOWCACHED.value)
+def display_cached(
+        cmd: cf.TerminalCommand
+        ) -> None:
+    _cmd = ShowCachedModels(name=cmd.cmd)
+    receiver.receive(_cmd)
+
+
+@api_router.route(CmdKey.STATUS.value)
+def display_jobs(
+        cmd: cf.TerminalCommand
+        ) -> None:
+    receiver.receive(ShowJobs(name=cmd.cmd))
+
+
+@api_router.route(CmdKey.TIMINGS.value)
+def set_timings(
+        cmd: cf.TerminalCommand
+        ) -> None:
+    receiver.receive(SetTimings(name=cmd.cmd, state=''.join(cmd.args)))
+
+
+@api_router.route(CmdKey.PREVIEWFILE.value)
+def display_file_preview(
+        cmd: cf.TerminalCommand
+        ) -> None:
+    _cmd = ShowFilePreview(
+            name=cmd.cmd,
+            path=cmd.path,
+            flag=cmd.flag,
+            mode=READ_ONLY,
+            suffix=cmd.suffix
+            )
+    receiver.receive(_cmd)
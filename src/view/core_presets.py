@@ -6,6 +6,8 @@ from core import handlers
 from core import command_filters
 from core.terminal_commands import CmdKey, command_validator
 from core import sys_constants
+from core import timings
+from core.cache import format_bytes
 
 
 constants = sys_constants
@@ -21,4 +23,6 @@ __all__ = [
         'command_filters',
         'command_validator',
         "constants",
+        "format_bytes",
+        "timings",
         ]
@@ -3,15 +3,45 @@ import sys
 
 from .core_presets import handlers as h
 from .core_presets import Cache
+from .core_presets import format_bytes
+from .core_presets import timings
 from .messages import ShowModelPreview
+from .messages import ShowCachedModels
+from .messages import ShowFilePreview
+from .messages import ShowJobs
+from .messages import SetTimings
+from template.io_presets import ReadSettings
 from services.preview_builders import PreviewFactory, PreviewSettingsFactory
 
 
+# rows count in preview of file.
+PREVIEW_ROWS: int = 11
+
+
 def draw_preview(preview: typing.Generator) -> None:
     for line in preview:
         print(line, file=sys.stdout)
 
 
+def show_model_preview(model: typing.Any) -> None:
+    sheet = model.get_sheet_struct
+    preview_fact = PreviewFactory()
+    prev_set_factory = PreviewSettingsFactory()
+    pr_settings = None
+    try:
+        if prev_set_factory.sheet_is_valid(sheet):
+            prev_set_factory.calculate_preview_settings(sheet)
+            pr_settings = prev_set_factory.preview_settings
+
+        if preview_fact.pair_is_valid(sheet, pr_settings):
+            preview_fact.create_preview(sheet, pr_settings)
+            draw_preview(preview_fact.preview)
+
+    except Exception as e:
+        msg = f'Command preview creation failed: {e}.'
+        raise Exception(msg)
+
+
 class ShowPreviewCmdHandler(h.Handler):
 
     def __init__(
@@ -30,26 +60,157 @@ class ShowPreviewCmdHandler(h.Handler):
             cmd: ShowModelPreview
             ) -> None:
         with self._uow:
-
-            preview_fact = None
-            prev_set_factory = None
-            sheet = None
-            pr_settings = None
-
             model = self._cache.get(cmd.fname)
-            if model:
-                sheet = model.get_sheet_struct
-                preview_fact = PreviewFactory()
-                prev_set_factory = PreviewSettingsFactory()
-            try:
-                if prev_set_factory.sheet_is_valid(sheet):
-                    prev_set_factory.calculate_preview_settings(sheet)
-                    pr_settings = prev_set_factory.preview_settings
-
-                if preview_fact.pair_is_valid(sheet, pr_settings):
-                    preview_fact.create_preview(sheet, pr_settings)
-                    draw_preview(preview_fact.preview)
-
-            except Exception as e:
-                msg = f'Command preview creation failed: {e}.'
+            if model is None:
+                msg = f'File {cmd.fname} not found. '\
+                      f'{self._cache.missing_reason(cmd.fname)}'
                 raise Exception(msg)
+            show_model_preview(model)
+
+
+class ShowFilePreviewCmdHandler(h.Handler):
+    """Preview first rows of file, model isn`t cached."""
+
+    def __init__(
+            self,
+            uow: typing.Any,
+            cache: Cache
+            ):
+        self._uow = uow
+        self._cache = cache
+
+    def fetch_events(self) -> typing.List[typing.Any]:
+        return self._uow.events
+
+    def handle(
+            self,
+            cmd: ShowFilePreview
+            ) -> None:
+        with self._uow as operator:
+            read_set = ReadSettings(
+                    name=cmd.path,
+                    path=cmd.path,
+                    mode=cmd.mode,
+                    flag=cmd.flag,
+                    suffix=cmd.suffix
+                    )
+            model = operator.port.load(read_set, max_rows=PREVIEW_ROWS)
+            show_model_preview(model)
+
+
+class ShowCachedCmdHandler(h.Handler):
+
+    _row: typing.Final[str] = '{:<24} {:>10} {:>12}'
+
+    def __init__(
+            self,
+            uow: typing.Any,
+            cache: Cache
+            ):
+        self._uow = uow
+        self._cache = cache
+
+    def fetch_events(self) -> typing.List[typing.Any]:
+        return self._uow.events
+
+    def handle(
+            self,
+            cmd: ShowCachedModels
+            ) -> None:
+        lines = [self._row.format('NAME', 'ROWS', 'SIZE')]
+        for name, size in self._cache.entries():
+            model = self._cache.peek(name)
+            rows = getattr(model, 'rows_count', '-')
+            lines.append(self._row.format(name, rows, format_bytes(size)))
+        for name, size in self._cache.spilled_entries():
+            size = f'{format_bytes(size)} (disk)'
+            lines.append(self._row.format(name, '-', size))
+        lines.append(f'Cache: {self._cache.usage}.')
+        draw_preview(lines)
+
+
+class ShowJobsCmdHandler(h.Handler):
+    """
+    Jobs of async scheduler: in flight and last finished,
+    and counters of queues (objects with stats()).
+    """
+
+    blocking: bool = False
+    _row: typing.Final[str] = '{:>5} {:<8} {:>9}  {}'
+
+    def __init__(
+            self,
+            uow: typing.Any,
+            scheduler: typing.Any,
+            *,
+            queues: typing.Sequence[typing.Any] = ()
+            ):
+        self._uow = uow
+        self._scheduler = scheduler
+        self._queues = queues
+
+    def fetch_events(self) -> typing.List[typing.Any]:
+        return self._uow.events
+
+    def handle(
+            self,
+            cmd: ShowJobs
+            ) -> None:
+        lines = [self._row.format('ID', 'STATE', 'TIME', 'COMMAND')]
+        in_flight = 0
+        for job in self._scheduler.jobs():
+            if job.name == type(cmd).__name__:
+                continue
+            in_flight += job.in_flight
+            command = job.command
+            if job.error:
+                command = f'{command}: {job.error}'
+            lines.append(self._row.format(
+                job.id,
+                job.state.value,
+                f'{job.elapsed:.1f}s',
+                command
+                ))
+        lines.append(f'Jobs in flight: {in_flight}.')
+        lines.extend(map(self._format_queue, self._queues))
+        draw_preview(lines)
+
+    @staticmethod
+    def _format_queue(queue: typing.Any) -> str:
+        stats = queue.stats()
+        counters = stats.metrics
+        limits = ''
+        if stats.high is not None:
+            throttled = ', throttled' if stats.throttled else ''
+            limits = f' (high {stats.high}, low {stats.low}{throttled})'
+        return (
+                f'Queue {stats.name}: depth {stats.depth}{limits}, '
+                f'max {counters.max_depth}, puts {counters.puts}, '
+                f'waits {counters.waits} ({counters.wait_time:.1f}s), '
+                f'rejected {counters.rejected}, '
+                f'repacked {counters.repacked}, '
+                f'dropped {counters.dropped}.'
+                )
+
+
+class SetTimingsCmdHandler(h.Handler):
+    """Switch per-stage timings of next commands."""
+
+    blocking: bool = False
+    _states: typing.Final[typing.Dict[str, bool]] = {'on': True, 'off': False}
+
+    def __init__(self, uow: typing.Any) -> None:
+        self._uow = uow
+
+    def fetch_events(self) -> typing.List[typing.Any]:
+        return self._uow.events
+
+    def handle(self, cmd: SetTimings) -> None:
+        if not cmd.state:
+            timings.enable(not timings.enabled())
+        elif cmd.state in self._states:
+            timings.enable(self._states[cmd.state])
+        else:
+            raise Exception(f'Invalid timings state: {cmd.state}.')
+        state = 'on' if timings.enabled() else 'off'
+        print(f'timings: {state}', file=sys.stdout)
@@ -10,3 +10,37 @@ from .core_presets import constants as cst
 class ShowModelPreview(msg.Command):
     name: str
     fname: str
+
+
+@command_validator(cst.SysCommandType.INT_TASK)
+@dataclasses.dataclass
+class ShowCachedModels(msg.Command):
+    name: str
+
+
+@command_validator(cst.SysCommandType.INT_TASK)
+@dataclasses.dataclass
+class ShowJobs(msg.Command):
+    name: str
+
+
+@command_validator(cst.SysCommandType.INT_TASK)
+@dataclasses.dataclass
+class SetTimings(msg.Command):
+    name: str
+    state: str  # on, off or empty to toggle
+
+
+@command_validator(
+        cst.SysCommandType.IO_READ,
+        check_path=True,
+        check_flag=True,
+        check_suffix=True
+        )
+@dataclasses.dataclass
+class ShowFilePreview(msg.Command):
+    name: str
+    path: str
+    flag: str
+    mode: bool  # read_only -> bool
+    suffix: str
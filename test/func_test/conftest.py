@@ -0,0 +1,56 @@
+import logging
+import typing
+
+import pytest
+
+from services import drivers
+from services import services
+from core import terminal_commands as tc
+from core.settings import settings
+from template import tmp_models
+
+
+TXT_FLAG = '--t'
+TXT_TEXT = 'POL-POD $RATE\nShanghai-Vladivostok $2600\nXiamen-Moscow $9500\n'
+_HEADERS_KEY = 'TEST_TXT_HEADERS'
+_CONFIG = {
+        _HEADERS_KEY: 'POL, POD, RATE',
+        'RE_POL': r'^(?P<pol>[A-Za-z ]+)-.+$',
+        'RE_POD': r'^[A-Za-z ]+-(?P<pod>[A-Za-z ]+)\s.+$',
+        'RE_RATE': r'^.+\$(?P<rate>\d+).*$',
+        }
+
+
+@pytest.fixture(scope='session')
+def txt_adapter() -> typing.Callable[..., services.BaseFileIOAdapter]:
+    """
+    Factory of adapters, that load .txt rates with TXT_FLAG
+    and save .csv. Repos are module-global and the first
+    registration wins, so they are filled here only once.
+    """
+    headers = settings._fetch_env_value(_HEADERS_KEY, _CONFIG)
+    keys = [k for k in _CONFIG if k.startswith('RE')]
+    builder = settings.pattern()
+    builder.build_from(_HEADERS_KEY, keys, headers, _CONFIG)
+
+    readers = tc.get_readers_repo()
+    readers.add('.txt', (
+        drivers.TxtDriver(logging.getLogger(), drivers.TxtCompiler()),
+        services.TxtFileReader()
+        ))
+    flags = tc.flags()
+    flags.add(TXT_FLAG, builder.get(_HEADERS_KEY))
+    writers = tc.get_writers_repo()
+    writers.add('.csv', (
+        drivers.ExcelSaveDriver(logging.getLogger()),
+        services.CsvFileWriter()
+        ))
+
+    def make(**kwargs) -> services.BaseFileIOAdapter:
+        return services.BaseFileIOAdapter(
+                drivers.LoadConfigurator(readers, flags),
+                drivers.DumpConfigurator(writers),
+                tmp_models.SheetTemplate(),
+                **kwargs
+                )
+    return make
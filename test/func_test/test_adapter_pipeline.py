@@ -0,0 +1,72 @@
+import csv
+
+import pytest
+
+from core import command_filters as cf
+from core import terminal_commands as tc
+from template.io_presets import ReadSettings
+from template.io_presets import WriteSettings
+
+from .conftest import TXT_FLAG
+from .conftest import TXT_TEXT
+
+
+_ROWS = [['POL', 'POD', 'RATE']] + [
+        [f'Port {chr(65 + idx)}', 'Moscow', str(idx)] for idx in range(7)
+        ]
+
+
+@pytest.fixture
+def read_set(tmp_path) -> ReadSettings:
+    path = tmp_path / 'rates.txt'
+    lines = TXT_TEXT.splitlines()[:1]
+    lines += [f'{pol}-{pod} ${rate}' for pol, pod, rate in _ROWS[1:]]
+    path.write_text('\n'.join(lines) + '\n')
+    return ReadSettings('rates', str(path), False, TXT_FLAG, '.txt')
+
+
+@pytest.mark.parametrize('raw_cmd, key, dest', [
+    ('loadfile /x.txt --m | savefile /y.csv', tc.CmdKey.CONVERT, '/y.csv'),
+    ('loadfile /x.txt --m | showprev', tc.CmdKey.PREVIEWFILE, ''),
+    ])
+def test_pipeline_is_routed_by_joined_names(
+        monkeypatch,
+        raw_cmd: str,
+        key: str,
+        dest: str
+        ) -> None:
+    # filters are class state, other tests expect them empty.
+    monkeypatch.setattr(cf.PostProcessor, '_filters_map', {})
+    cf.set_postprocessor_filters(cf.PostProcessor, {
+        cf.PATH_FILTER_KEY: cf.FetchSuffixFilter,
+        cf.ARGS_FILTER_KEY: cf.ArgsToListFilter,
+        })
+    templates = list(cf.make_templates(raw_cmd))
+    cmd = cf.PostProcessor.make_pipeline(templates)
+
+    assert cmd.cmd == key
+    assert (cmd.path, cmd.suffix) == ('/x.txt', '.txt')
+    assert [item.path for item in cmd.pipe] == [dest]
+    cf.check_command_subscribed(cmd, {key: print})
+
+
+def test_convert_writes_parsed_rows(txt_adapter, read_set, tmp_path) -> None:
+    dest = WriteSettings('rates', str(tmp_path / 'y.csv'), True, '.csv')
+    assert txt_adapter().convert(read_set, dest) == len(_ROWS)
+    with open(dest.path, newline='') as file:
+        assert list(csv.reader(file)) == _ROWS
+
+
+def test_stream_yields_batches_of_rows(txt_adapter, read_set) -> None:
+    adapter = txt_adapter()
+    batches = list(adapter.stream(read_set, batch_size=3))
+    assert all(len(batch) <= 3 for batch in batches)
+    rows = [row for batch in batches for row in batch]
+    assert [[str(v) for v in row] for row in rows] == _ROWS
+    assert rows == list(adapter.load(read_set).rows)
+
+
+def test_preview_stops_after_max_rows(txt_adapter, read_set) -> None:
+    preview = txt_adapter().load(read_set, max_rows=2)
+    assert preview.rows_count == 2
+    assert [[str(v) for v in row] for row in preview.rows] == _ROWS[:3]
@@ -0,0 +1,66 @@
+import dataclasses
+import threading
+
+from core import async_exchange as ae
+from core import channels
+from core import exchange
+from core import messages
+
+
+@dataclasses.dataclass
+class _Load(messages.Command):
+    name: str
+    path: str
+
+
+@dataclasses.dataclass
+class _Status(messages.Command):
+    name: str
+
+
+class _Handler:
+
+    def __init__(self, *, blocking: bool = True) -> None:
+        self.blocking = blocking
+        self.release = threading.Event()
+        self.threads = []
+
+    def handle(self, cmd) -> None:
+        self.threads.append(threading.current_thread().name)
+        if getattr(cmd, 'path', '') == 'broken.txt':
+            raise Exception('broken file')
+        if self.blocking:
+            assert self.release.wait(5)
+
+    def fetch_events(self) -> list:
+        return []
+
+
+def test_async_scheduler_runs_jobs_in_background() -> None:
+    load, status = _Handler(), _Handler(blocking=False)
+    selector = exchange.Selector()
+    selector.set_channels({messages.Command: channels.Channel()})
+    selector.set_handlers({'_Load': [load], '_Status': [status]})
+    scheduler = ae.AsyncScheduler(selector)
+    receiver = ae.AsyncReceiver(scheduler, None)
+    scheduler.start()
+    try:
+        first = scheduler.submit(_Load('loadfile', 'rates.txt'))
+        receiver.receive(_Load('loadfile', 'broken.txt'))
+        receiver.receive(_Status('status'))
+        assert not scheduler.join(0.2)
+        states = {job.command: job.state for job in scheduler.jobs()}
+        assert states['loadfile rates.txt'] == ae.JobState.RUNNING
+        assert states['status'] == ae.JobState.DONE
+        assert status.threads == ['scheduler']
+
+        load.release.set()
+        assert scheduler.join(5)
+        jobs = {job.id: job for job in scheduler.jobs()}
+        assert jobs[first.id].state == ae.JobState.DONE
+        assert [job.error for job in jobs.values() if job.error] == [
+                'broken file'
+                ]
+    finally:
+        assert scheduler.stop(5)
+    assert not scheduler.running
@@ -0,0 +1,149 @@
+import re
+import types
+import logging
+import zipfile
+import datetime
+
+import pytest
+import openpyxl as oppxl
+
+from services import drivers
+from services import services
+from services import xlsx_reader
+from template.io_presets import ReadSettings
+
+
+_PRESET = types.MappingProxyType({'POL': [], 'POD': [], 'RATE': []})
+_ROWS = [
+        ('POL', 'POD', 'RATE', 'NOTE'),
+        ('Shanghai', 'Vladivostok', 2600, 'valid Dec'),
+        ('Ningbo', 'Moscow', 9500.5, None),
+        ('Xiamen', None, '3100', 'HEUNG-A'),
+        ]
+
+
+@pytest.fixture
+def workbook(tmp_path) -> str:
+    path = str(tmp_path / 'rates.xlsx')
+    book = oppxl.Workbook()
+    sheet = book.active
+    sheet.title = 'rates'
+    for row in _ROWS:
+        sheet.append(row)
+    book.save(path)
+    return path
+
+
+def _fetch_all(
+        path: str,
+        reader: services.ExcelFileReader,
+        compiler: drivers.BaseExcelCompiler
+        ) -> list:
+    driver = drivers.ExcelDriver(logging.getLogger(), compiler)
+    driver.headers_preset = _PRESET
+    read_set = ReadSettings('rates', path, False, '--m', '.xlsx')
+    header, *rows = reader.read(read_set)
+    fetched = [driver.fetch_headers(header)]
+    fetched.extend(driver.fetch_values(row) for row in rows)
+    return fetched
+
+
+def test_values_only_reader_fetches_same_values(workbook: str) -> None:
+    cells = _fetch_all(
+            workbook,
+            services.ExcelFileReader(),
+            drivers.ExcelCompiler()
+            )
+    values = _fetch_all(
+            workbook,
+            services.ExcelFileReader(values_only=True),
+            drivers.ExcelValuesCompiler()
+            )
+    if drivers.NEED_COMMENTS:
+        # comments column isn`t fetched from values.
+        cells = [row[:-1] for row in cells]
+    assert values == cells
+
+
+def _spoil_dimension(path: str) -> None:
+    """Set sheet dimension to A1, like some exporters do."""
+    with zipfile.ZipFile(path) as src:
+        items = [(info, src.read(info)) for info in src.infolist()]
+    with zipfile.ZipFile(path, 'w') as dest:
+        for info, data in items:
+            if info.filename.startswith('xl/worksheets/sheet'):
+                data = re.sub(rb'<dimension ref="[^"]+"', b'<dimension ref="A1"', data)
+            dest.writestr(info, data)
+
+
+@pytest.mark.parametrize('read_only', [False, True])
+@pytest.mark.parametrize('values_only', [False, True])
+def test_reader_ignores_dimensions_and_stops_on_blank_row(
+        tmp_path,
+        read_only: bool,
+        values_only: bool
+        ) -> None:
+    path = str(tmp_path / 'rates.xlsx')
+    book = oppxl.Workbook()
+    sheet = book.active
+    for row in _ROWS:
+        sheet.append(row)
+    sheet.append(())
+    sheet.append(('Tianjin', 'Vladivostok', 3100, 'after blank row'))
+    sheet['F1'] = None
+    book.save(path)
+    _spoil_dimension(path)
+
+    reader = services.ExcelFileReader(values_only=values_only)
+    read_set = ReadSettings('rates', path, read_only, '--m', '.xlsx')
+    rows = list(reader.read(read_set))
+    if not values_only:
+        rows = [tuple(cell.value for cell in row) for row in rows]
+    assert rows == _ROWS
+
+
+@pytest.fixture
+def rich_workbook(tmp_path) -> str:
+    path = str(tmp_path / 'rich.xlsx')
+    book = oppxl.Workbook()
+    book.active.title = 'other'
+    sheet = book.create_sheet('rates')
+    sheet.append(('POL', 'POD', 'RATE', 'VALID', 'DIRECT', 'TOTAL'))
+    sheet.append(('Shanghai', 'Vladivostok', 2600, datetime.datetime(2023, 12, 1), True, '=C2*2'))
+    sheet.append(('Ningbo', None, 9500.5, datetime.datetime(2024, 1, 15), False, '=C3*2'))
+    sheet.append(('Xiamen', 'Moscow', '3100', None, None, 'note'))
+    sheet['B2'].comment = oppxl.comments.Comment('via Busan', 'sales')
+    sheet['F4'].comment = oppxl.comments.Comment('check it', 'ops')
+    book.save(path)
+    return path
+
+
+def _cell_items(rows: list) -> list:
+    return [
+            tuple(
+                (cell.value, cell.comment and cell.comment.text,
+                 cell.comment and cell.comment.author)
+                for cell in row
+                )
+            for row in rows
+            ]
+
+
+@pytest.mark.parametrize('batch_size', [64, xlsx_reader.XML_BATCH_SIZE])
+@pytest.mark.parametrize('sheet_name', ['rates', 'other'])
+def test_xml_reader_conforms_to_openpyxl(
+        rich_workbook: str,
+        sheet_name: str,
+        batch_size: int,
+        monkeypatch
+        ) -> None:
+    monkeypatch.setattr(xlsx_reader, 'XML_BATCH_SIZE', batch_size)
+    read_set = ReadSettings(sheet_name, rich_workbook, False, '--m', '.xlsx')
+
+    expected = list(services.ExcelFileReader(values_only=True).read(read_set))
+    values = list(xlsx_reader.XlsxXmlReader().read(read_set))
+    assert values == expected
+
+    expected = _cell_items(services.ExcelFileReader().read(read_set))
+    cells = xlsx_reader.XlsxXmlReader(need_comments=True).read(read_set)
+    assert _cell_items(cells) == expected
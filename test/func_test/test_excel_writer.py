@@ -0,0 +1,86 @@
+import datetime
+
+import pytest
+import openpyxl as oppxl
+
+from services import services
+from template.io_presets import WriteSettings
+
+
+_ROWS = [
+        ['POL', 'POD', 'RATE', 'VALID'],
+        ['Shanghai', 'Vladivostok', 2600, datetime.datetime(2023, 5, 1)],
+        ['Ningbo & Co', None, 9500.5, 'till <Dec>'],
+        ]
+
+
+@pytest.fixture
+def workbook(tmp_path) -> str:
+    path = str(tmp_path / 'rates.xlsx')
+    book = oppxl.Workbook()
+    book.active.title = 'old'
+    book.active.append(['kept', datetime.datetime(2022, 1, 2)])
+    book['old']['C1'] = 1.5
+    book['old']['C1'].number_format = '0.000'
+    book.create_sheet('other').append(['other'])
+    book.save(path)
+    return path
+
+
+def _save(path: str, name: str, rows: list) -> None:
+    writer = services.ExcelFileWriter()
+    dest = writer.write(WriteSettings(name, path, False, '.xlsx'))
+    for row in rows:
+        dest.send(row)
+    dest.throw(StopIteration)
+    dest.close()
+    writer.close()
+
+
+def _values(path: str) -> dict:
+    book = oppxl.load_workbook(path)
+    return {
+            sheet.title: [
+                [(c.value, c.number_format) for c in row] for row in sheet
+                ]
+            for sheet in book
+            }
+
+
+def test_new_sheet_is_added_without_changing_others(workbook: str) -> None:
+    before = _values(workbook)
+    _save(workbook, 'new', _ROWS)
+    after = _values(workbook)
+
+    assert list(after) == ['old', 'other', 'new']
+    assert after['old'] == before['old']
+    assert after['other'] == before['other']
+    assert [[v for v, _ in row] for row in after['new']] == _ROWS
+    assert after['new'][1][3][1] == after['old'][0][1][1]
+
+
+def test_rows_are_appended_to_existing_sheet(workbook: str) -> None:
+    _save(workbook, 'other', _ROWS[1:2])
+    rows = _values(workbook)['other']
+    assert [[v for v, _ in row] for row in rows] == [
+            ['other', None, None, None],
+            _ROWS[1],
+            ]
+
+
+def test_new_file_has_one_sheet(tmp_path) -> None:
+    path = str(tmp_path / 'new.xlsx')
+    _save(path, 'new', _ROWS)
+    assert list(_values(path)) == ['new']
+
+
+def test_write_rows_matches_writing_by_line(tmp_path) -> None:
+    by_line = str(tmp_path / 'by_line.xlsx')
+    by_rows = str(tmp_path / 'by_rows.xlsx')
+    _save(by_line, 'new', _ROWS)
+    count = services.ExcelFileWriter().write_rows(
+            WriteSettings('new', by_rows, False, '.xlsx'),
+            iter(_ROWS)
+            )
+    assert count == len(_ROWS)
+    assert _values(by_rows) == _values(by_line)
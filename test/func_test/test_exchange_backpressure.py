@@ -0,0 +1,76 @@
+import dataclasses
+import threading
+
+import pytest
+
+from core import async_exchange as ae
+from core import channels
+from core import exchange
+from core import messages
+
+
+@dataclasses.dataclass
+class _Load(messages.Command):
+    name: str
+
+
+class _Handler:
+
+    blocking: bool = True
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def handle(self, cmd) -> None:
+        assert self.release.wait(5)
+
+    def fetch_events(self) -> list:
+        return []
+
+
+def test_put_waits_for_drain_to_low_watermark() -> None:
+    exch = exchange.Exchange(high_watermark=2, low_watermark=0, put_timeout=0)
+    exch.put_message('first')
+    exch.put_message('second')
+    with pytest.raises(exchange.ExchangeError):
+        exch.put_message('third')
+
+    exch.set_limits(high_watermark=2, low_watermark=0, put_timeout=5)
+    messages = exch.fetch_by_round()
+    put = threading.Thread(target=exch.put_message, args=('third',))
+    put.start()
+    # one fetch isn`t enough: queue is drained to low watermark.
+    assert next(messages) == 'first'
+    put.join(0.1)
+    assert put.is_alive()
+    next(messages)
+    assert next(messages) == 'second'
+    put.join(5)
+
+    stats = exch.stats()
+    assert stats.depth == 1 and not stats.throttled
+    assert stats.metrics.rejected == 1 and stats.metrics.waits == 1
+    assert stats.metrics.puts == 3 and stats.metrics.max_depth == 2
+
+
+def test_async_submit_waits_for_jobs_in_flight() -> None:
+    load = _Handler()
+    selector = exchange.Selector()
+    selector.set_channels({messages.Command: channels.Channel()})
+    selector.set_handlers({'_Load': [load]})
+    scheduler = ae.AsyncScheduler(selector)
+    scheduler.set_limits(max_size=1, put_timeout=0.1)
+    scheduler.start()
+    try:
+        scheduler.submit(_Load('loadfile'))
+        with pytest.raises(exchange.ExchangeError):
+            scheduler.submit(_Load('loadfile'))
+        load.release.set()
+        assert scheduler.join(5)
+        scheduler.submit(_Load('loadfile'))
+        assert scheduler.join(5)
+    finally:
+        scheduler.stop(5)
+    stats = scheduler.stats()
+    assert stats.depth == 0 and stats.high == 1
+    assert stats.metrics.puts == 2 and stats.metrics.rejected == 1
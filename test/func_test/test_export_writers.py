@@ -0,0 +1,106 @@
+import csv
+import datetime
+
+import pytest
+
+from services import columnar
+from services import services
+from template import models
+from template.io_presets import WriteSettings
+
+
+_HEADERS = ['POL', 'RATE', 'DTHC', 'VALID', 'BIG']
+_COLUMNS = [
+        ['Shanghai', None, 'Ningbo', 'Shanghai', 'Xiamen \ud800'],
+        [2600, 3100, -5, 0, 7],
+        [450.5, 250.0, 0.1, 1e30, -2.5],
+        [datetime.date(2023, 5, 1), True, None, 'Dec', 1],
+        [2 ** 70, 1, 2, 3, 4],
+        ]
+
+
+def _rows() -> list:
+    return [_HEADERS, *(list(row) for row in zip(*_COLUMNS))]
+
+
+@pytest.mark.parametrize('block_rows', [2, columnar.RTC_BLOCK_ROWS])
+def test_rtc_rows_and_columns_give_same_file(tmp_path, block_rows) -> None:
+    writer = columnar.RtcFileWriter(block_rows=block_rows)
+    by_rows = WriteSettings('rates', str(tmp_path / 'r.rtc'), False, '.rtc')
+    by_cols = WriteSettings('rates', str(tmp_path / 'c.rtc'), False, '.rtc')
+
+    assert writer.write_rows(by_rows, iter(_rows())) == len(_rows())
+    assert writer.write_columns(by_cols, _HEADERS, _COLUMNS) == len(_rows())
+
+    with open(by_rows.path, 'rb') as r, open(by_cols.path, 'rb') as c:
+        assert r.read() == c.read()
+    meta, columns = columnar.load_columns(by_cols.path)
+    assert meta == {'name': 'rates', 'headers': _HEADERS}
+    assert columns == _COLUMNS
+
+
+def test_csv_rows_and_columns_give_same_file(tmp_path) -> None:
+    writer = services.CsvFileWriter()
+    by_rows = WriteSettings('rates', str(tmp_path / 'r.csv'), False, '.csv')
+    by_cols = WriteSettings('rates', str(tmp_path / 'c.csv'), False, '.csv')
+
+    assert writer.write_rows(by_rows, iter(_rows()[:-1])) == len(_rows()) - 1
+    columns = [column[:-1] for column in _COLUMNS]
+    writer.write_columns(by_cols, _HEADERS, columns)
+
+    with open(by_rows.path, newline='') as r:
+        rows = list(csv.reader(r))
+    with open(by_cols.path, newline='') as c:
+        assert rows == list(csv.reader(c))
+    assert rows[1] == ['Shanghai', '2600', '450.5', '2023-05-01', str(2 ** 70)]
+
+
+def test_rtc_snapshot_restores_model(tmp_path) -> None:
+    model = models.SheetTemplate()
+    model.add_headers(['POL', 'POD', '20ft'])
+    model.add_values(['Shanghai', 'Vladivostok/Moscow', 2600])
+    model.add_values(['Ningbo', 'Moscow', 3100])
+    settings = WriteSettings('rates', str(tmp_path / 'r.rtc'), False, '.rtc')
+    columnar.RtcFileWriter().write_columns(
+            settings, model.headers, model.columns
+            )
+
+    reader = columnar.RtcFileReader()
+    restored = reader.read_model(settings, models.SheetTemplate())
+    assert list(restored.rows) == list(model.rows)
+    assert list(reader.read(settings)) == list(model.rows)
+    assert restored.rows_count == model.rows_count == 3
+
+    preview = reader.read_model(settings, models.SheetTemplate(), max_rows=1)
+    assert list(preview.rows) == list(model.rows)[:2]
+
+
+def test_rtc_never_unpickles(tmp_path) -> None:
+    moment = datetime.datetime(2023, 5, 1, 9)
+    values = [None, False, -2 ** 70, 1.5, moment, 'x']
+    values += [datetime.time(9, 30, 5, 12), datetime.timedelta(-3, 5, 7)]
+    values += [datetime.timedelta(hours=36, microseconds=1)]
+    meta = columnar.encode_meta('rates', ['MIXED'])
+    block = columnar.encode_block([values])
+    end = columnar.encode_block([])
+    path = tmp_path / 'mixed.rtc'
+    path.write_bytes(meta + block + end)
+    assert columnar.load_columns(str(path))[1] == [values]
+
+    with pytest.raises(columnar.RtcFormatError):
+        columnar.encode_column([object()])
+    unknown = block[:4] + bytes([4]) + block[5:]
+    for broken in (unknown, block[:-3]):
+        path.write_bytes(meta + broken + end)
+        with pytest.raises(columnar.RtcFormatError):
+            columnar.load_columns(str(path))
+
+
+@pytest.mark.parametrize('meta', [b'not json', b'[]', b'{"headers": [1]}'])
+def test_rtc_broken_meta_is_format_error(tmp_path, meta) -> None:
+    path = tmp_path / 'broken.rtc'
+    size = len(meta).to_bytes(4, 'little')
+    path.write_bytes(columnar.RTC_MAGIC + size + meta)
+    settings = WriteSettings('rates', str(path), False, '.rtc')
+    with pytest.raises(columnar.RtcFormatError):
+        columnar.RtcFileReader().read_model(settings, models.SheetTemplate())
@@ -0,0 +1,39 @@
+import os
+import queue
+
+from template import watcher
+
+
+def test_poll_returns_new_and_changed_files(tmp_path) -> None:
+    first = tmp_path / 'a.txt'
+    first.write_text('POL-POD $RATE\n')
+    (tmp_path / 'skip.xlsx').write_text('')
+    files = watcher.FileWatcher(str(tmp_path / '*.txt'), print)
+
+    assert files.poll() == [str(first)]
+    assert files.poll() == []
+
+    second = tmp_path / 'b.txt'
+    second.write_text('POL-POD $RATE\n')
+    with first.open('a') as file:
+        file.write('Shanghai-Vladivostok $2600\n')
+    assert files.poll() == [str(first), str(second)]
+
+    os.remove(first)
+    assert files.poll() == []
+
+
+def test_watchers_load_in_background(tmp_path) -> None:
+    (tmp_path / 'a.txt').write_text('POL-POD $RATE\n')
+    pattern = str(tmp_path / '*.txt')
+    changed = queue.Queue()
+    watchers = watcher.Watchers()
+    watchers.start(watcher.FileWatcher(pattern, changed.put, interval=0.01))
+
+    assert changed.get(timeout=5) == [str(tmp_path / 'a.txt')]
+    (tmp_path / 'b.txt').write_text('POL-POD $RATE\n')
+    assert changed.get(timeout=5) == [str(tmp_path / 'b.txt')]
+    assert watchers.patterns == [pattern]
+
+    assert watchers.stop() == [pattern]
+    assert watchers.patterns == [] and watchers.stop(pattern) == []
@@ -0,0 +1,147 @@
+import logging
+import threading
+import concurrent.futures as futures
+
+import pytest
+
+from core import exchange
+from core import terminal_commands as tc
+from services import drivers
+from services import services
+from template.io_presets import ReadSettings
+
+from .conftest import TXT_FLAG as _FLAG
+from .conftest import TXT_TEXT as _TEXT
+
+
+@pytest.fixture(scope='module')
+def adapter(txt_adapter) -> services.BaseFileIOAdapter:
+    return txt_adapter()
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_load_many_reports_each_file(
+        adapter: services.BaseFileIOAdapter,
+        tmp_path,
+        workers: int
+        ) -> None:
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f'rates_{idx}.txt'
+        path.write_text(_TEXT)
+        paths.append(str(path))
+    paths.append(str(tmp_path / 'missing.txt'))
+    read_sets = [
+            ReadSettings(name=p, path=p, mode=False, flag=_FLAG, suffix='.txt')
+            for p in paths
+            ]
+
+    results = {
+            r.settings.path: r
+            for r in adapter.load_many(read_sets, workers=workers)
+            }
+    assert sorted(results) == sorted(paths), f'{results}'
+    for path in paths[:-1]:
+        model = results[path].model
+        assert model is not None, results[path].failure
+        assert model.name == path and model.rows_count == 2
+    missing = results[paths[-1]]
+    assert missing.model is None and missing.failure, f'{missing}'
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_load_chunked_keeps_file_order(
+        adapter: services.BaseFileIOAdapter,
+        tmp_path,
+        newline: str
+        ) -> None:
+    lines = _TEXT.splitlines()
+    rows = [f'Port{idx}-Dest{idx} ${idx}' for idx in range(200)]
+    path = tmp_path / 'big.txt'
+    path.write_bytes(newline.join(lines[:1] + rows).encode())
+    read_set = ReadSettings(
+            name='big',
+            path=str(path),
+            mode=False,
+            flag=_FLAG,
+            suffix='.txt'
+            )
+
+    expected = list(adapter.load(read_set).rows)
+    model = adapter.load_chunked(read_set, workers=2, chunk_size=256)
+    assert list(model.rows) == expected
+    assert model.rows_count == len(rows)
+
+
+def test_load_appended_parses_only_new_lines(
+        adapter: services.BaseFileIOAdapter,
+        tmp_path,
+        monkeypatch
+        ) -> None:
+    path = tmp_path / 'daily.txt'
+    path.write_text(_TEXT)
+    read_set = ReadSettings('daily', str(path), False, _FLAG, '.txt')
+    model = adapter.load(read_set)
+    assert model.source.offset == len(_TEXT)
+
+    with path.open('a') as file:
+        file.write('Ningbo-Moscow $3100\n')
+    with monkeypatch.context() as patch:
+        patch.setattr(adapter, '_parse', pytest.fail)
+        appended = adapter.load_appended(read_set, model)
+    assert appended is model and model.rows_count == 3
+    assert list(model.rows) == list(adapter.load(read_set).rows)
+
+    # half-written line isn`t parsed until its newline is written.
+    with path.open('a') as file:
+        file.write('Ningbo-Moscow $31')
+    assert adapter.load_appended(read_set, model) is model
+    assert model.rows_count == 3
+    with path.open('a') as file:
+        file.write('00\n')
+    assert adapter.load_appended(read_set, model) is model
+    assert model.rows_count == 4
+    assert list(model.rows)[-1] == list(adapter.load(read_set).rows)[-1]
+
+    # prefix was changed: model have to be loaded again.
+    path.write_text(_TEXT.replace('2600', '2700') + 'Ningbo-Moscow $3100\n')
+    assert adapter.load_appended(read_set, model) is None
+
+
+def test_pool_workers_arent_forked() -> None:
+    context = services._pool_context()
+    assert context is None or context.get_start_method() != 'fork'
+
+
+# readers are copied per thread, so barrier isn`t kept by reader.
+_BOTH_LOADING = threading.Barrier(2, timeout=5)
+
+
+class _WaitingReader(services.TxtFileReader):
+    """Reader, that yields lines when two loads are started."""
+
+    def read(self, settings):
+        _BOTH_LOADING.wait()
+        yield from super().read(settings)
+
+
+def test_loads_of_models_overlap(txt_adapter, tmp_path) -> None:
+    tc.get_readers_repo().add('.wait', (
+        drivers.TxtDriver(logging.getLogger(), drivers.TxtCompiler()),
+        _WaitingReader()
+        ))
+    adapter = txt_adapter()
+    backend = exchange.OrderedExecutor(futures.ThreadPoolExecutor(2))
+    loads = []
+    try:
+        for name in ('rates', 'tariffs'):
+            path = tmp_path / f'{name}.wait'
+            path.write_text(_TEXT)
+            read_set = ReadSettings(name, str(path), False, _FLAG, '.wait')
+            loads.append(backend.submit(name, adapter.load, read_set))
+        # serialized loads break barrier by timeout.
+        models = [load.result(10) for load in loads]
+    finally:
+        backend.shutdown()
+    assert [m.name for m in models] == ['rates', 'tariffs']
+    assert all(m.rows_count == 2 for m in models)
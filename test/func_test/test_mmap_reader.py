@@ -0,0 +1,45 @@
+import re
+
+import pytest
+
+from services import services
+from template.io_presets import ReadSettings
+
+
+_TEXT = (
+        'POL POD RATE\n'
+        'Shanghai-Vladivostok $2600\n'
+        '\n'
+        '# comments without rates\n'
+        'Tianjin-Vladivostok $3100\n'
+        'Ningbo-Moscow $9500\n'
+        '----\n'
+        'Xiamen-Moscow $9900'
+        )
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_mmap_reader_reads_prefiltered_lines(tmp_path, newline: str) -> None:
+    path = tmp_path / 'rates.txt'
+    path.write_bytes(_TEXT.replace('\n', newline).encode())
+    read_set = ReadSettings(
+            name='rates',
+            path=str(path),
+            mode=False,
+            flag='--m',
+            suffix='.txt'
+            )
+
+    header, *lines = services.TxtFileReader().read(read_set)
+    expected = [header] + [
+            line for line in lines
+            if re.search(services.MMAP_PREFILTER.decode(), line)
+            ]
+    assert list(services.MmapTxtFileReader().read(read_set)) == expected
+
+
+def test_mmap_reader_reads_empty_file(tmp_path) -> None:
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    read_set = ReadSettings('empty', str(path), False, '--m', '.txt')
+    assert list(services.MmapTxtFileReader().read(read_set)) == []
@@ -0,0 +1,97 @@
+import threading
+import dataclasses
+import concurrent.futures as futures
+
+from core import exchange
+
+
+def test_tasks_of_one_key_run_in_order() -> None:
+    backend = exchange.OrderedExecutor(futures.ThreadPoolExecutor(4))
+    release = threading.Event()
+    started, done = [], []
+
+    def task(name: str) -> str:
+        started.append(name)
+        if name == 'load rates':
+            assert release.wait(5)
+        done.append(name)
+        return name
+
+    try:
+        load = backend.submit('rates', task, 'load rates')
+        save = backend.submit('rates', task, 'save rates')
+        other = backend.submit('tariffs', task, 'load tariffs')
+        plain = backend.submit(None, task, 'status')
+        # other model isn`t blocked by running load.
+        assert other.result(5) == 'load tariffs'
+        assert plain.result(5) == 'status'
+        assert 'save rates' not in started
+
+        release.set()
+        assert save.result(5) == 'save rates'
+        assert load.result() == 'load rates'
+        assert done.index('load rates') < done.index('save rates')
+    finally:
+        backend.shutdown()
+
+
+def test_failed_task_doesnt_stop_key() -> None:
+    backend = exchange.OrderedExecutor(futures.ThreadPoolExecutor(2))
+
+    def fail() -> None:
+        raise ValueError('broken file')
+
+    try:
+        failed = backend.submit('rates', fail)
+        after = backend.submit('rates', len, 'rates')
+        assert isinstance(failed.exception(5), ValueError)
+        assert after.result(5) == 5
+        assert not backend._pending
+    finally:
+        backend.shutdown()
+
+
+def test_prefix_key_waits_for_models_of_prefix() -> None:
+    backend = exchange.OrderedExecutor(futures.ThreadPoolExecutor(4))
+    release = threading.Event()
+    done = []
+
+    def task(name: str) -> str:
+        if name == 'save daily_a':
+            assert release.wait(5)
+        done.append(name)
+        return name
+
+    try:
+        save = backend.submit('daily_a', task, 'save daily_a')
+        many = backend.submit(
+                exchange.OrderKey('daily_', prefix=True),
+                task,
+                'loadmany daily_'
+                )
+        after = backend.submit('daily_b', task, 'save daily_b')
+        other = backend.submit('rates', task, 'load rates')
+        assert other.result(5) == 'load rates'
+        assert not many.done() and not after.done()
+
+        release.set()
+        assert after.result(5) == 'save daily_b'
+        assert done.index('save daily_a') < done.index('loadmany daily_')
+        assert done.index('loadmany daily_') < done.index('save daily_b')
+        assert many.result() == 'loadmany daily_'
+    finally:
+        backend.shutdown()
+
+
+@dataclasses.dataclass
+class _LoadMany:
+    fname: str = ''
+    prefix_key = True
+
+
+def test_empty_prefix_key_overlaps_all_models() -> None:
+    key = exchange.message_key(_LoadMany())
+    assert key == exchange.OrderKey('', True)
+    assert key.overlaps(exchange.OrderKey('rates'))
+    assert exchange.OrderKey('tariffs', True).overlaps(key)
+    assert exchange.message_key(_LoadMany('daily_')).name == 'daily_'
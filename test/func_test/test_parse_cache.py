@@ -0,0 +1,103 @@
+import os
+import re
+import logging
+
+import pytest
+import openpyxl as oppxl
+
+from core import terminal_commands as tc
+from services import drivers
+from services import services
+from services import parse_cache as pc
+from template.io_presets import ReadSettings
+
+from .conftest import TXT_FLAG as _FLAG
+from .conftest import TXT_TEXT as _TEXT
+
+
+def _read_set(path) -> ReadSettings:
+    return ReadSettings('rates', str(path), False, _FLAG, '.txt')
+
+
+def test_unchanged_file_isnt_parsed_again(
+        txt_adapter,
+        tmp_path,
+        monkeypatch
+        ) -> None:
+    cache = pc.ParseCache(str(tmp_path / 'cache'))
+    adapter = txt_adapter(parse_cache=cache)
+    path = tmp_path / 'rates.txt'
+    path.write_text(_TEXT)
+
+    parsed = adapter.load(_read_set(path))
+    assert parsed.rows_count == 2 and cache.misses == 1
+
+    with monkeypatch.context() as patch:
+        patch.setattr(adapter, '_parse', pytest.fail)
+        cached = adapter.load(_read_set(path))
+    assert cache.hits == 1
+    assert list(cached.rows) == list(parsed.rows)
+
+    path.write_text(_TEXT + 'Ningbo-Moscow $3100\n')
+    assert adapter.load(_read_set(path)).rows_count == 3
+    assert cache.misses == 2
+
+
+def test_prune_and_eviction(txt_adapter, tmp_path) -> None:
+    cache = pc.ParseCache(str(tmp_path / 'cache'), max_bytes=1)
+    adapter = txt_adapter(parse_cache=cache)
+    paths = [tmp_path / f'rates_{idx}.txt' for idx in range(2)]
+    for path in paths:
+        path.write_text(_TEXT)
+        adapter.load(_read_set(path))
+    # only last snapshot is kept over the limit.
+    assert len(os.listdir(cache._directory)) == 1
+
+    preset = adapter._loader.preset
+    assert cache.prune([preset]) == 0
+    other = {'POL': [re.compile(r'^(?P<pol>\w+)$')]}
+    assert pc.preset_digest(other) != pc.preset_digest(preset)
+    assert cache.prune([other]) == 1
+    assert not os.listdir(cache._directory)
+
+
+def test_shared_directory_isnt_used(txt_adapter, tmp_path) -> None:
+    directory = tmp_path / 'cache'
+    cache = pc.ParseCache(str(directory))
+    adapter = txt_adapter(parse_cache=cache)
+    path = tmp_path / 'rates.txt'
+    path.write_text(_TEXT)
+    adapter.load(_read_set(path))
+    assert directory.stat().st_mode & 0o777 == 0o700
+    assert len(os.listdir(directory)) == 1
+
+    directory.chmod(0o777)
+    assert adapter.load(_read_set(path)).rows_count == 2
+    assert cache.hits == 0 and cache.misses == 2
+
+
+def test_sheets_of_workbook_are_cached_apart(txt_adapter, tmp_path) -> None:
+    path = str(tmp_path / 'rates.xlsx')
+    book = oppxl.Workbook()
+    book.active.title = 'Sheet1'
+    book.create_sheet('Sheet2')
+    for sheet, rates in zip(book, [(2600, ), (9500, 3100)]):
+        sheet.append(('POL', 'POD', 'RATE'))
+        for rate in rates:
+            sheet.append(('Shanghai', 'Vladivostok', rate))
+    book.save(path)
+    tc.get_readers_repo().add('.xlsx', (
+        drivers.ExcelDriver(logging.getLogger(), drivers.ExcelCompiler()),
+        services.ExcelFileReader()
+        ))
+    cache = pc.ParseCache(str(tmp_path / 'cache'))
+    adapter = txt_adapter(parse_cache=cache)
+
+    counts = [
+            adapter.load(
+                ReadSettings(name, path, False, _FLAG, '.xlsx')
+                ).rows_count
+            for name in ('Sheet1', 'Sheet2')
+            ]
+    assert counts == [1, 2]
+    assert cache.hits == 0 and cache.misses == 2
@@ -0,0 +1,77 @@
+import dataclasses
+
+from core import async_exchange as ae
+from core import channels
+from core import exchange
+from core import messages
+from core import script_runner
+
+
+@dataclasses.dataclass
+class _Load(messages.Command):
+    name: str
+    path: str
+
+
+class _Handler:
+
+    blocking: bool = True
+
+    def handle(self, cmd: _Load) -> None:
+        if cmd.path == 'broken.txt':
+            raise Exception('broken file')
+
+    def fetch_events(self) -> list:
+        return []
+
+
+def _scheduler() -> ae.AsyncScheduler:
+    selector = exchange.Selector()
+    selector.set_channels({messages.Command: channels.Channel()})
+    selector.set_handlers({'_Load': [_Handler()]})
+    return ae.AsyncScheduler(selector)
+
+
+def _run(lines: list, capsys) -> tuple:
+    scheduler = _scheduler()
+
+    def run_command(raw_cmd: str) -> bool:
+        name, _, path = raw_cmd.partition(' ')
+        if name != 'loadfile':
+            return False
+        scheduler.submit(_Load(name, path))
+        return True
+
+    try:
+        code = script_runner.run_script(lines, run_command, scheduler)
+    finally:
+        assert scheduler.stop(5)
+    return code, capsys.readouterr().out.splitlines()
+
+
+def test_script_summary_and_exit_code(capsys) -> None:
+    code, out = _run([
+        '# nightly rates\n',
+        '\n',
+        'loadfile rates.txt\n',
+        '   \n',
+        'bad command\n',
+        'loadfile broken.txt\n',
+        ], capsys)
+
+    assert code == 1
+    rows = [row.split(maxsplit=3) for row in out[1:-1]]
+    assert [row[:2] for row in rows] == [
+            ['3', 'done'],
+            ['5', 'failed'],
+            ['6', 'failed'],
+            ]
+    assert rows[1][3] == 'bad command'
+    assert rows[2][3] == 'loadfile broken.txt: broken file'
+    assert out[-1].startswith('Commands: 3, failed: 2, total: ')
+
+
+def test_script_without_failures_exits_with_zero(capsys) -> None:
+    code, out = _run(['loadfile rates.txt', '# loadfile broken.txt'], capsys)
+    assert code == 0
+    assert out[-1].startswith('Commands: 1, failed: 0, ')
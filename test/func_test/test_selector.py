@@ -0,0 +1,40 @@
+import dataclasses
+
+import pytest
+
+from core import channels
+from core import exchange
+from core import messages
+
+
+@dataclasses.dataclass
+class _Load(messages.Command):
+    name: str
+
+
+@dataclasses.dataclass
+class _LoadPart(_Load):
+    rows: int = 0
+
+
+@dataclasses.dataclass
+class _Loaded(messages.Event):
+    name: str
+
+
+def test_select_is_cached_by_type_and_inherited() -> None:
+    commands, events = channels.Channel(), channels.Channel()
+    load, loaded = [object()], [object()]
+    selector = exchange.Selector()
+    selector.set_channels({messages.Command: commands, messages.Event: events})
+    selector.set_handlers({'_Load': load, '_Loaded': loaded})
+
+    assert selector.select(_Load('loadfile')) == (commands, load)
+    assert selector.select(_Loaded('loaded')) == (events, loaded)
+    # subclass without own handlers is handled like parent.
+    assert selector.select(_LoadPart('loadfile')) == (commands, load)
+    assert set(selector._dispatch) == {_Load, _LoadPart, _Loaded}
+
+    with pytest.raises(exchange.SelectorError):
+        selector.select(messages.Command())
+    assert messages.Command not in selector._dispatch
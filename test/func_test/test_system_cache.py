@@ -0,0 +1,179 @@
+import pytest
+
+from core import cache
+from services import columnar
+from services import services
+from template import models
+
+
+@pytest.fixture
+def lfu_cache() -> cache.SystemCache:
+    return cache.SystemCache(max_size=3, policy=cache.CachePolicy.LFU)
+
+
+@pytest.fixture
+def lru_cache() -> cache.SystemCache:
+    return cache.SystemCache(max_size=3, policy=cache.CachePolicy.LRU)
+
+
+def test_cache_limit_can_be_above_default() -> None:
+    big_cache = cache.SystemCache(max_size=1000)
+    for i in range(1000):
+        big_cache.add(f'key_{i}', i)
+    assert big_cache.stats.size == 1000, f'size: {big_cache.stats.size}'
+    assert big_cache.stats.evictions == 0, 'items evicted'
+
+
+def test_lfu_evicts_least_frequently_used(
+        lfu_cache: cache.SystemCache
+        ) -> None:
+    for key in ('a', 'b', 'c'):
+        lfu_cache.add(key, key)
+    lfu_cache.get('a')
+    lfu_cache.get('a')
+    lfu_cache.get('c')
+    lfu_cache.add('d', 'd')
+    assert lfu_cache.get('b') is None, 'least used item not evicted'
+    assert lfu_cache.keys() == ['a', 'c', 'd'], f'{lfu_cache.keys()}'
+
+
+def test_lru_evicts_least_recently_used(
+        lru_cache: cache.SystemCache
+        ) -> None:
+    for key in ('a', 'b', 'c'):
+        lru_cache.add(key, key)
+    lru_cache.get('a')
+    lru_cache.add('d', 'd')
+    assert 'b' not in lru_cache, 'least recent item not evicted'
+    assert 'a' in lru_cache, 'recent item evicted'
+
+
+def test_size_aware_evicts_biggest() -> None:
+    sized = cache.SystemCache(
+            max_size=2,
+            policy=cache.CachePolicy.SIZE,
+            sizeof=len
+            )
+    sized.add('small', 'x')
+    sized.add('big', 'x' * 1024)
+    sized.add('new', 'xx')
+    assert 'big' not in sized, 'biggest item not evicted'
+    assert 'small' in sized and 'new' in sized, f'{sized.keys()}'
+
+
+def test_cache_counts_hits_misses_evictions(
+        lfu_cache: cache.SystemCache
+        ) -> None:
+    for key in ('a', 'b', 'c', 'd'):
+        lfu_cache.add(key, key)
+    lfu_cache.get('d')
+    lfu_cache.get('unknown')
+    stats = lfu_cache.stats
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1), stats
+
+
+def test_update_unknown_key_raised(lfu_cache: cache.SystemCache) -> None:
+    with pytest.raises(cache.CacheError):
+        lfu_cache.update('unknown', 1)
+
+
+def test_configure_policy_keeps_items(lfu_cache: cache.SystemCache) -> None:
+    for key in ('a', 'b', 'c'):
+        lfu_cache.add(key, key)
+    lfu_cache.configure(max_size=2, policy=cache.CachePolicy.LRU)
+    assert lfu_cache.stats.size == 2, f'{lfu_cache.keys()}'
+    assert lfu_cache.stats.policy == 'lru', lfu_cache.stats
+
+
+def test_memory_budget_evicts_coldest() -> None:
+    budget = cache.SystemCache(max_bytes=100, sizeof=len)
+    budget.add('a', 'x' * 40)
+    budget.add('b', 'x' * 40)
+    budget.get('a')
+    budget.add('c', 'x' * 40)
+    assert budget.keys() == ['a', 'c'], f'{budget.keys()}'
+    assert budget.stats.used_bytes == 80, budget.stats
+    reason = budget.missing_reason('b')
+    assert cache.EvictionReason.MEMORY.value in reason, reason
+
+
+@pytest.mark.parametrize('policy', list(cache.CachePolicy))
+def test_update_evicts_others_when_updated_is_victim(policy) -> None:
+    budget = cache.SystemCache(max_bytes=100, sizeof=len, policy=policy)
+    for key in ('a', 'b', 'c'):
+        budget.add(key, 'x' * 30)
+    for key in ('b', 'c', 'b', 'c'):
+        budget.get(key)
+    budget.update('a', 'x' * 60)
+    assert 'a' in budget.keys() and len(budget.keys()) == 2, budget.keys()
+    assert budget.stats.used_bytes == 90, budget.stats
+
+    budget.update('a', 'x' * 200)
+    assert budget.keys() == ['a'], budget.keys()
+    budget.clear()
+    assert budget.stats.evictions == 0, budget.stats
+    assert budget.missing_reason('b') == 'Model <b> wasn`t loaded.'
+
+
+def test_model_footprint_used_as_size() -> None:
+    class Model:
+        memory_footprint = 1000
+
+    budget = cache.SystemCache(max_bytes=1500)
+    budget.add('first', Model())
+    budget.add('second', Model())
+    assert budget.keys() == ['second'], f'{budget.keys()}'
+    assert budget.stats.used_bytes == 1000, budget.stats
+
+
+def test_evicted_item_spilled_and_restored(tmp_path) -> None:
+    store = cache.SpillStore(directory=str(tmp_path))
+    spilled = cache.SystemCache(max_size=1, spill=store)
+    spilled.add('a', {'rows': [1, 2, 3]})
+    spilled.add('b', {'rows': [4]})
+    assert 'a' in spilled and len(store) == 1, 'item a not spilled'
+    assert spilled.get('a') == {'rows': [1, 2, 3]}, 'restore failed'
+    assert spilled.keys() == ['a'], f'{spilled.keys()}'
+    assert store.entries()[0][0] == 'b', 'item b not spilled'
+    assert spilled.stats.restores == 1, spilled.stats
+
+
+def test_spill_limit_drops_oldest(tmp_path) -> None:
+    store = cache.SpillStore(directory=str(tmp_path), max_bytes=1)
+    spilled = cache.SystemCache(max_size=1, spill=store)
+    for key in ('a', 'b', 'c'):
+        spilled.add(key, key)
+    assert [k for k, _ in store.entries()] == ['b'], store.entries()
+    reason = spilled.missing_reason('a')
+    assert cache.EvictionReason.SPILL.value in reason, reason
+    assert spilled.get('a') is None, 'dropped item restored'
+
+
+def test_model_is_spilled_without_pickle(tmp_path) -> None:
+    codec = columnar.RtcModelCodec(models.SheetTemplate)
+    directory = tmp_path / 'spill'
+    store = cache.SpillStore(
+            directory=str(directory),
+            dumps=codec.dumps,
+            loads=codec.loads
+            )
+    spilled = cache.SystemCache(max_size=1, spill=store)
+    model = models.SheetTemplate()
+    model.name = 'rates'
+    model.add_headers(['POL', 'POD', '20ft'])
+    model.add_values(['Shanghai', 'Moscow', 2600])
+    model.source = services.SourceState('/rates.txt', '--m', 42, 'ab')
+    spilled.add('rates', model)
+    spilled.add('other', models.SheetTemplate())
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+    restored = spilled.get('rates')
+    assert restored is not model and restored.name == 'rates'
+    assert list(restored.rows) == list(model.rows)
+    assert restored.source == model.source
+
+    # files of shared directory aren`t read back.
+    directory.chmod(0o777)
+    assert 'other' in store
+    assert spilled.get('other') is None
+    assert 'isn`t private' in spilled.missing_reason('other')
@@ -86,3 +86,28 @@ def test_model_return_rows(model: models.SheetTemplate) -> None:
             ['start', 'end', 1000, 3000, 0],
             ['start', 'new end', 1000, 3000, 0]
             ], f'Failed, res = {result}'
+
+
+def test_model_keeps_values_by_columns(model: models.SheetTemplate) -> None:
+    columns = model._values.columns
+    assert len(columns) == 5, f'Columns count {len(columns)} != 5'
+    assert columns[1] == ['end', 'new end'], f'Failed, col = {columns[1]}'
+
+
+def test_model_interns_repeated_strings() -> None:
+    model = models.SheetTemplate(intern_strings=True)
+    model.add_headers(['pol', 'pod'])
+    for pod in ('Moscow', 'Mos' + 'cow'.lower()):
+        model.add_values([''.join(['Xia', 'men']), pod])
+    pols = model._values.columns[0]
+    assert pols[0] is pols[1], 'repeated strings are not interned'
+
+
+def test_model_preview_struct_from_columns(
+        model: models.SheetTemplate
+        ) -> None:
+    struct = model.get_sheet_struct
+    assert struct.values == (
+            ('start', 'end', '1000', '3000', '0'),
+            ('start', 'new end', '1000', '3000', '0'),
+            ), f'Failed, values = {struct.values}'
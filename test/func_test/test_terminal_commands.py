@@ -37,3 +37,20 @@ def test_cmd_check_raised_error(valid_cmd: str) -> None:
     val_cmd = cf.PreProcessor.make_cmd_template(valid_cmd)
     cmd = cf.PostProcessor.make_command_from(val_cmd)
     cf.check_command_subscribed(cmd, {})
+
+
+def test_split_pipeline_drops_empty_parts() -> None:
+    raw_cmd = 'loadfile /rates/vvo.txt --m t1 | savefile /rates/vvo.xlsx |'
+    cmds = cf.split_pipeline(raw_cmd)
+    assert cmds == [
+            'loadfile /rates/vvo.txt --m t1',
+            'savefile /rates/vvo.xlsx'
+            ], f'{cmds}'
+
+
+def test_repeated_command_is_parsed_once(valid_cmd: str) -> None:
+    raw_cmd = f'{valid_cmd} | savefile /home/rates.csv testfile'
+    templates = cf.make_templates(raw_cmd)
+    assert [t.cmd for t in templates] == ['loadfile', 'savefile']
+    assert cf.make_templates(raw_cmd) is templates
+    assert cf.make_templates('ab') == (None, )
@@ -0,0 +1,35 @@
+from core import timings
+
+
+class _Handler:
+
+    blocking: bool = True
+
+    def handle(self, cmd) -> None:
+        fetch = timings.wrap('driver.fetch_values', str.split)
+        for line in ('Xiamen-Moscow $9500', 'Ningbo-Moscow $3100'):
+            fetch(line)
+        self.cached(cmd)
+
+    @timings.timed('cache.add')
+    def cached(self, cmd) -> None:
+        pass
+
+
+def test_stages_are_collected_only_when_on(capsys) -> None:
+    assert timings.wrap('reader', len) is len
+    timings.handle(_Handler(), 'loadfile')
+    assert capsys.readouterr().out == ''
+
+    timings.enable()
+    try:
+        with timings.collect() as times:
+            timings.handle(_Handler(), 'loadfile')
+            assert times.get('driver.fetch_values')[0] == 2
+            assert times.get('cache.add')[0] == 1
+        assert timings.current() is None
+    finally:
+        timings.enable(False)
+    out = capsys.readouterr().out
+    assert out.startswith('timings: str:')
+    assert 'driver.fetch_values' in out and 'cache.add' in out
@@ -0,0 +1,68 @@
+import types
+import logging
+
+import pytest
+
+from services import drivers
+from core.settings import settings
+
+
+_HEADERS_KEY = 'TEST_HEADERS'
+_CONFIG = {
+        _HEADERS_KEY: 'POL, POD, RATE, CARRIER, DTHC',
+        'RE_POL': r'^(?P<pol>[A-Za-z ]+)-.+$',
+        'RE_POD': r'^[A-Za-z ]+-(?P<pod>[A-Za-z ]+)\s.+$',
+        'RE_RATE': r'^.+\$(?P<rate>[\d/]+)\s.+$',
+        'RE_CARRIER': r'^.+by\s(?P<carrier>[\w-]+)\s.+$',
+        'RE_CARRIER_ALT': r'(?i)^.+VIA\s(?P<carrier>\w+)$',
+        'RE_DTHC': r'^.+(\$)(?P<dthc>[\d/]+)\1?.*$',
+        }
+_LINES = [
+        'Shanghai-Vladivostok $2600/4800/4800 by HEUNG-A Excl DTHC $450/550',
+        'Tianjin-Vladivostok $3100/5200/5200 by huaxin Excluded DTHC$250/300',
+        'Xiamen-Moscow $9500 via rail',
+        '\n',
+        'no rates here',
+        ]
+
+
+@pytest.fixture(scope='module')
+def preset() -> types.MappingProxyType:
+    headers = settings._fetch_env_value(_HEADERS_KEY, _CONFIG)
+    keys = [k for k in _CONFIG if k.startswith('RE')]
+    builder = settings.pattern()
+    builder.build_from(_HEADERS_KEY, keys, headers, _CONFIG)
+    return builder.get(_HEADERS_KEY)
+
+
+@pytest.fixture
+def driver(preset: types.MappingProxyType) -> drivers.TxtDriver:
+    driver = drivers.TxtDriver(
+            logging.getLogger(),
+            drivers.TxtCompiler()
+            )
+    driver.headers_preset = preset
+    return driver
+
+
+def test_line_plan_is_combined(preset: types.MappingProxyType) -> None:
+    plan = drivers.TxtLinePlan.build(preset)
+    assert plan.combined, 'no one header was combined'
+
+
+def test_line_plan_matches_per_header_loop(
+        driver: drivers.TxtDriver
+        ) -> None:
+    for line in _LINES:
+        expected = driver._fetch_values_by_headers(line)
+        fetched = driver.fetch_values(line)
+        assert fetched == expected, f'line: {line!r}, {fetched} != {expected}'
+
+
+def test_line_plan_built_once_per_preset(
+        driver: drivers.TxtDriver,
+        preset: types.MappingProxyType
+        ) -> None:
+    plan = driver._plan
+    driver.headers_preset = preset
+    assert driver._plan is plan, 'plan was rebuilt for the same preset'